@@ -0,0 +1,39 @@
+from benchmarks.common import (
+    build_encoded_orders,
+    print_results,
+    run,
+)
+from uniswapx_sdk.decay import (
+    decay,
+    DutchDecayEvaluator,
+)
+from uniswapx_sdk.decoder import ExclusiveDutchOrderDecoder
+
+
+order_count = 10_000
+timestamp = 1704283900
+
+
+def main() -> None:
+    decoder = ExclusiveDutchOrderDecoder()
+    orders = [decoder.decode(encoded_order)[0] for encoded_order in build_encoded_orders(order_count)]
+    evaluator = DutchDecayEvaluator(orders)
+
+    def scalar_decay(i: int) -> None:
+        order = orders[i]
+        decay(order[5][1], order[5][2], order[1], order[2], timestamp)
+        for output in order[6]:
+            decay(output[1], output[2], order[1], order[2], timestamp)
+
+    print("------------------------------------------")
+    print(f"| Evaluating {order_count} orders at a timestamp (results per order)")
+    print("------------------------------------------")
+    print_results([
+        run("decay() Python loop", scalar_decay, order_count),
+        run("DutchDecayEvaluator.evaluate() + float amounts", lambda i: evaluator.evaluate(timestamp).output_amounts_as_float(), 20, order_count, warmup=1, allocation_samples=5),  # noqa
+        run("DutchDecayEvaluator.evaluate() + exact amounts", lambda i: evaluator.evaluate(timestamp).output_amounts, 20, order_count, warmup=1, allocation_samples=5),  # noqa
+    ])
+
+
+if __name__ == "__main__":
+    main()
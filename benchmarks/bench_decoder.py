@@ -0,0 +1,52 @@
+from eth_abi import decode
+from eth_utils import to_bytes
+
+from benchmarks.common import (
+    build_encoded_orders,
+    print_results,
+    run,
+)
+from uniswapx_sdk.constants import exclusive_dutch_order_abi
+from uniswapx_sdk.decoder import (
+    DecodedExclusiveDutchOrder,
+    ExclusiveDutchOrderDecoder,
+)
+
+
+order_count = 5_000
+
+
+def filter_order(order: DecodedExclusiveDutchOrder) -> DecodedExclusiveDutchOrder:
+    _ = order.info.deadline, order.input_token
+    return order
+
+
+def main() -> None:
+    encoded_orders = build_encoded_orders(order_count)
+    hex_orders = [encoded_order.hex() for encoded_order in encoded_orders]
+    decoder = ExclusiveDutchOrderDecoder()
+
+    print("------------------------------------------")
+    print(f"| Decoding {order_count} orders (results per order)")
+    print("------------------------------------------")
+    print_results([
+        run("eth_abi.decode() (legacy single call)", lambda i: decode(exclusive_dutch_order_abi, to_bytes(hexstr=hex_orders[i])), order_count),  # noqa
+        run("Decoder.decode() from hex", lambda i: decoder.decode(hex_orders[i]), order_count),
+        run("Decoder.decode() from bytes", lambda i: decoder.decode(encoded_orders[i]), order_count),
+        run("Decoder.decode_many() from hex", lambda i: sum(1 for _ in decoder.decode_many(hex_orders)), 5, order_count, warmup=1, allocation_samples=0),  # noqa
+        run("Decoder.decode_many() from bytes", lambda i: sum(1 for _ in decoder.decode_many(encoded_orders)), 5, order_count, warmup=1, allocation_samples=0),  # noqa
+        run("Decoder.decode_many() from memoryview", lambda i: sum(1 for _ in decoder.decode_many(map(memoryview, encoded_orders))), 5, order_count, warmup=1, allocation_samples=0),  # noqa
+        run("decode_lazy() + deadline & input token", lambda i: filter_order(decoder.decode_lazy(encoded_orders[i])), order_count),  # noqa
+    ])
+
+    print("------------------------------------------")
+    print("| Keeping the decoded orders in memory (bytes/op per order)")
+    print("------------------------------------------")
+    print_results([
+        run("Decoder.decode_many() from bytes", lambda i: list(decoder.decode_many(encoded_orders)), 1, order_count, warmup=0, allocation_samples=1),  # noqa
+        run("decode_lazy() + deadline & input token", lambda i: [filter_order(o) for o in map(decoder.decode_lazy, encoded_orders)], 1, order_count, warmup=0, allocation_samples=1),  # noqa
+    ])
+
+
+if __name__ == "__main__":
+    main()
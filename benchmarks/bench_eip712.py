@@ -0,0 +1,29 @@
+from benchmarks.common import (
+    build_orders,
+    print_results,
+    run,
+)
+from uniswapx_sdk.eip712 import create_exclusive_dutch_order_signable_message
+from uniswapx_sdk.encoder import ExclusiveDutchOrderEncoder
+
+
+order_count = 2_000
+
+
+def main() -> None:
+    orders = build_orders(order_count)
+    encoder = ExclusiveDutchOrderEncoder(1)
+    args = [encoder._create_args(*order) for order in orders]
+
+    print("------------------------------------------")
+    print(f"| Creating {order_count} signable messages")
+    print("------------------------------------------")
+    print_results([
+        run("encode_typed_data() (legacy)", lambda i: encoder._create_typed_data_signable_message(*orders[i]), order_count),  # noqa
+        run("ExclusiveDutchOrderEncoder._create_signable_message()", lambda i: encoder._create_signable_message(*orders[i]), order_count),  # noqa
+        run("create_exclusive_dutch_order_signable_message()", lambda i: create_exclusive_dutch_order_signable_message(1, args[i]), order_count),  # noqa
+    ])
+
+
+if __name__ == "__main__":
+    main()
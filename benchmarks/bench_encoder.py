@@ -0,0 +1,46 @@
+from eth_abi import encode
+
+from benchmarks.common import (
+    build_orders,
+    print_results,
+    run,
+)
+from uniswapx_sdk.constants import exclusive_dutch_order_abi
+from uniswapx_sdk.encoder import (
+    ExclusiveDutchOrder,
+    ExclusiveDutchOrderEncoder,
+)
+
+
+order_count = 5_000
+
+
+def main() -> None:
+    orders = build_orders(order_count)
+    compact_orders = [ExclusiveDutchOrder.from_dataclasses(*order) for order in orders]
+    encoder = ExclusiveDutchOrderEncoder(1)
+    args = [encoder._create_args(*order) for order in orders]
+
+    print("------------------------------------------")
+    print(f"| Encoding {order_count} orders (results per order)")
+    print("------------------------------------------")
+    print_results([
+        run("eth_abi.encode() (legacy)", lambda i: encode(exclusive_dutch_order_abi, (args[i], )), order_count),
+        run("ExclusiveDutchOrderEncoder.encode()", lambda i: encoder.encode((args[i], )), order_count),
+        run("ExclusiveDutchOrderEncoder._create_args()", lambda i: encoder._create_args(*orders[i]), order_count),
+        run("ExclusiveDutchOrder.to_args()", lambda i: compact_orders[i].to_args(), order_count),
+        run("ExclusiveDutchOrderEncoder.encode_order()", lambda i: encoder.encode_order(*orders[i]), order_count),
+        run("ExclusiveDutchOrderEncoder.encode_compact_order()", lambda i: encoder.encode_compact_order(compact_orders[i]), order_count),  # noqa
+    ])
+
+    print("------------------------------------------")
+    print("| Keeping the orders in memory (bytes/op per order)")
+    print("------------------------------------------")
+    print_results([
+        run("order dataclasses", lambda i: build_orders(order_count), 1, order_count, warmup=0, allocation_samples=1),
+        run("ExclusiveDutchOrder", lambda i: [ExclusiveDutchOrder.from_dataclasses(*o) for o in orders], 1, order_count, warmup=0, allocation_samples=1),  # noqa
+    ])
+
+
+if __name__ == "__main__":
+    main()
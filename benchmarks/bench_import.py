@@ -0,0 +1,68 @@
+"""
+Import time of the SDK modules, measured with `python -X importtime` in fresh interpreters.
+
+    python -m benchmarks.bench_import
+"""
+import statistics
+import subprocess
+import sys
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+
+modules = (
+    "uniswapx_sdk.decoder",
+    "uniswapx_sdk.encoder",
+    "uniswapx_sdk.signer",
+    "uniswapx_sdk.resolver",
+    "uniswapx_sdk.api",
+)
+heavy_modules = ("web3", "eth_account", "aiohttp")  # imported on first use only
+runs = 5
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Import a module in a fresh interpreter.
+    :return: the (self, cumulative) import time in microseconds of each module imported along with it
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative_time, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_time), int(cumulative_time))
+    return times
+
+
+def measure_import(module: str, runs: int = runs) -> List[float]:
+    """
+    :return: the cumulative import time of the module in seconds, for each run
+    """
+    return [import_times(module)[module][1] / 1e6 for _ in range(runs)]
+
+
+def main() -> None:
+    print("------------------------------------------")
+    print(f"| Import time (median of {runs} fresh interpreters)")
+    print("------------------------------------------")
+    for module in modules:
+        times = import_times(module)
+        median = statistics.median(measure_import(module))
+        heavy = [name for name in heavy_modules if name in times]
+        print(f"| {module:<24} {median * 1000:>8.1f} ms   heavy imports: {', '.join(heavy) or 'none'}")
+        slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:3]
+        print(f"|     slowest: {', '.join(f'{name} ({self_time / 1000:.1f} ms)' for name, (self_time, _) in slowest)}")  # noqa
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import os
+import tempfile
+from typing import (
+    Dict,
+    List,
+)
+
+from eth_utils import keccak
+
+from benchmarks.common import (
+    BenchmarkResult,
+    build_encoded_orders,
+    print_results,
+    run,
+)
+from uniswapx_sdk.decoder import (
+    DecodedExclusiveDutchOrder,
+    ExclusiveDutchOrderDecoder,
+)
+from uniswapx_sdk.store import OrderStore
+
+
+order_count = 1_000_000
+distinct_order_count = 10_000
+
+
+def main() -> None:
+    encoded_orders = build_encoded_orders(distinct_order_count)
+    signature = b"\x01" * 65
+    metadata = {"orderStatus": "open", "chainId": 1}
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "orders.db")
+        results: List[BenchmarkResult] = []
+        print("------------------------------------------")
+        print(f"| Storing and replaying {order_count} orders (results per order)")
+        print("------------------------------------------")
+        with OrderStore(path) as store:
+            def put_orders(_: int) -> None:
+                store.put_orders(
+                    (keccak(i.to_bytes(32, "big")), encoded_orders[i % distinct_order_count], signature, metadata)
+                    for i in range(order_count)
+                )
+            results.append(run("OrderStore.put_orders()", put_orders, 1, order_count, warmup=0, allocation_samples=0))
+
+        with OrderStore(path) as store:
+            results.append(run("OrderStore.iter_orders() + hash index", lambda _: {o.order_hash: o for o in store.iter_orders()}, 1, order_count, warmup=0, allocation_samples=0))  # noqa
+
+        with OrderStore(path) as store:
+            def replay_and_decode(_: int) -> Dict[bytes, DecodedExclusiveDutchOrder]:
+                decode_lazy = ExclusiveDutchOrderDecoder.decode_lazy
+                return {order.order_hash: decode_lazy(order.encoded_order) for order in store.iter_orders()}
+            results.append(run("OrderStore.iter_orders() + decode_lazy() + hash index", replay_and_decode, 1, order_count, warmup=0, allocation_samples=0))  # noqa
+        print_results(results)
+
+
+if __name__ == "__main__":
+    main()
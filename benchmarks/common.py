@@ -0,0 +1,141 @@
+import time
+import tracemalloc
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from uniswapx_sdk.encoder import (
+    DecayTime,
+    ExclusiveDutchOrderEncoder,
+    ExclusiveDutchOrderInfo,
+    ExclusiveDutchOrderInput,
+    ExclusiveDutchOrderOutput,
+    ExclusiveFiller,
+)
+
+
+swapper = "0xcd7328a5D376D5530f054EAF0B9D235a4Fd36059"
+reactor = "0x6000da47483062a0d734ba3dc7576ce6a0b645c4"
+usdc = "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"
+native = "0x0000000000000000000000000000000000000000"
+
+
+def build_orders(count: int) -> List[Tuple[Any, ...]]:
+    """
+    Build synthetic orders, as tuples of arguments for ExclusiveDutchOrderEncoder.encode_order()
+    """
+    return [
+        (
+            ExclusiveDutchOrderInfo(reactor=reactor, swapper=swapper, nonce=i, deadline=1704283964 + i),
+            DecayTime(1704283832, 1704283952),
+            ExclusiveDutchOrderInput(usdc, 11514000000 + i, 11514000000 + i),
+            (ExclusiveDutchOrderOutput(native, 5 * 10**18 + i, 4 * 10**18 + i, swapper), ),
+            ExclusiveFiller(),
+        )
+        for i in range(count)
+    ]
+
+
+def build_encoded_orders(count: int) -> List[bytes]:
+    encoder = ExclusiveDutchOrderEncoder(1)
+    return [encoder.encode_order(*order)[0] for order in build_orders(count)]
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    bytes_per_op: float
+
+
+def _percentile(sorted_latencies: List[float], q: float) -> float:
+    return sorted_latencies[min(len(sorted_latencies) - 1, int(len(sorted_latencies) * q / 100))]
+
+
+def summarize(name: str, latencies: List[float], allocations: List[int], items_per_call: int = 1) -> BenchmarkResult:
+    """
+    :param latencies: the duration of each call, in seconds
+    :param allocations: the peak memory allocated by each sampled call, in bytes
+    :param items_per_call: the number of items processed by each call
+    """
+    latencies.sort()
+    return BenchmarkResult(
+        name,
+        len(latencies) * items_per_call / sum(latencies),
+        _percentile(latencies, 50) * 1e6 / items_per_call,
+        _percentile(latencies, 99) * 1e6 / items_per_call,
+        sum(allocations) / len(allocations) / items_per_call if allocations else 0.0,
+    )
+
+
+def run(
+        name: str,
+        operation: Callable[[int], Any],
+        iterations: int,
+        items_per_call: int = 1,
+        warmup: int = 100,
+        allocation_samples: int = 100) -> BenchmarkResult:
+    """
+    Time each call of operation(i) for i in range(iterations), after up to warmup calls,
+    then measure the peak memory allocated by up to allocation_samples calls.
+    :param items_per_call: the number of items processed by each call: the results are given per item
+    """
+    for i in range(min(iterations, warmup)):
+        operation(i)
+    latencies = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        operation(i)
+        latencies.append(time.perf_counter() - start)
+    allocations = []
+    for i in range(min(iterations, allocation_samples)):
+        tracemalloc.start()
+        operation(i)
+        allocations.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return summarize(name, latencies, allocations, items_per_call)
+
+
+async def run_async(
+        name: str,
+        operation: Callable[[int], Awaitable[Any]],
+        iterations: int,
+        warmup: int = 10,
+        allocation_samples: int = 20) -> BenchmarkResult:
+    """
+    Same as run(), for coroutines, awaited one at a time.
+    """
+    for i in range(min(iterations, warmup)):
+        await operation(i)
+    latencies = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        await operation(i)
+        latencies.append(time.perf_counter() - start)
+    allocations = []
+    for i in range(min(iterations, allocation_samples)):
+        tracemalloc.start()
+        await operation(i)
+        allocations.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return summarize(name, latencies, allocations)
+
+
+def print_results(results: List[BenchmarkResult], baseline: Optional[Dict[str, BenchmarkResult]] = None) -> None:
+    print(f"| {'benchmark':<55} {'ops/sec':>12} {'p50 (us)':>10} {'p99 (us)':>10} {'bytes/op':>10}")
+    for result in results:
+        line = (
+            f"| {result.name:<55} {result.ops_per_sec:>12,.0f} {result.p50_us:>10,.2f} {result.p99_us:>10,.2f}"
+            f" {result.bytes_per_op:>10,.0f}"
+        )
+        if baseline and result.name in baseline:
+            line += f"   {result.ops_per_sec / baseline[result.name].ops_per_sec - 1:+.1%} vs baseline"
+        print(line)
@@ -0,0 +1,103 @@
+import json
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from eth_abi import (
+    decode,
+    encode,
+)
+from eth_utils import (
+    keccak,
+    to_bytes,
+)
+from web3.providers.async_base import AsyncBaseProvider
+from web3.types import RPCEndpoint
+
+from benchmarks.common import build_encoded_orders
+from uniswapx_sdk.constants import resolved_order_abi
+from uniswapx_sdk.decoder import ExclusiveDutchOrderDecoder
+
+
+def build_api_orders(count: int) -> List[Dict[str, Any]]:
+    """
+    Build synthetic orders, as returned by UniswapX API
+    """
+    return [
+        {
+            "orderHash": "0x" + keccak(encoded_order).hex(),
+            "orderStatus": "open",
+            "encodedOrder": "0x" + encoded_order.hex(),
+            "signature": "0x" + "11" * 65,
+            "chainId": 1,
+            "createdAt": 1704283832,
+            "type": "Dutch",
+        }
+        for encoded_order in build_encoded_orders(count)
+    ]
+
+
+class OrdersAPIMock:
+    """
+    Local HTTP stand-in for UniswapX API, always serving the same page of orders
+    """
+    def __init__(self, order_count: int) -> None:
+        self.body = json.dumps({"orders": build_api_orders(order_count)}).encode()
+        self.server: TestServer = TestServer(web.Application())
+        self.server.app.router.add_get("/orders", self.handle)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        return web.Response(body=self.body, content_type="application/json")
+
+    async def start(self) -> str:
+        """
+        :return: the orders endpoint
+        """
+        await self.server.start_server()
+        return str(self.server.make_url("/orders"))
+
+    async def close(self) -> None:
+        await self.server.close()
+
+
+def resolved_order(encoded_order: bytes) -> bytes:
+    """
+    :return: the ABI encoded ResolvedOrder the quoter would return for the order, before any decay
+    """
+    order = ExclusiveDutchOrderDecoder().decode(encoded_order)[0]
+    return encode(
+        resolved_order_abi,
+        [(
+            order[0],
+            (order[5][0], order[5][1], order[5][2]),
+            [(output[0], output[1], output[3]) for output in order[6]],
+            b"\x11" * 65,
+            keccak(encoded_order),
+        )],
+    )
+
+
+class QuoterProviderMock(AsyncBaseProvider):
+    """
+    Local stand-in for a node with the OrderQuoter deployed, resolving any order without decay
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self._resolved_orders: Dict[bytes, str] = {}
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> Any:
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(1)}
+        elif method == "eth_call":
+            order, _ = decode(["bytes", "bytes"], to_bytes(hexstr=params[0]["data"])[4:])
+            if order not in self._resolved_orders:
+                self._resolved_orders[order] = "0x" + resolved_order(order).hex()
+            return {"jsonrpc": "2.0", "id": 1, "result": self._resolved_orders[order]}
+        raise NotImplementedError(method)
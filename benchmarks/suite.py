@@ -0,0 +1,136 @@
+"""
+Reproducible benchmark suite of the SDK hot paths, against a local mock of UniswapX API and a mocked RPC provider.
+
+    python -m benchmarks.suite                  # run and print the results
+    python -m benchmarks.suite --save           # run and store the results as the baseline
+    python -m benchmarks.suite --compare        # run and compare with the baseline, exit with 1 on regression
+
+The import time of the main modules is measured too, as imports per second.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+from typing import (
+    Dict,
+    List,
+)
+
+from web3 import AsyncWeb3
+from web3.types import HexStr
+
+from benchmarks import bench_import
+from benchmarks.common import (
+    BenchmarkResult,
+    build_encoded_orders,
+    build_orders,
+    print_results,
+    run,
+    run_async,
+    summarize,
+)
+from benchmarks.mocks import (
+    OrdersAPIMock,
+    QuoterProviderMock,
+)
+from uniswapx_sdk.api import UniswapXAPI
+from uniswapx_sdk.constants import order_quoters
+from uniswapx_sdk.decoder import ExclusiveDutchOrderDecoder
+from uniswapx_sdk.encoder import ExclusiveDutchOrderEncoder
+from uniswapx_sdk.resolver import OrderResolver
+
+
+default_baseline_path = os.path.join(os.path.dirname(__file__), "baseline.json")
+seed = 42
+
+
+async def run_suite(order_count: int = 2_000, page_size: int = 100) -> List[BenchmarkResult]:
+    random.seed(seed)
+    orders = build_orders(order_count)
+    encoded_orders = build_encoded_orders(order_count)
+    hex_orders = [HexStr("0x" + encoded_order.hex()) for encoded_order in encoded_orders]
+    encoder = ExclusiveDutchOrderEncoder(1)
+    decoder = ExclusiveDutchOrderDecoder()
+
+    results = [
+        run("ExclusiveDutchOrderEncoder.encode_order", lambda i: encoder.encode_order(*orders[i]), order_count),
+        run("ExclusiveDutchOrderDecoder.decode", lambda i: decoder.decode(hex_orders[i]), order_count),
+        run("ExclusiveDutchOrderDecoder.decode_lazy", lambda i: decoder.decode_lazy(encoded_orders[i]), order_count),
+    ]
+
+    api_mock = OrdersAPIMock(page_size)
+    endpoint = await api_mock.start()
+    try:
+        async with UniswapXAPI(1, orders_endpoint=endpoint) as api:
+            results.append(await run_async("UniswapXAPI.get_orders", lambda i: api.get_orders(limit=page_size), 200))
+            results.append(await run_async("UniswapXAPI.get_orders_page", lambda i: api.get_orders_page(limit=page_size), 200))  # noqa
+    finally:
+        await api_mock.close()
+
+    resolver = OrderResolver(AsyncWeb3(QuoterProviderMock()), 1, order_quoters[1])
+    signature = HexStr("0x" + "11" * 65)
+    results.append(await run_async(
+        "OrderResolver.resolve", lambda i: resolver.resolve(hex_orders[i % len(hex_orders)], signature), 500
+    ))
+    return results
+
+
+def run_imports(runs: int = bench_import.runs) -> List[BenchmarkResult]:
+    """
+    Time the import of the main SDK modules, each in fresh interpreters.
+    """
+    results = []
+    for module in bench_import.modules:
+        latencies = bench_import.measure_import(module, runs)
+        results.append(summarize(f"import {module}", latencies, [0]))
+    return results
+
+
+def load_baseline(path: str) -> Dict[str, BenchmarkResult]:
+    with open(path) as f:
+        return {result["name"]: BenchmarkResult(**result) for result in json.load(f)}
+
+
+def save_baseline(path: str, results: List[BenchmarkResult]) -> None:
+    with open(path, "w") as f:
+        json.dump([result._asdict() for result in results], f, indent=2)
+
+
+def regressions(
+        results: List[BenchmarkResult],
+        baseline: Dict[str, BenchmarkResult],
+        tolerance: float) -> List[str]:
+    """
+    :return: the names of the benchmarks whose throughput dropped by more than tolerance from the baseline
+    """
+    return [
+        result.name
+        for result in results
+        if result.name in baseline and result.ops_per_sec < baseline[result.name].ops_per_sec * (1 - tolerance)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="UniswapX SDK benchmark suite")
+    parser.add_argument("--save", action="store_true", help="store the results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="compare the results with the baseline")
+    parser.add_argument("--baseline", default=default_baseline_path, help="the baseline file path")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="the accepted throughput drop, as a ratio")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_suite()) + run_imports()
+    baseline = load_baseline(args.baseline) if args.compare else None
+    print_results(results, baseline)
+    if args.save:
+        save_baseline(args.baseline, results)
+    if baseline is not None:
+        regressed = regressions(results, baseline, args.tolerance)
+        if regressed:
+            print(f"Regressions (more than {args.tolerance:.0%} slower): {', '.join(regressed)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from web3 import Web3
+
+from uniswapx_sdk.address import (
+    address_cache,
+    AddressCache,
+    AddressCacheInfo,
+)
+from uniswapx_sdk.encoder import ExclusiveDutchOrderInput
+
+
+addresses = [f"0x{i:040x}" for i in range(1, 11)]
+
+
+def test_address_cache():
+    cache = AddressCache(max_size=5)
+    for address in addresses[:5]:
+        assert cache.to_checksum_address(address) == Web3.to_checksum_address(address)
+    assert cache.cache_info() == AddressCacheInfo(hits=0, misses=5, max_size=5, size=5)
+
+    assert cache.to_checksum_address(addresses[0]) == Web3.to_checksum_address(addresses[0])
+    assert cache.cache_info() == AddressCacheInfo(hits=1, misses=5, max_size=5, size=5)
+
+    cache.to_checksum_address(addresses[5])  # evicts addresses[1], the least recently used
+    cache.to_checksum_address(addresses[0])
+    cache.to_checksum_address(addresses[1])
+    assert cache.cache_info() == AddressCacheInfo(hits=2, misses=7, max_size=5, size=5)
+
+    cache.set_max_size(2)
+    assert cache.cache_info().size == 2
+
+    cache.cache_clear()
+    assert cache.cache_info() == AddressCacheInfo(hits=0, misses=0, max_size=2, size=0)
+
+    with pytest.raises(ValueError):
+        AddressCache(0)
+    with pytest.raises(ValueError):
+        cache.set_max_size(-1)
+
+
+def test_address_cache_thread_safety():
+    cache = AddressCache(max_size=4)
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(cache.to_checksum_address, addresses * 50))
+    assert results == [Web3.to_checksum_address(address) for address in addresses * 50]
+    info = cache.cache_info()
+    assert info.hits + info.misses == len(addresses) * 50
+    assert info.size == 4
+
+
+def test_order_dataclasses_use_address_cache():
+    ExclusiveDutchOrderInput(addresses[0], 1, 2)
+    hits = address_cache.cache_info().hits
+    dutch_input = ExclusiveDutchOrderInput(addresses[0], 1, 2)
+    assert dutch_input.token == Web3.to_checksum_address(addresses[0])
+    assert address_cache.cache_info().hits > hits
+
+
+@pytest.mark.parametrize("address", (bytearray(b"\x11" * 20), memoryview(b"\x11" * 20), b"\x11" * 20))
+def test_address_cache_bytes_like(address):
+    cache = AddressCache()
+    for _ in range(2):
+        assert cache.to_checksum_address(address) == Web3.to_checksum_address(bytes(address))
+    assert cache.cache_info() == AddressCacheInfo(hits=1, misses=1, max_size=4096, size=1)
+    dutch_input = ExclusiveDutchOrderInput(address, 1, 2)
+    assert dutch_input.token == "0x" + "11" * 20
@@ -1,7 +1,20 @@
-from aiohttp import ClientSession
+import asyncio
+import gc
+import time
+import warnings
+
+from aiohttp import (
+    ClientResponseError,
+    ClientSession,
+    web,
+)
+from aiohttp.test_utils import TestServer
 import pytest
 
-from uniswapx_sdk.api import UniswapXAPI
+from uniswapx_sdk.api import (
+    TokenBucket,
+    UniswapXAPI,
+)
 
 
 # https://api.uniswap.org/v2/orders?limit=10&sortKey=createdAt&desc=true&chainId=1
@@ -48,9 +61,9 @@ order_1 = {
     )
 )
 async def test_get_orders(order_status, limit, order_hash, expected_order_count, expected_orders):
-    api = UniswapXAPI(1)
     kwargs = {"orderHash": order_hash} if order_hash else {}
-    api_result = await api.get_orders(order_status=order_status, limit=limit, **kwargs)
+    async with UniswapXAPI(1) as api:
+        api_result = await api.get_orders(order_status=order_status, limit=limit, **kwargs)
     assert len(api_result["orders"]) == expected_order_count
     if expected_orders:
         for o in expected_orders:
@@ -59,3 +72,261 @@ async def test_get_orders(order_status, limit, order_hash, expected_order_count,
     async with ClientSession() as client_session:
         api_result_with_seesion = await api.get_orders(order_status=order_status, limit=limit, session=client_session, **kwargs)  # noqa
         assert api_result_with_seesion == api_result
+
+
+class OrdersAPIStandIn:
+    """
+    Local HTTP stand-in for the UniswapX orders endpoint, serving orders by pages with a cursor, filtered
+    by orderStatus or orderHashes.
+    The first requests can be answered with the given error statuses, or delayed by the given delays.
+    """
+    def __init__(self, order_count, delay=0.0, error_statuses=(), delays=(), retry_after=None):
+        self.orders = [{"orderHash": hex(i), "orderStatus": "open"} for i in range(order_count)]
+        self.delay = delay
+        self.error_statuses = list(error_statuses)
+        self.delays = list(delays)
+        self.retry_after = retry_after
+        self.requests = []
+        self.peers = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request):
+        self.requests.append(dict(request.query))
+        self.peers.add(request.transport.get_extra_info("peername"))
+        if self.error_statuses:
+            headers = {"Retry-After": self.retry_after} if self.retry_after else None
+            return web.json_response({"errorCode": "error"}, status=self.error_statuses.pop(0), headers=headers)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.pop(0) if self.delays else self.delay)
+        finally:
+            self.in_flight -= 1
+        orders = self.orders
+        if "orderStatus" in request.query:
+            orders = [order for order in orders if order["orderStatus"] == request.query["orderStatus"]]
+        if "orderHashes" in request.query:
+            order_hashes = request.query["orderHashes"].split(",")
+            orders = [order for order in orders if order["orderHash"] in order_hashes]
+        start = int(request.query.get("cursor", 0))
+        end = start + int(request.query["limit"])
+        page = {"orders": orders[start:end]}
+        if end < len(orders):
+            page["cursor"] = str(end)
+        return web.json_response(page)
+
+
+async def start_api(api_stand_in):
+    app = web.Application()
+    app.router.add_get("/orders", api_stand_in.handle)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+@pytest.mark.asyncio(scope="session")
+@pytest.mark.parametrize("order_count, limit, expected_requests", ((25, 10, 3), (20, 10, 2), (0, 10, 1)))
+async def test_iter_orders(order_count, limit, expected_requests):
+    stand_in = OrdersAPIStandIn(order_count)
+    server = await start_api(stand_in)
+    try:
+        async with UniswapXAPI(1, orders_endpoint=str(server.make_url("/orders"))) as api:
+            orders = [order async for order in api.iter_orders("open", limit=limit, swapper="0x00")]
+    finally:
+        await server.close()
+    assert orders == stand_in.orders
+    assert len(stand_in.requests) == expected_requests
+    assert all(query["swapper"] == "0x00" and query["orderStatus"] == "open" for query in stand_in.requests)
+    assert [query.get("cursor") for query in stand_in.requests[1:]] == [str(i * limit) for i in range(1, expected_requests)]  # noqa
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_get_orders_by_hash():
+    stand_in = OrdersAPIStandIn(5)
+    stand_in.orders[3]["orderStatus"] = "filled"
+    server = await start_api(stand_in)
+    try:
+        async with UniswapXAPI(1, orders_endpoint=str(server.make_url("/orders"))) as api:
+            orders = await api.get_orders_by_hash(["0x1", "0x3", "0x9"], batch_size=2)
+            with pytest.raises(ValueError):
+                await api.get_orders_by_hash(["0x1"], batch_size=0)
+    finally:
+        await server.close()
+    assert orders == [stand_in.orders[1], stand_in.orders[3]]
+    assert [query["orderHashes"] for query in stand_in.requests] == ["0x1,0x3", "0x9"]
+    assert all("orderStatus" not in query for query in stand_in.requests)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_iter_orders_prefetch():
+    stand_in = OrdersAPIStandIn(30, delay=0.05)
+    server = await start_api(stand_in)
+    try:
+        api = UniswapXAPI(1, orders_endpoint=str(server.make_url("/orders")))
+        async with ClientSession() as session:
+            iterator = api.iter_orders("open", limit=10, session=session)
+            await iterator.__anext__()
+            await asyncio.sleep(0.1)
+            # the second page is fetched while the first one is consumed, not the third one
+            assert len(stand_in.requests) == 2
+            await iterator.aclose()
+            assert not session.closed
+    finally:
+        await server.close()
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_persistent_session():
+    stand_in = OrdersAPIStandIn(5)
+    server = await start_api(stand_in)
+    try:
+        async with UniswapXAPI(1, orders_endpoint=str(server.make_url("/orders")), limit_per_host=2) as api:
+            session = api.session
+            for _ in range(5):
+                assert (await api.get_orders(limit=2))["orders"] == stand_in.orders[:2]
+            assert api.session is session
+            assert session.connector.limit_per_host == 2
+        assert session.closed
+        # the connection is kept alive between the calls
+        assert len(stand_in.requests) == 5
+        assert len(stand_in.peers) == 1
+
+        # a closed instance gets a new session
+        await api.get_orders()
+        assert api.session is not session
+        await api.close()
+    finally:
+        await server.close()
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_unclosed_session_warning():
+    api = UniswapXAPI(1)
+    session = api.session
+    with pytest.warns(ResourceWarning, match="Unclosed UniswapXAPI"):
+        del api
+        gc.collect()
+    await session.close()
+
+    api = UniswapXAPI(1)
+    _ = api.session
+    await api.close()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        del api
+        gc.collect()
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_request_metrics():
+    stand_in = OrdersAPIStandIn(5, delay=0.01)
+    server = await start_api(stand_in)
+    try:
+        async with UniswapXAPI(1, orders_endpoint=str(server.make_url("/orders"))) as api:
+            for _ in range(3):
+                await api.get_orders()
+            api.orders_endpoint = str(server.make_url("/unknown"))
+            with pytest.raises(Exception):
+                await api.get_orders()
+    finally:
+        await server.close()
+
+    metrics = api.metrics
+    assert (metrics.count, metrics.error_count) == (4, 1)
+    assert 0.01 <= metrics.percentile(50) <= metrics.percentile(99) == metrics.max_latency
+    assert metrics.mean_latency == pytest.approx(metrics.total_latency / 4)
+    with pytest.raises(ValueError):
+        metrics.percentile(101)
+    metrics.reset()
+    assert (metrics.count, metrics.percentile(50), metrics.mean_latency) == (0, 0.0, 0.0)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_retries():
+    stand_in = OrdersAPIStandIn(3, error_statuses=(503, 429, 502))
+    server = await start_api(stand_in)
+    try:
+        url = str(server.make_url("/orders"))
+        async with UniswapXAPI(1, orders_endpoint=url, max_retries=3, backoff=0.01) as api:
+            assert (await api.get_orders())["orders"] == stand_in.orders
+            assert (api.metrics.count, api.metrics.error_count, api.metrics.retry_count) == (4, 3, 3)
+
+        stand_in.error_statuses = [503, 503]
+        async with UniswapXAPI(1, orders_endpoint=url, max_retries=1, backoff=0.01) as api:
+            with pytest.raises(ClientResponseError) as e:
+                await api.get_orders()
+            assert e.value.status == 503
+
+        # not retryable
+        stand_in.error_statuses = [400]
+        async with UniswapXAPI(1, orders_endpoint=url, max_retries=3) as api:
+            assert await api.get_orders() == {"errorCode": "error"}
+            assert api.metrics.retry_count == 0
+
+        # retries disabled by default: the error body is returned
+        stand_in.error_statuses = [429]
+        async with UniswapXAPI(1, orders_endpoint=url) as api:
+            assert await api.get_orders() == {"errorCode": "error"}
+            assert (api.metrics.error_count, api.metrics.retry_count) == (0, 0)
+    finally:
+        await server.close()
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_retry_after_holds_rate_limiter():
+    stand_in = OrdersAPIStandIn(3, error_statuses=(429, ), retry_after="0.2")
+    server = await start_api(stand_in)
+    try:
+        url = str(server.make_url("/orders"))
+        async with UniswapXAPI(1, orders_endpoint=url, max_retries=1, rate_limit=1000, burst=10) as api:
+            start = time.monotonic()
+            await asyncio.gather(api.get_orders(), api.get_orders())
+            assert time.monotonic() - start >= 0.2
+            assert len(stand_in.requests) == 3
+    finally:
+        await server.close()
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_rate_limit_and_concurrency():
+    stand_in = OrdersAPIStandIn(3, delay=0.02)
+    server = await start_api(stand_in)
+    try:
+        url = str(server.make_url("/orders"))
+        async with UniswapXAPI(1, orders_endpoint=url, rate_limit=50, burst=2, max_concurrency=3) as api:
+            start = time.monotonic()
+            await asyncio.gather(*(api.get_orders() for _ in range(7)))
+            # 2 requests at once, then one every 20 ms
+            assert time.monotonic() - start >= 0.1
+            assert stand_in.max_in_flight <= 3
+    finally:
+        await server.close()
+
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+    with pytest.raises(ValueError):
+        UniswapXAPI(1, max_concurrency=0)
+    with pytest.raises(ValueError):
+        UniswapXAPI(1, max_retries=-1)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_hedged_requests():
+    stand_in = OrdersAPIStandIn(3, delays=(1.0, ))
+    server = await start_api(stand_in)
+    try:
+        url = str(server.make_url("/orders"))
+        async with UniswapXAPI(1, orders_endpoint=url, hedge_delay=0.05) as api:
+            start = time.monotonic()
+            assert (await api.get_orders())["orders"] == stand_in.orders
+            assert time.monotonic() - start < 0.5
+            assert api.metrics.hedge_count == 1
+            assert len(stand_in.requests) == 2
+
+            # fast enough: not hedged
+            await api.get_orders()
+            assert api.metrics.hedge_count == 1
+            assert len(stand_in.requests) == 3
+    finally:
+        await server.close()
@@ -0,0 +1,35 @@
+import json
+import subprocess
+import sys
+
+from eth_utils import to_checksum_address
+import pytest
+
+from uniswapx_sdk.constants import (
+    get_parsed_abi,
+    multicall3_abi,
+    multicall3_address,
+    order_quoter_abi,
+    order_quoters,
+    permit2_address,
+)
+
+
+def test_checksummed_addresses():
+    for address in list(order_quoters.values()) + [multicall3_address, permit2_address]:
+        assert address == to_checksum_address(address)
+
+
+def test_get_parsed_abi():
+    for abi in (order_quoter_abi, multicall3_abi):
+        assert get_parsed_abi(abi) == json.loads(abi)
+        assert get_parsed_abi(abi) is get_parsed_abi(abi)
+
+
+@pytest.mark.parametrize(
+    "module",
+    ("uniswapx_sdk.decoder", "uniswapx_sdk.encoder", "uniswapx_sdk.signer", "uniswapx_sdk.resolver", "uniswapx_sdk.api", "uniswapx_sdk.store"),  # noqa
+)
+def test_lazy_imports(module):
+    code = f"import sys, {module}; print(*[name for name in ('web3', 'eth_account', 'aiohttp') if name in sys.modules])"
+    assert subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout.strip() == ""
@@ -0,0 +1,137 @@
+import random
+
+import pytest
+
+from uniswapx_sdk.decoder import ExclusiveDutchOrderDecoder
+
+from .test_resolver import (
+    encoded_order_2,
+    resolved_order_2,
+)
+
+
+np = pytest.importorskip("numpy")
+
+from uniswapx_sdk.decay import (  # noqa: E402
+    decay,
+    DutchDecayEvaluator,
+)
+
+
+decoder = ExclusiveDutchOrderDecoder()
+order_2 = decoder.decode(encoded_order_2)[0]
+decay_start_2, decay_end_2 = order_2[1], order_2[2]
+exclusive_filler_2 = order_2[3]
+max_uint = 2 ** 256 - 1
+
+
+def build_order(decay_start, decay_end, input_amounts, output_amounts, exclusive_filler="0x" + "00" * 20, bps=0, deadline=None):  # noqa
+    return (
+        ("0x" + "11" * 20, "0x" + "22" * 20, 0, deadline or decay_end, "0x" + "00" * 20, b""),
+        decay_start,
+        decay_end,
+        exclusive_filler,
+        bps,
+        ("0x" + "33" * 20, *input_amounts),
+        tuple(("0x" + "44" * 20, start, end, "0x" + "22" * 20) for start, end in output_amounts),
+    )
+
+
+def test_decay():
+    assert decay(100, 50, 10, 20, 5) == 100
+    assert decay(100, 50, 10, 20, 10) == 100
+    assert decay(100, 50, 10, 20, 13) == 85
+    assert decay(100, 50, 10, 20, 20) == 50
+    assert decay(50, 100, 10, 20, 13) == 65
+    assert decay(100, 0, 10, 13, 11) == 67  # rounded down: 100 - 33
+    assert decay(0, 100, 10, 13, 11) == 33
+    assert decay(100, 50, 10, 10, 10) == 50
+    with pytest.raises(ValueError):
+        decay(100, 50, 20, 10, 15)
+
+
+@pytest.mark.parametrize("lazy", (False, True))
+def test_evaluate_as_quoter(lazy):
+    order = decoder.decode_lazy(encoded_order_2) if lazy else order_2
+    evaluator = DutchDecayEvaluator([order])
+    amounts = evaluator.evaluate(decay_start_2)
+
+    assert len(evaluator) == 1
+    assert list(amounts.input_amounts) == [resolved_order_2[1][1]]
+    assert list(amounts.input_max_amounts) == [resolved_order_2[1][2]]
+    assert list(amounts.order_output_amounts(0)) == [output[1] for output in resolved_order_2[2]]
+    assert list(amounts.fillable) == [True]
+
+
+def test_evaluate_exclusivity():
+    evaluator = DutchDecayEvaluator([order_2])
+    start_amounts = [output[1] for output in order_2[6]]
+    assert list(evaluator.evaluate(decay_start_2, filler="0x" + exclusive_filler_2[2:].upper()).output_amounts) == start_amounts  # noqa
+    assert list(evaluator.evaluate(decay_start_2, filler="0x" + "55" * 20).output_amounts) != start_amounts
+    # no override after the exclusivity period
+    end_amounts = [output[2] for output in order_2[6]]
+    assert list(evaluator.evaluate(decay_end_2).output_amounts) == end_amounts
+
+
+def test_evaluate_fillable():
+    orders = [
+        build_order(100, 200, (10, 10), [(20, 10)], deadline=150),
+        build_order(100, 200, (10, 10), [(20, 10)], exclusive_filler="0x" + "55" * 20, bps=0),
+        build_order(200, 100, (10, 10), [(20, 10)], deadline=300),
+        build_order(100, 200, (10, 10), [(20, 10)]),
+    ]
+    evaluator = DutchDecayEvaluator(orders)
+    assert list(evaluator.evaluate(100).fillable) == [True, False, False, True]
+    assert list(evaluator.evaluate(100, filler="0x" + "55" * 20).fillable) == [True, True, False, True]
+    assert list(evaluator.evaluate(160).fillable) == [False, True, False, True]
+
+
+def random_amount(rnd):
+    return rnd.choice((0, 1, max_uint, rnd.getrandbits(64), rnd.getrandbits(128), rnd.getrandbits(255)))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_evaluate_against_scalar_reference(seed):
+    rnd = random.Random(seed)
+    orders = []
+    for _ in range(50):
+        decay_start = rnd.randrange(1_700_000_000, 1_700_000_100)
+        decay_end = decay_start + rnd.choice((0, 1, 7, 60, 3600))
+        outputs = [(random_amount(rnd), random_amount(rnd)) for _ in range(rnd.randrange(0, 4))]
+        exclusive_filler = rnd.choice(("0x" + "00" * 20, "0x" + "55" * 20))
+        bps = rnd.choice((0, 1, 100, 10_000))
+        orders.append(build_order(decay_start, decay_end, (random_amount(rnd), random_amount(rnd)), outputs, exclusive_filler, bps))  # noqa
+
+    evaluator = DutchDecayEvaluator(orders)
+    for timestamp in (1_699_999_999, 1_700_000_050, 1_700_000_101, 1_700_004_000):
+        amounts = evaluator.evaluate(timestamp)
+        for i, order in enumerate(orders):
+            _, decay_start, decay_end, exclusive_filler, bps, dutch_input, outputs = order
+            assert amounts.input_amounts[i] == decay(dutch_input[1], dutch_input[2], decay_start, decay_end, timestamp)
+            expected_outputs = []
+            for _, start, end, _ in outputs:
+                amount = decay(start, end, decay_start, decay_end, timestamp)
+                if exclusive_filler != "0x" + "00" * 20 and timestamp <= decay_start:
+                    amount = amount * (10_000 + bps) // 10_000
+                expected_outputs.append(amount)
+            assert list(amounts.order_output_amounts(i)) == expected_outputs
+
+
+def test_evaluate_unsupported_orders():
+    orders = [
+        build_order(100, 100 + 2 ** 32, (10, 20), [(20, 10)]),
+        build_order(2 ** 63, 2 ** 63 + 1, (10, 20), [(20, 10)]),
+        build_order(100, 200, (10, 20), [(20, 10)], exclusive_filler="0x" + "55" * 20, bps=2 ** 32),
+        build_order(100, 200, (10, 20), [(20, 10)]),
+    ]
+    assert list(DutchDecayEvaluator(orders).evaluate(150).fillable) == [False, False, False, True]
+
+
+def test_evaluate_as_float():
+    orders = [build_order(100, 200, (max_uint, 0), [(2 ** 100, 0), (0, 10 ** 18)]), build_order(100, 200, (1, 1), [])]
+    amounts = DutchDecayEvaluator(orders).evaluate(150)
+    assert list(amounts.input_amounts) == [max_uint - max_uint // 2, 1]
+    assert list(amounts.output_amounts) == [2 ** 99, 10 ** 18 // 2]
+    assert list(amounts.output_offsets) == [0, 2, 2]
+    assert amounts.input_amounts_as_float() == pytest.approx([float(max_uint - max_uint // 2), 1.0])
+    assert amounts.output_amounts_as_float() == pytest.approx([2.0 ** 99, 5e17])
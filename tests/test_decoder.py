@@ -1,4 +1,13 @@
-from eth_utils import to_hex
+from typing import Iterator
+
+from eth_abi.exceptions import (
+    InsufficientDataBytes,
+    NonEmptyPaddingBytes,
+)
+from eth_utils import (
+    to_bytes,
+    to_hex,
+)
 import pytest
 
 from uniswapx_sdk.decoder import ExclusiveDutchOrderDecoder
@@ -120,3 +129,47 @@ def test_exclusive_dutch_order_decoder(encoded_order, expected_decoded_order):
     decoder = ExclusiveDutchOrderDecoder()
     decoded_order = decoder.decode(to_hex(hexstr=encoded_order))
     assert decoded_order == expected_decoded_order
+
+
+def test_exclusive_dutch_order_decoder_decode_many():
+    decoder = ExclusiveDutchOrderDecoder()
+    encoded_orders = (
+        encoded_order_1,
+        to_bytes(hexstr=encoded_order_2),
+        memoryview(to_bytes(hexstr=encoded_order_3)),
+    )
+    decoded_orders = decoder.decode_many(encoded_orders)
+    assert isinstance(decoded_orders, Iterator)
+    assert list(decoded_orders) == [expected_decoded_result_1, expected_decoded_result_2, expected_decoded_result_3]
+
+
+@pytest.mark.parametrize(
+    "encoded_order, expected_decoded_order",
+    (
+        (encoded_order_1, expected_decoded_result_1),
+        (to_bytes(hexstr=encoded_order_2), expected_decoded_result_2),
+        (memoryview(to_bytes(hexstr=encoded_order_3)), expected_decoded_result_3),
+    )
+)
+def test_exclusive_dutch_order_decoder_decode_lazy(encoded_order, expected_decoded_order):
+    decoded_order = ExclusiveDutchOrderDecoder.decode_lazy(encoded_order)
+    expected_order = expected_decoded_order[0]
+    assert decoded_order.info.deadline == expected_order[0][3]
+    assert decoded_order.input_token == expected_order[5][0]
+    assert len(decoded_order.outputs) == len(expected_order[6])
+    assert decoded_order.outputs[0].token == expected_order[6][0][0]
+    assert decoded_order.outputs is decoded_order.outputs
+    assert decoded_order.to_tuple() == expected_order
+    assert not hasattr(decoded_order, "__dict__")
+
+
+def test_exclusive_dutch_order_decoder_decode_lazy_errors():
+    data = bytearray(to_bytes(hexstr=encoded_order_1))
+    with pytest.raises(InsufficientDataBytes):
+        ExclusiveDutchOrderDecoder.decode_lazy(bytes(data[:-32]))
+
+    data[32 * 10] = 1  # reactor padding
+    decoded_order = ExclusiveDutchOrderDecoder.decode_lazy(bytes(data))
+    assert decoded_order.info.deadline == expected_decoded_result_1[0][0][3]
+    with pytest.raises(NonEmptyPaddingBytes):
+        _ = decoded_order.info.reactor
@@ -0,0 +1,46 @@
+import pytest
+
+from tests.conftest import order_4
+from tests.test_encoder import order_1
+from uniswapx_sdk.constants import exclusive_dutch_order_types
+from uniswapx_sdk.eip712 import (
+    _encode_type,
+    create_exclusive_dutch_order_signable_message,
+    get_permit2_domain_separator,
+)
+from uniswapx_sdk.encoder import (
+    ExclusiveDutchOrderEncoder,
+    ExclusiveDutchOrderInfo,
+)
+
+
+expected_permit_witness_transfer_from_type = "PermitWitnessTransferFrom(TokenPermissions permitted,address spender,uint256 nonce,uint256 deadline,ExclusiveDutchOrder witness)DutchOutput(address token,uint256 startAmount,uint256 endAmount,address recipient)ExclusiveDutchOrder(OrderInfo info,uint256 decayStartTime,uint256 decayEndTime,address exclusiveFiller,uint256 exclusivityOverrideBps,address inputToken,uint256 inputStartAmount,uint256 inputEndAmount,DutchOutput[] outputs)OrderInfo(address reactor,address swapper,uint256 nonce,uint256 deadline,address additionalValidationContract,bytes additionalValidationData)TokenPermissions(address token,uint256 amount)"  # noqa
+
+
+def test_encode_type():
+    assert _encode_type("PermitWitnessTransferFrom", exclusive_dutch_order_types) == expected_permit_witness_transfer_from_type  # noqa
+
+
+order_5 = (
+    ExclusiveDutchOrderInfo(
+        reactor=order_4[0].reactor,
+        swapper=order_4[0].swapper,
+        nonce=order_4[0].nonce,
+        deadline=order_4[0].deadline,
+        validation_callback="0x37a8f295612602f2774d331e562be9e61b83a327",
+        validation_data=b"\x01" * 45,
+    ),
+    *order_4[1:],
+)
+
+
+@pytest.mark.parametrize("chain_id", (1, 5, 137, 12341234))
+@pytest.mark.parametrize("order", (order_1, order_4, order_5))
+def test_create_exclusive_dutch_order_signable_message(chain_id, order):
+    encoder = ExclusiveDutchOrderEncoder(chain_id)
+    expected_signable_message = encoder._create_typed_data_signable_message(*order)
+    args = encoder._create_args(*order)
+    assert create_exclusive_dutch_order_signable_message(chain_id, args) == expected_signable_message
+    assert encoder._create_signable_message(*order) == expected_signable_message
+    assert encoder.encode_order(*order)[1] == expected_signable_message
+    assert get_permit2_domain_separator(chain_id) == expected_signable_message.header
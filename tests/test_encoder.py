@@ -11,6 +11,7 @@ from web3.types import HexBytes
 from tests.conftest import order_4
 from uniswapx_sdk.encoder import (
     DecayTime,
+    ExclusiveDutchOrder,
     ExclusiveDutchOrderEncoder,
     ExclusiveDutchOrderInfo,
     ExclusiveDutchOrderInput,
@@ -162,3 +163,29 @@ def test_encode_execute():
     encoded_execute = ExclusiveDutchOrderEncoder.encode_execute(execute_order, execute_sig)
     assert isinstance(encoded_execute, str)
     assert expected_encoded_execute == encoded_execute
+
+
+def test_compact_exclusive_dutch_order():
+    order = ExclusiveDutchOrder(
+        reactor='0x6000da47483062a0d734ba3dc7576ce6a0b645c4',
+        swapper='0xe7f525dd1bc6d748ae4d7f21d31e54741e05e110',
+        nonce=1993350810584104428432150966441163937812467703763408189373898424638421800960,
+        deadline=1704283964,
+        decay_start_time=1704283832,
+        decay_end_time=1704283952,
+        input_token='0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48',
+        input_start_amount=11514000000,
+        input_end_amount=11514000000,
+        outputs=order_details_1[0][6],
+        exclusive_filler='0x919f9173e2dc833ec708812b4f1cb11b1a17efde',
+        exclusivity_override_bps=100,
+    )
+    assert not hasattr(order, "__dict__")
+    assert order.to_args() == expected_args_1
+    assert order.to_message_data() == expected_message_data_1
+    assert ExclusiveDutchOrder.from_dataclasses(*order_1).to_args() == expected_args_1
+
+    encoder = ExclusiveDutchOrderEncoder(1)
+    encoded_order, signable_message = encoder.encode_compact_order(order)
+    assert expected_encoded_order_1 == to_hex(encoded_order)
+    assert expected_signable_message_1 == signable_message
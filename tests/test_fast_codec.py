@@ -0,0 +1,104 @@
+from random import Random
+
+from eth_abi import (
+    decode,
+    encode,
+)
+from eth_abi.exceptions import DecodingError
+from eth_utils import to_checksum_address
+import pytest
+
+from tests.conftest import order_4
+from uniswapx_sdk.constants import exclusive_dutch_order_abi
+from uniswapx_sdk.decoder import ExclusiveDutchOrderDecoder
+from uniswapx_sdk.encoder import ExclusiveDutchOrderEncoder
+from uniswapx_sdk.fast_codec import (
+    decode_exclusive_dutch_order,
+    encode_exclusive_dutch_order,
+)
+
+
+def random_address(rnd):
+    return to_checksum_address(rnd.getrandbits(160).to_bytes(20, "big"))
+
+
+def random_uint(rnd):
+    return rnd.choice((0, 1, 2**256 - 1, rnd.getrandbits(rnd.choice((32, 64, 128, 256)))))
+
+
+def random_order(rnd):
+    info = (
+        random_address(rnd),
+        random_address(rnd),
+        random_uint(rnd),
+        random_uint(rnd),
+        random_address(rnd),
+        bytes(rnd.getrandbits(8) for _ in range(rnd.choice((0, 1, 31, 32, 33, 70)))),
+    )
+    outputs = tuple(
+        (random_address(rnd), random_uint(rnd), random_uint(rnd), random_address(rnd))
+        for _ in range(rnd.randint(0, 4))
+    )
+    return (
+        info,
+        random_uint(rnd),
+        random_uint(rnd),
+        random_address(rnd),
+        random_uint(rnd),
+        (random_address(rnd), random_uint(rnd), random_uint(rnd)),
+        outputs,
+    )
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_fast_codec_parity_with_eth_abi(seed):
+    rnd = Random(seed)
+    order = random_order(rnd)
+    expected_encoded_order = encode(exclusive_dutch_order_abi, (order, ))
+
+    encoded_order = encode_exclusive_dutch_order(order)
+    assert encoded_order == expected_encoded_order
+
+    expected_decoded_order = decode(exclusive_dutch_order_abi, expected_encoded_order)
+    assert (decode_exclusive_dutch_order(encoded_order), ) == expected_decoded_order
+    assert (decode_exclusive_dutch_order(memoryview(encoded_order)), ) == expected_decoded_order
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_fast_decoder_falls_back_on_corrupted_payloads(seed):
+    rnd = Random(seed)
+    data = bytearray(encode(exclusive_dutch_order_abi, (random_order(rnd), )))
+    for _ in range(rnd.randint(1, 3)):
+        data[rnd.randrange(len(data))] = rnd.getrandbits(8)
+    if rnd.random() < 0.2:
+        data = data[:rnd.randrange(len(data))]
+
+    decoded_order = decode_exclusive_dutch_order(bytes(data))
+    try:
+        expected_decoded_order = decode(exclusive_dutch_order_abi, bytes(data))
+    except (DecodingError, OverflowError, MemoryError):
+        assert decoded_order is None
+    else:
+        assert decoded_order is None or (decoded_order, ) == expected_decoded_order
+        assert ExclusiveDutchOrderDecoder().decode(bytes(data)) == expected_decoded_order
+
+
+@pytest.mark.parametrize(
+    "order",
+    (
+        (),
+        ((), 1, 2),
+        (("0x" + "00" * 20, ) * 5 + ("not bytes", ), 1, 2, "0x" + "00" * 20, 0, ("0x" + "00" * 20, 1, 2), ()),
+        (("0x" + "00" * 20, ) * 5 + (b"", ), -1, 2, "0x" + "00" * 20, 0, ("0x" + "00" * 20, 1, 2), ()),
+        (("0x" + "00" * 20, ) * 5 + (b"", ), 1, 2, "0x" + "00" * 19, 0, ("0x" + "00" * 20, 1, 2), ()),
+        (("0x" + "00" * 20, ) * 5 + (b"", ), True, 2, "0x" + "00" * 20, 0, ("0x" + "00" * 20, 1, 2), ()),
+    )
+)
+def test_fast_encoder_rejects_unsupported_values(order):
+    assert encode_exclusive_dutch_order(order) is None
+
+
+def test_exclusive_dutch_order_encoder_uses_fast_codec():
+    encoder = ExclusiveDutchOrderEncoder(1)
+    args = encoder._create_args(*order_4)
+    assert encoder.encode([args, ]) == encode(exclusive_dutch_order_abi, (args, ))
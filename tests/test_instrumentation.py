@@ -0,0 +1,175 @@
+import pytest
+from web3 import AsyncWeb3
+
+from tests.conftest import order_4
+from tests.test_api import (
+    OrdersAPIStandIn,
+    start_api,
+)
+from tests.test_resolver import (
+    encoded_order_1,
+    encoded_order_2,
+    QuoterStandInProvider,
+    signature_1,
+    signature_2,
+    standin_outcomes,
+)
+from uniswapx_sdk import instrumentation
+from uniswapx_sdk.address import address_cache
+from uniswapx_sdk.api import UniswapXAPI
+from uniswapx_sdk.constants import order_quoters
+from uniswapx_sdk.decoder import ExclusiveDutchOrderDecoder
+from uniswapx_sdk.encoder import ExclusiveDutchOrderEncoder
+from uniswapx_sdk.exceptions import ExpiredOrderError
+from uniswapx_sdk.instrumentation import (
+    ABI_ENCODE,
+    API_PARSE,
+    API_REQUEST,
+    CHECKSUM_ADDRESS,
+    DECODE,
+    EIP712_BUILD,
+    ERROR_MAPPING,
+    Histogram,
+    HistogramSink,
+    OpenTelemetrySink,
+    QUOTER_RPC,
+    Sink,
+)
+from uniswapx_sdk.resolver import OrderResolver
+
+
+@pytest.fixture
+def sink():
+    histogram_sink = HistogramSink()
+    previous = instrumentation.set_sink(histogram_sink)
+    try:
+        yield histogram_sink
+    finally:
+        instrumentation.set_sink(previous)
+
+
+def counts(sink):
+    return {stage: (histogram.count, histogram.error_count) for stage, histogram in sink.histograms.items()}
+
+
+def test_disabled_by_default():
+    assert instrumentation.get_sink() is None
+    ExclusiveDutchOrderDecoder().decode(encoded_order_2)
+    with instrumentation.timer(DECODE):
+        pass
+
+
+def test_encode_and_decode(sink):
+    address_cache.cache_clear()
+    encoder = ExclusiveDutchOrderEncoder(1)
+    encoded_order, _ = encoder.encode_order(*order_4)
+    encoder.encode_order(*order_4)
+    assert counts(sink) == {CHECKSUM_ADDRESS: (6, 0), ABI_ENCODE: (2, 0), EIP712_BUILD: (2, 0)}  # 6 distinct addresses
+
+    sink.reset()
+    decoder = ExclusiveDutchOrderDecoder()
+    decoder.decode(encoded_order)
+    list(decoder.decode_many([encoded_order, encoded_order]))
+    decoder.decode_lazy(encoded_order)
+    with pytest.raises(Exception):
+        decoder.decode(b"\x01")
+    assert counts(sink) == {DECODE: (5, 1)}
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_api(sink):
+    stand_in = OrdersAPIStandIn(5)
+    server = await start_api(stand_in)
+    try:
+        async with UniswapXAPI(1, orders_endpoint=str(server.make_url("/orders"))) as api:
+            await api.get_orders()
+            await api.get_orders_page()
+            api.orders_endpoint = str(server.make_url("/unknown"))
+            with pytest.raises(Exception):
+                await api.get_orders()
+    finally:
+        await server.close()
+    assert counts(sink) == {API_REQUEST: (3, 1), API_PARSE: (2, 0)}
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_resolve(sink):
+    resolver = OrderResolver(AsyncWeb3(QuoterStandInProvider(standin_outcomes)), 1, order_quoters[1])
+    await resolver.resolve(encoded_order_2, signature_2)
+    with pytest.raises(ExpiredOrderError):
+        await resolver.resolve(encoded_order_1, signature_1)
+    assert counts(sink)[QUOTER_RPC] == (2, 1)
+    assert counts(sink)[ERROR_MAPPING] == (1, 0)
+
+    sink.reset()
+    await resolver.resolve_many([(encoded_order_1, signature_1), (encoded_order_2, signature_2)])
+    assert counts(sink)[QUOTER_RPC] == (1, 0)
+    assert counts(sink)[ERROR_MAPPING] == (1, 0)
+
+
+def test_abstract_sink():
+    with pytest.raises(TypeError):
+        Sink()
+
+    class IncompleteSink(Sink):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteSink()
+
+
+def test_histogram():
+    histogram = Histogram((0.001, 0.01, 0.1))
+    assert (histogram.percentile(50), histogram.mean) == (0.0, 0.0)
+    for duration in (0.0005, 0.001, 0.005, 0.05, 1.0):
+        histogram.observe(duration)
+    histogram.observe(0.002, error=True)
+    assert histogram.bucket_counts == [2, 2, 1, 1]
+    assert (histogram.count, histogram.error_count) == (6, 1)
+    assert histogram.mean == pytest.approx(1.0585 / 6)
+    assert histogram.percentile(0) == histogram.percentile(33) == 0.001
+    assert histogram.percentile(50) == 0.01
+    assert histogram.percentile(100) == float("inf")
+    with pytest.raises(ValueError):
+        histogram.percentile(-1)
+
+
+def test_export_prometheus():
+    sink = HistogramSink((0.001, 0.01))
+    sink.record(DECODE, 0.0005)
+    sink.record(DECODE, 0.005, error=True)
+    sink.record(ABI_ENCODE, 0.5)
+    assert sink.export_prometheus("sdk").splitlines() == [
+        "# HELP sdk_stage_duration_seconds Duration of the SDK stages.",
+        "# TYPE sdk_stage_duration_seconds histogram",
+        'sdk_stage_duration_seconds_bucket{stage="abi_encode",le="0.001"} 0',
+        'sdk_stage_duration_seconds_bucket{stage="abi_encode",le="0.01"} 0',
+        'sdk_stage_duration_seconds_bucket{stage="abi_encode",le="+Inf"} 1',
+        'sdk_stage_duration_seconds_sum{stage="abi_encode"} 0.5',
+        'sdk_stage_duration_seconds_count{stage="abi_encode"} 1',
+        'sdk_stage_duration_seconds_bucket{stage="decode",le="0.001"} 1',
+        'sdk_stage_duration_seconds_bucket{stage="decode",le="0.01"} 2',
+        'sdk_stage_duration_seconds_bucket{stage="decode",le="+Inf"} 2',
+        'sdk_stage_duration_seconds_sum{stage="decode"} 0.0055',
+        'sdk_stage_duration_seconds_count{stage="decode"} 2',
+        "# HELP sdk_stage_errors_total Number of SDK stages which raised an exception.",
+        "# TYPE sdk_stage_errors_total counter",
+        'sdk_stage_errors_total{stage="abi_encode"} 0',
+        'sdk_stage_errors_total{stage="decode"} 1',
+    ]
+
+
+def test_open_telemetry_sink():
+    class Meter:
+        def create_histogram(self, name, unit, description):
+            self.name, self.unit = name, unit
+            return self
+
+        def record(self, amount, attributes):
+            self.recorded = (amount, attributes)
+
+    meter = Meter()
+    sink = OpenTelemetrySink(meter)
+    sink.record(DECODE, 0.25, error=True)
+    assert (meter.name, meter.unit) == ("uniswapx_sdk.stage.duration", "s")
+    assert meter.recorded == (0.25, {"stage": DECODE, "error": True})
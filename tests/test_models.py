@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from uniswapx_sdk.api import UniswapXAPI
+from uniswapx_sdk.decoder import ExclusiveDutchOrderDecoder
+from uniswapx_sdk.models import (
+    APIOrder,
+    json_loads,
+    OrdersPage,
+)
+
+from .test_api import (
+    order_1,
+    OrdersAPIStandIn,
+    start_api,
+)
+
+
+def test_api_order():
+    order = APIOrder.from_dict(order_1)
+    assert order.order_hash == order_1["orderHash"]
+    assert order.order_status == "filled"
+    assert order.encoded_order == bytes.fromhex(order_1["encodedOrder"][2:])
+    assert order.signature == bytes.fromhex(order_1["signature"][2:])
+    assert (order.chain_id, order.created_at, order.order_type) == (1, 1685112945, "DutchLimit")
+    assert order.tx_hash == order_1["txHash"]
+    assert not hasattr(order, "__dict__")
+
+    expected_order = ExclusiveDutchOrderDecoder().decode(order_1["encodedOrder"])[0]
+    assert order.decoded_order is order.decoded_order
+    assert order.decoded_order.to_tuple() == expected_order
+    assert order.decode() == expected_order
+    assert order == APIOrder.from_dict(order_1)
+    assert order != APIOrder.from_dict(dict(order_1, orderStatus="open"))
+    assert order != APIOrder.from_dict(dict(order_1, settledAmounts=[]))
+
+    # the unmapped fields are kept as is
+    assert order.extra == {name: order_1[name] for name in ("outputs", "input", "settledAmounts")}
+    assert APIOrder("0x02", "open", b"", b"").extra == {}
+
+
+def test_orders_page():
+    body = json.dumps({"orders": [order_1, dict(order_1, orderHash="0x01")], "cursor": "abc"})
+    for data in (body, body.encode()):
+        page = OrdersPage.from_json(data)
+        assert len(page) == 2
+        assert page.cursor == "abc"
+        assert page.orders[1].order_hash == "0x01"
+        assert page.orders[1].extra["settledAmounts"] == order_1["settledAmounts"]
+    assert json_loads(body) == json.loads(body)
+
+    page = OrdersPage.from_dict({"orders": [{"orderHash": "0x02", "orderStatus": "open"}]})
+    assert page.cursor is None
+    assert (page.orders[0].encoded_order, page.orders[0].signature) == (b"", b"")
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_get_orders_page():
+    stand_in = OrdersAPIStandIn(5)
+    server = await start_api(stand_in)
+    try:
+        async with UniswapXAPI(1, orders_endpoint=str(server.make_url("/orders"))) as api:
+            page = await api.get_orders_page("open", limit=3)
+    finally:
+        await server.close()
+    assert [order.order_hash for order in page.orders] == ["0x0", "0x1", "0x2"]
+    assert page.cursor == "3"
@@ -0,0 +1,204 @@
+from eth_abi import (
+    decode,
+    encode,
+)
+from eth_utils import to_bytes
+import pytest
+from web3 import AsyncWeb3
+from web3.providers.async_base import AsyncBaseProvider
+from web3.types import HexBytes
+
+from uniswapx_sdk.constants import (
+    multicall3_address,
+    permit2_address,
+)
+from uniswapx_sdk.exceptions import (
+    ExpiredOrderError,
+    NonceUsedError,
+)
+from uniswapx_sdk.nonces import (
+    fill_topic,
+    NonceBitmapIndex,
+    split_nonce,
+    unordered_nonce_invalidation_topic,
+)
+from uniswapx_sdk.resolver import OrderResolver
+
+from .test_resolver import (
+    encoded_order_1,
+    encoded_order_2,
+    QuoterStandInProvider,
+    resolved_order_2,
+    signature_1,
+    signature_2,
+    standin_outcomes,
+)
+
+
+swapper_2 = resolved_order_2[0][1]
+nonce_2 = resolved_order_2[0][2]
+
+
+class Permit2StandInProvider(AsyncBaseProvider):
+    """
+    Local stand-in for a node with Multicall3 and Permit2 deployed, with predefined nonceBitmap words.
+    """
+    def __init__(self, bitmaps, permit2=permit2_address):
+        super().__init__()
+        self.bitmaps = bitmaps
+        self.permit2 = permit2
+        self.eth_calls = 0
+
+    async def is_connected(self, show_traceback=False):
+        return True
+
+    async def make_request(self, method, params):
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(1)}
+        assert method == "eth_call"
+        assert params[0]["to"] == multicall3_address
+        self.eth_calls += 1
+        _, calls = decode(["bool", "(address,bytes)[]"], to_bytes(hexstr=params[0]["data"])[4:])
+        results = []
+        for target, call_data in calls:
+            assert target == self.permit2.lower()
+            assert call_data[:4] == bytes.fromhex("4fe02b44")
+            owner, word_pos = decode(["address", "uint256"], call_data[4:])
+            results.append((True, encode(["uint256"], [self.bitmaps.get((owner, word_pos), 0)])))
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x" + encode(["(bool,bytes)[]"], [results]).hex()}
+
+
+def test_split_nonce():
+    assert split_nonce(0) == (0, 0)
+    assert split_nonce(255) == (0, 255)
+    assert split_nonce(256) == (1, 0)
+    assert split_nonce(nonce_2) == (nonce_2 >> 8, nonce_2 % 256)
+
+
+def test_mark_used():
+    index = NonceBitmapIndex()
+    assert not index.is_used(swapper_2, nonce_2)
+    index.mark_used(swapper_2, nonce_2)
+    assert index.is_used(swapper_2, nonce_2)
+    assert index.is_used(swapper_2.lower(), nonce_2)
+    assert index.is_used(to_bytes(hexstr=swapper_2), nonce_2)
+    assert not index.is_used(swapper_2, nonce_2 + 1)
+    assert not index.is_used("0x" + "00" * 20, nonce_2)
+
+    index.set_word(swapper_2, split_nonce(nonce_2)[0], 0)  # words are merged
+    assert index.is_used(swapper_2, nonce_2)
+    assert (len(index), index.word_count()) == (1, 1)
+
+    with pytest.raises(NonceUsedError):
+        index.check(encoded_order_2)
+    index.check(encoded_order_1)
+
+    index.remove_swapper(swapper_2)
+    assert len(index) == 0
+    index.check(encoded_order_2)
+
+
+reactor = "0x6000da47483062A0D734Ba3dc7576Ce6A0B645C4"
+foreign_address = "0x" + "44" * 20
+
+
+def nonce_logs(permit2=permit2_address, fill_emitter=reactor):
+    owner_topic = HexBytes(encode(["address"], [swapper_2]))
+    return [
+        {
+            "address": permit2,
+            "topics": [HexBytes(unordered_nonce_invalidation_topic), owner_topic],
+            "data": HexBytes(encode(["uint256", "uint256"], [7, 0b101])),
+        },
+        {
+            "address": fill_emitter,
+            "topics": ["0x" + fill_topic.hex(), "0x" + "11" * 32, "0x" + "22" * 32, "0x" + bytes(owner_topic).hex()],
+            "data": "0x" + encode(["uint256"], [nonce_2]).hex(),
+        },
+    ]
+
+
+def test_process_logs():
+    index = NonceBitmapIndex(reactors=[reactor.lower()])
+    logs = nonce_logs() + [
+        {"address": reactor, "topics": [HexBytes("0x" + "33" * 32)], "data": HexBytes(b"")},
+        {"address": reactor, "topics": [], "data": HexBytes(b"")},
+    ]
+    assert index.process_logs(logs) == 2
+    assert index.is_used(swapper_2, 7 * 256)
+    assert not index.is_used(swapper_2, 7 * 256 + 1)
+    assert index.is_used(swapper_2, 7 * 256 + 2)
+    assert index.is_used(swapper_2, nonce_2)
+
+
+@pytest.mark.parametrize(
+    "index, logs",
+    (
+        (NonceBitmapIndex(reactors=[reactor]), nonce_logs(permit2=foreign_address, fill_emitter=foreign_address)),
+        (NonceBitmapIndex(reactors=[reactor]), nonce_logs(permit2=reactor, fill_emitter=permit2_address)),
+        (NonceBitmapIndex(), nonce_logs()[1:]),  # no reactor given
+        (NonceBitmapIndex(reactors=[reactor], permit2=foreign_address), nonce_logs()[:1]),
+        (NonceBitmapIndex(reactors=[reactor]), [{k: v for k, v in log.items() if k != "address"} for log in nonce_logs()]),  # noqa
+    ),
+)
+def test_process_logs_from_foreign_emitter(index, logs):
+    assert index.process_logs(logs) == 0
+    assert len(index) == 0
+
+
+def test_process_logs_from_bytes_emitter():
+    index = NonceBitmapIndex(reactors=[to_bytes(hexstr=reactor)])
+    assert index.process_logs(nonce_logs(to_bytes(hexstr=permit2_address), to_bytes(hexstr=reactor))) == 2
+
+
+@pytest.mark.asyncio(scope="session")
+@pytest.mark.parametrize("batch_size, expected_eth_calls", ((500, 1), (1, 2)))
+async def test_fetch_for_orders(batch_size, expected_eth_calls):
+    word_pos, bit_pos = split_nonce(nonce_2)
+    provider = Permit2StandInProvider({(swapper_2.lower(), word_pos): 1 << bit_pos})
+    index = NonceBitmapIndex()
+    await index.fetch_for_orders(
+        AsyncWeb3(provider), [encoded_order_1, encoded_order_2, encoded_order_2], batch_size=batch_size
+    )
+    assert provider.eth_calls == expected_eth_calls
+    assert index.word_count() == 2
+    assert index.is_used(swapper_2, nonce_2)
+
+    # words already in the index are not fetched again
+    await index.fetch_for_orders(AsyncWeb3(provider), [encoded_order_1, encoded_order_2])
+    assert provider.eth_calls == expected_eth_calls
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_fetch_from_configured_permit2():
+    word_pos, bit_pos = split_nonce(nonce_2)
+    custom_permit2 = "0x" + "ab" * 20
+    provider = Permit2StandInProvider({(swapper_2.lower(), word_pos): 1 << bit_pos}, permit2=custom_permit2)
+    index = NonceBitmapIndex(permit2=to_bytes(hexstr=custom_permit2))
+    await index.fetch_for_orders(AsyncWeb3(provider), [encoded_order_2])
+    assert provider.eth_calls == 1
+    assert index.is_used(swapper_2, nonce_2)
+
+    # the default Permit2 is not queried
+    with pytest.raises(AssertionError):
+        await NonceBitmapIndex().fetch_for_orders(AsyncWeb3(provider), [encoded_order_2])
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_resolver_with_nonce_index():
+    index = NonceBitmapIndex()
+    index.mark_used(swapper_2, nonce_2)
+    provider = QuoterStandInProvider(standin_outcomes)
+    resolver = await OrderResolver.create(w3=AsyncWeb3(provider), nonce_index=index)
+
+    with pytest.raises(NonceUsedError):
+        await resolver.resolve(encoded_order_2, signature_2)
+    assert not [method for method, _ in provider.requests if method == "eth_call"]
+
+    results = await resolver.resolve_many([(encoded_order_1, signature_1), (encoded_order_2, signature_2)])
+    assert isinstance(results[0], ExpiredOrderError)
+    assert isinstance(results[1], NonceUsedError)
+    eth_calls = [params for method, params in provider.requests if method == "eth_call"]
+    assert len(eth_calls) == 1
+    _, calls = decode(["bool", "(address,bytes)[]"], to_bytes(hexstr=eth_calls[0][0]["data"])[4:])
+    assert len(calls) == 1
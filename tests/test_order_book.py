@@ -0,0 +1,105 @@
+import pytest
+
+from uniswapx_sdk.decoder import ExclusiveDutchOrderDecoder
+from uniswapx_sdk.order_book import OrderBook
+
+from .test_decay import build_order
+from .test_resolver import (
+    encoded_order_2,
+    encoded_order_3,
+)
+
+
+decoder = ExclusiveDutchOrderDecoder()
+weth = "0x" + "33" * 20
+usdc = "0x" + "44" * 20
+filler = "0x" + "55" * 20
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def order(deadline, input_token=weth, output_tokens=(usdc, ), exclusive_filler="0x" + "00" * 20):
+    order = build_order(0, 10, (1, 1), [(1, 1)] * len(output_tokens), exclusive_filler, deadline=deadline)
+    return (order[0], *order[1:5], (input_token, 1, 1), tuple((token, 1, 1, order[0][1]) for token in output_tokens))
+
+
+def test_add_and_lookups():
+    clock = Clock(100)
+    book = OrderBook(clock)
+    entry = book.add("0xA1", order(200), payload="sig")
+    book.add("0xa2", order(300, output_tokens=(usdc, weth), exclusive_filler=filler))
+    book.add("0xa3", order(300, input_token=usdc, output_tokens=(weth, )))
+
+    assert len(book) == 3
+    assert "0xa1" in book and "0XA1".lower() in book
+    assert book.get("0xa1") == entry
+    assert (entry.payload, entry.deadline, entry.exclusive_filler) == ("sig", 200, None)
+    assert sorted(e.order_hash for e in book.by_pair(weth.upper().replace("0X", "0x"), usdc)) == ["0xa1", "0xa2"]
+    assert [e.order_hash for e in book.by_pair(weth, weth)] == ["0xa2"]
+    assert [e.order_hash for e in book.by_pair(usdc, weth)] == ["0xa3"]
+    assert book.by_pair(usdc, usdc) == []
+    assert [e.order_hash for e in book.by_exclusive_filler(filler)] == ["0xa2"]
+    assert len(book.by_swapper("0x" + "22" * 20)) == 3
+    assert sorted(book.pairs()) == sorted([(weth, usdc), (weth, weth), (usdc, weth)])
+
+    assert book.remove("0xa2").order_hash == "0xa2"
+    assert book.remove("0xa2") is None
+    assert book.by_exclusive_filler(filler) == []
+    assert book.by_pair(weth, weth) == []
+    assert [e.order_hash for e in book] == ["0xa1", "0xa3"]
+
+    book.clear()
+    assert len(book) == 0 and book.next_deadline() is None
+
+
+def test_lazy_orders():
+    book = OrderBook(Clock(0))
+    order_2 = decoder.decode(encoded_order_2)[0]
+    lazy_entry = book.add("0x02", decoder.decode_lazy(encoded_order_2))
+    entry = book.add("0x03", decoder.decode(encoded_order_3)[0])
+    assert book.add("0x04", order(10 ** 10)).exclusive_filler is None
+    assert lazy_entry[2:] == OrderBook(Clock(0)).add("0x02", order_2)[2:]
+    assert lazy_entry.exclusive_filler == order_2[3].lower()
+    assert lazy_entry.deadline == order_2[0][3]
+    assert entry.exclusive_filler == decoder.decode(encoded_order_3)[0][3].lower()
+    assert book.by_pair(order_2[5][0], order_2[6][0][0]) == [lazy_entry]
+
+
+def test_deadline_eviction():
+    clock = Clock(100)
+    book = OrderBook(clock)
+    book.add("0xa1", order(150))
+    book.add("0xa2", order(120))
+    book.add("0xa3", order(200))
+    assert book.add("0xa4", order(99)) is None
+    assert book.next_deadline() == 120
+
+    # replacing an order updates its deadline
+    book.add("0xa2", order(300))
+    assert book.next_deadline() == 150
+
+    clock.now = 160
+    assert sorted(e.order_hash for e in book.by_pair(weth, usdc)) == ["0xa2", "0xa3"]
+    assert "0xa1" not in book
+    assert book.next_deadline() == 200
+    assert [e.order_hash for e in book.evict_expired(250)] == ["0xa3"]
+    assert len(book) == 1
+
+    clock.now = 301
+    assert len(book) == 0
+
+
+@pytest.mark.parametrize("order_count", (5000, ))
+def test_heap_compaction(order_count):
+    book = OrderBook(Clock(0))
+    for i in range(order_count):
+        book.add(hex(i), order(1000 + i))
+        book.remove(hex(i))
+    assert len(book._deadlines) <= 1024 + 1
+    assert book.next_deadline() is None
@@ -0,0 +1,54 @@
+from eth_utils import to_bytes
+import pytest
+
+from tests.test_encoder import (
+    expected_encoded_order_1,
+    order_1,
+)
+from tests.test_resolver import (
+    encoded_order_1,
+    encoded_order_2,
+    resolved_order_2,
+)
+from uniswapx_sdk.encoder import ExclusiveDutchOrderEncoder
+from uniswapx_sdk.order_hash import (
+    compute_order_hash,
+    OrderDeduplicator,
+)
+
+
+@pytest.mark.parametrize(
+    "encoded_order, expected_order_hash",
+    (
+        (encoded_order_2, resolved_order_2[-1]),
+        (to_bytes(hexstr=encoded_order_2), resolved_order_2[-1]),
+        (expected_encoded_order_1, to_bytes(hexstr="0xd1a982a611fc9dcd1230226140f22100994d769b2e01036dd8b3473ded7a3529")),  # noqa
+        (ExclusiveDutchOrderEncoder(1).encode_order(*order_1)[0], to_bytes(hexstr="0xd1a982a611fc9dcd1230226140f22100994d769b2e01036dd8b3473ded7a3529")),  # noqa
+    )
+)
+def test_compute_order_hash(encoded_order, expected_order_hash):
+    assert compute_order_hash(encoded_order) == expected_order_hash
+
+
+def test_order_deduplicator():
+    deduplicator = OrderDeduplicator()
+    assert deduplicator.add(encoded_order_2)
+    assert not deduplicator.add(to_bytes(hexstr=encoded_order_2))
+    assert resolved_order_2[-1] in deduplicator
+    assert "0x" + resolved_order_2[-1].hex() in deduplicator
+    assert list(deduplicator.filter_new([encoded_order_1, encoded_order_2, encoded_order_1])) == [encoded_order_1]
+    assert len(deduplicator) == 2
+
+    deduplicator.clear()
+    assert len(deduplicator) == 0
+
+
+def test_bounded_order_deduplicator():
+    deduplicator = OrderDeduplicator(max_size=1)
+    assert deduplicator.add(encoded_order_1)
+    assert deduplicator.add(encoded_order_2)
+    assert len(deduplicator) == 1
+    assert deduplicator.add(encoded_order_1)
+
+    with pytest.raises(ValueError):
+        OrderDeduplicator(max_size=0)
@@ -0,0 +1,165 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from eth_abi import decode
+from eth_utils import to_bytes
+import pytest
+from web3 import AsyncWeb3
+
+from uniswapx_sdk.constants import order_quoters
+from uniswapx_sdk.exceptions import (
+    ExpiredOrderError,
+    InsufficientFundsError,
+)
+from uniswapx_sdk.providers import BatchingAsyncHTTPProvider
+from uniswapx_sdk.resolver import OrderResolver
+
+from .test_resolver import (
+    encoded_order_1,
+    encoded_order_2,
+    encoded_order_3,
+    resolved_order_2,
+    signature_1,
+    signature_2,
+    signature_3,
+    standin_outcomes,
+)
+
+
+class QuoterStandInNode:
+    """
+    Local HTTP stand-in for a node with the OrderQuoter deployed, recording the size of each received POST.
+    """
+    def __init__(self, batch_support=True):
+        self.batch_support = batch_support
+        self.post_sizes = []
+
+    async def handle(self, request):
+        payload = await request.json()
+        if isinstance(payload, list):
+            self.post_sizes.append(len(payload))
+            if not self.batch_support:
+                return web.json_response({"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "no batch"}})  # noqa
+            return web.json_response([self.respond(rpc_request) for rpc_request in payload])
+        self.post_sizes.append(1)
+        return web.json_response(self.respond(payload))
+
+    @staticmethod
+    def respond(rpc_request):
+        response = {"jsonrpc": "2.0", "id": rpc_request["id"]}
+        if rpc_request["method"] == "eth_chainId":
+            response["result"] = hex(1)
+        elif rpc_request["method"] == "eth_call":
+            transaction = rpc_request["params"][0]
+            assert transaction["to"].lower() == order_quoters[1].lower()
+            order, _ = decode(["bytes", "bytes"], to_bytes(hexstr=transaction["data"])[4:])
+            success, return_data = standin_outcomes[order]
+            if success:
+                response["result"] = "0x" + return_data.hex()
+            elif return_data[:4] == bytes.fromhex("08c379a0"):
+                reason = decode(["string"], return_data[4:])[0]
+                response["error"] = {"code": 3, "message": f"execution reverted: {reason}", "data": "0x" + return_data.hex()}  # noqa
+            else:
+                response["error"] = {"code": 3, "message": "execution reverted", "data": "0x" + return_data.hex()}
+        else:
+            response["error"] = {"code": -32601, "message": "method not found"}
+        return response
+
+
+async def start_node(node):
+    app = web.Application()
+    app.router.add_post("/", node.handle)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+orders = (
+    (encoded_order_1, signature_1),
+    (encoded_order_2, signature_2),
+    (encoded_order_3, signature_3),
+) * 2
+
+
+@pytest.mark.asyncio(scope="session")
+@pytest.mark.parametrize("max_batch_size, expected_post_sizes", ((100, [1, 6]), (4, [1, 4, 2]), (1, [1] * 7)))
+async def test_batched_resolve(max_batch_size, expected_post_sizes):
+    node = QuoterStandInNode()
+    server = await start_node(node)
+    try:
+        resolver = await OrderResolver.create(
+            rpc_endpoint=str(server.make_url("/")), batch_window=0.05, max_batch_size=max_batch_size
+        )
+        results = await asyncio.gather(
+            *(resolver.resolve(encoded_order, signature) for encoded_order, signature in orders),
+            return_exceptions=True,
+        )
+    finally:
+        await resolver._w3.provider.disconnect()
+        await server.close()
+
+    for i in (0, 3):
+        assert isinstance(results[i], ExpiredOrderError)
+        assert results[i + 1] == resolved_order_2
+        assert isinstance(results[i + 2], InsufficientFundsError)
+    assert node.post_sizes == expected_post_sizes
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_batch_rejected_by_node():
+    node = QuoterStandInNode(batch_support=False)
+    server = await start_node(node)
+    provider = BatchingAsyncHTTPProvider(str(server.make_url("/")), batch_window=0.05)
+    try:
+        resolver = await OrderResolver.create(w3=AsyncWeb3(provider))
+        results = await asyncio.gather(
+            *(resolver.resolve(encoded_order, signature) for encoded_order, signature in orders[:2]),
+            return_exceptions=True,
+        )
+    finally:
+        await provider.disconnect()
+        await server.close()
+
+    assert node.post_sizes == [1, 2]
+    assert all(isinstance(result, ValueError) and "no batch" in str(result) for result in results)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_batch_transport_error():
+    provider = BatchingAsyncHTTPProvider("http://127.0.0.1:1", batch_window=0.01)
+    results = await asyncio.gather(
+        provider.make_request("eth_call", [{}, "latest"]),
+        provider.make_request("eth_call", [{}, "latest"]),
+        return_exceptions=True,
+    )
+    await provider.disconnect()
+    assert all(isinstance(result, Exception) for result in results)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_chain_id_cache():
+    node = QuoterStandInNode()
+    server = await start_node(node)
+    try:
+        provider = BatchingAsyncHTTPProvider(str(server.make_url("/")))
+        for _ in range(2):
+            assert (await provider.make_request("eth_chainId", []))["result"] == "0x1"
+        assert node.post_sizes == [1]
+
+        provider.clear_chain_id()
+        await provider.make_request("eth_chainId", [])
+        assert node.post_sizes == [1, 1]
+
+        provider.endpoint_uri = str(server.make_url("/"))
+        await provider.make_request("eth_chainId", [])
+        assert node.post_sizes == [1, 1, 1]
+    finally:
+        await provider.disconnect()
+        await server.close()
+
+
+@pytest.mark.parametrize("batch_window, max_batch_size", ((-1, 100), (0.01, 0)))
+def test_invalid_batching_parameters(batch_window, max_batch_size):
+    with pytest.raises(ValueError):
+        BatchingAsyncHTTPProvider("http://127.0.0.1:8545", batch_window, max_batch_size)
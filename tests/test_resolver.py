@@ -1,12 +1,34 @@
+import asyncio
 import os
+import traceback
 
+from eth_abi import (
+    decode,
+    encode,
+)
 from eth_utils import to_bytes
 import pytest
 from web3 import AsyncWeb3
+from web3.exceptions import ContractLogicError
+from web3.providers.async_base import AsyncBaseProvider
 from web3.types import HexStr
 
-from uniswapx_sdk.exceptions import order_validation_exceptions
-from uniswapx_sdk.resolver import OrderResolver
+from uniswapx_sdk.constants import (
+    multicall3_address,
+    order_quoters,
+    resolved_order_abi,
+)
+from uniswapx_sdk.exceptions import (
+    ExpiredOrderError,
+    InsufficientFundsError,
+    InvalidSignatureError,
+    order_validation_exceptions,
+    OrderValidationError,
+)
+from uniswapx_sdk.resolver import (
+    OrderResolver,
+    ResolveCache,
+)
 
 
 encoded_order_1 = HexStr("0x0000000000000000000000000000000000000000000000000000000000000020000000000000000000000000000000000000000000000000000000000000012000000000000000000000000000000000000000000000000000000000658809c90000000000000000000000000000000000000000000000000000000065880a050000000000000000000000002008b6c3d07b061a84f790c035c2f6dc11a0be700000000000000000000000000000000000000000000000000000000000000064000000000000000000000000dac17f958d2ee523a2206206994597c13d831ec7000000000000000000000000000000000000000000000000000000006c5274a2000000000000000000000000000000000000000000000000000000006c5274a200000000000000000000000000000000000000000000000000000000000002000000000000000000000000006000da47483062a0d734ba3dc7576ce6a0b645c4000000000000000000000000033f50fdfce0dfb6aadbca89221d002b003436dd046832f6e4287ab217c8b0c0301573edcef40afca419cc0b9902b6cea83219000000000000000000000000000000000000000000000000000000000065880a11000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000c000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000002000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc20000000000000000000000000000000000000000000000000af7af81daf163570000000000000000000000000000000000000000000000000ace07c1c27dfa28000000000000000000000000033f50fdfce0dfb6aadbca89221d002b003436dd000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2000000000000000000000000000000000000000000000000000437c55ad5296d000000000000000000000000000000000000000000000000000427c052b845fb00000000000000000000000037a8f295612602f2774d331e562be9e61b83a327")  # noqa
@@ -56,3 +78,208 @@ async def test_order_resolver_creation():
 
     with pytest.raises(ValueError):
         _ = await OrderResolver.create()
+
+
+class QuoterStandInProvider(AsyncBaseProvider):
+    """
+    Local stand-in for a node with Multicall3 and the OrderQuoter deployed: each quote() returns a predefined outcome.
+    """
+    def __init__(self, outcomes, block_number=18868690):
+        super().__init__()
+        self.outcomes = outcomes
+        self.block_number = block_number
+        self.requests = []
+
+    async def is_connected(self, show_traceback=False):
+        return True
+
+    async def make_request(self, method, params):
+        self.requests.append((method, params))
+        if method == "eth_chainId":
+            result = hex(1)
+        elif method == "eth_blockNumber":
+            result = hex(self.block_number)
+        elif method == "eth_call" and params[0]["to"] == multicall3_address:
+            result = self.try_aggregate(params[0])
+        elif method == "eth_call":
+            success, result = self.quote(params[0])
+            if not success:
+                return {"jsonrpc": "2.0", "id": 1, "error": {"code": 3, "message": "execution reverted", "data": result}}  # noqa
+        else:
+            raise NotImplementedError(method)
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+    def quote(self, transaction):
+        assert transaction["to"] == order_quoters[1]
+        order, _ = decode(["bytes", "bytes"], to_bytes(hexstr=transaction["data"])[4:])
+        success, return_data = self.outcomes[order]
+        return success, "0x" + return_data.hex()
+
+    def try_aggregate(self, transaction):
+        assert transaction["to"] == multicall3_address
+        require_success, calls = decode(["bool", "(address,bytes)[]"], to_bytes(hexstr=transaction["data"])[4:])
+        assert not require_success
+        results = []
+        for target, call_data in calls:
+            assert target == order_quoters[1].lower()
+            order, _ = decode(["bytes", "bytes"], call_data[4:])
+            results.append(self.outcomes[order])
+        return "0x" + encode(["(bool,bytes)[]"], [results]).hex()
+
+
+class SlowQuoterStandInProvider(QuoterStandInProvider):
+    """
+    Same as QuoterStandInProvider, with slow eth_call requests, so that concurrent calls overlap.
+    """
+    async def make_request(self, method, params):
+        if method == "eth_call":
+            await asyncio.sleep(0.01)
+        return await super().make_request(method, params)
+
+
+def revert_with_reason(reason):
+    return False, bytes.fromhex("08c379a0") + encode(["string"], [reason])
+
+
+standin_outcomes = {
+    to_bytes(hexstr=encoded_order_1): (False, bytes.fromhex("70f65caa")),
+    to_bytes(hexstr=encoded_order_2): (True, encode(resolved_order_abi, [resolved_order_2])),
+    to_bytes(hexstr=encoded_order_3): revert_with_reason("TRANSFER_FROM_FAILED"),
+    to_bytes(hexstr=encoded_order_4): (False, bytes.fromhex("8baa579f")),
+    b"unknown custom error": (False, bytes.fromhex("deadbeef")),
+    b"other revert reason": revert_with_reason("OTHER"),
+}
+
+
+@pytest.mark.asyncio(scope="session")
+@pytest.mark.parametrize("batch_size, expected_eth_calls", ((100, 1), (4, 2), (1, 6)))
+async def test_resolve_many(batch_size, expected_eth_calls):
+    provider = QuoterStandInProvider(standin_outcomes)
+    resolver = await OrderResolver.create(w3=AsyncWeb3(provider))
+    orders = [
+        (encoded_order_1, signature_1),
+        (encoded_order_2, signature_2),
+        (to_bytes(hexstr=encoded_order_3), to_bytes(hexstr=signature_3)),
+        (encoded_order_4, signature_4),
+        (HexStr("0x" + b"unknown custom error".hex()), signature_4),
+        (HexStr("0x" + b"other revert reason".hex()), signature_4),
+    ]
+    results = await resolver.resolve_many(orders, batch_size=batch_size)
+
+    assert len(results) == len(orders)
+    assert isinstance(results[0], ExpiredOrderError)
+    assert results[1] == resolved_order_2
+    assert isinstance(results[2], InsufficientFundsError)
+    assert isinstance(results[3], InvalidSignatureError)
+    assert type(results[4]) is OrderValidationError
+    assert isinstance(results[5], ContractLogicError)
+    assert results[5].message == "execution reverted: OTHER"
+
+    eth_calls = [params for method, params in provider.requests if method == "eth_call"]
+    assert len(eth_calls) == expected_eth_calls
+    expected_block = hex(18868690) if expected_eth_calls > 1 else "latest"
+    assert all(params[1] == expected_block for params in eth_calls)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_resolve_many_invalid_batch_size():
+    resolver = await OrderResolver.create(w3=AsyncWeb3(QuoterStandInProvider(standin_outcomes)))
+    with pytest.raises(ValueError):
+        await resolver.resolve_many([(encoded_order_2, signature_2)], batch_size=0)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_resolve_cache():
+    provider = QuoterStandInProvider(standin_outcomes)
+    resolver = await OrderResolver.create(w3=AsyncWeb3(provider), cache_size=2, block_number_ttl=0)
+
+    def eth_calls():
+        return [params for method, params in provider.requests if method == "eth_call"]
+
+    for _ in range(3):
+        assert await resolver.resolve(encoded_order_2, signature_2) == resolved_order_2
+        with pytest.raises(ExpiredOrderError):
+            await resolver.resolve(encoded_order_1, signature_1)
+    assert len(eth_calls()) == 2
+    assert all(params[1] == hex(18868690) for params in eth_calls())
+    assert resolver.cache.cache_info() == (4, 2, 2, 2, 18868690)
+
+    # same order with another signature or at another block: not the same outcome
+    with pytest.raises(ExpiredOrderError):
+        await resolver.resolve(encoded_order_1, signature_2)
+    await resolver.resolve(encoded_order_2, signature_2, block_identifier=18868600)
+    assert len(eth_calls()) == 4
+    assert resolver.cache.cache_info().size == 2  # LRU eviction
+
+    # a new block invalidates the previous outcomes
+    provider.block_number += 1
+    assert await resolver.resolve(encoded_order_2, signature_2) == resolved_order_2
+    assert len(eth_calls()) == 5
+    assert eth_calls()[-1][1] == hex(18868691)
+    assert resolver.cache.cache_info() == (4, 5, 2, 1, 18868691)
+
+    # non cacheable block identifiers are passed through
+    await resolver.resolve(encoded_order_2, signature_2, block_identifier="pending")
+    assert eth_calls()[-1][1] == "pending"
+    assert resolver.cache.cache_info().misses == 5
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_resolve_cache_fresh_exceptions():
+    resolver = await OrderResolver.create(w3=AsyncWeb3(QuoterStandInProvider(standin_outcomes)), cache_size=2)
+    errors = []
+    for _ in range(10):
+        with pytest.raises(ExpiredOrderError) as e:
+            await resolver.resolve(encoded_order_1, signature_1)
+        errors.append(e.value)
+    assert len(set(map(id, errors))) == len(errors)
+    assert all(error.data == "0x70f65caa" for error in errors)
+    assert len(traceback.extract_tb(errors[-1].__traceback__)) == len(traceback.extract_tb(errors[1].__traceback__))
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_resolve_cache_block_number():
+    provider = SlowQuoterStandInProvider(standin_outcomes)
+    resolver = await OrderResolver.create(w3=AsyncWeb3(provider), cache_size=2, block_number_ttl=60)
+
+    def requests(method):
+        return [params for request_method, params in provider.requests if request_method == method]
+
+    await asyncio.gather(*(resolver.resolve(encoded_order_2, signature_2) for _ in range(5)))
+    for _ in range(5):
+        await resolver.resolve(encoded_order_2, signature_2)
+    assert len(requests("eth_blockNumber")) == 1  # reused within block_number_ttl
+    assert len(requests("eth_call")) == 1  # the concurrent misses share a single quote
+    assert resolver.cache.cache_info() == (5, 5, 2, 1, 18868690)
+
+    # moved to a new block, ex: from a new block header subscription
+    resolver.cache.new_block(18868691)
+    await resolver.resolve(encoded_order_2, signature_2)
+    assert len(requests("eth_blockNumber")) == 1
+    assert requests("eth_call")[-1][1] == hex(18868691)
+
+    # an explicit block number moves the cache too
+    await resolver.resolve(encoded_order_2, signature_2, block_identifier=18868692)
+    assert resolver.cache.cache_info().block_number == 18868692
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_resolve_cache_concurrent_errors():
+    provider = SlowQuoterStandInProvider(standin_outcomes)
+    resolver = await OrderResolver.create(w3=AsyncWeb3(provider), cache_size=2)
+    results = await asyncio.gather(
+        *(resolver.resolve(encoded_order_1, signature_1) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, ExpiredOrderError) for result in results)
+    assert len(set(map(id, results))) == 3
+    assert len([method for method, _ in provider.requests if method == "eth_call"]) == 1
+
+
+def test_resolve_cache_invalid_size():
+    with pytest.raises(ValueError):
+        ResolveCache(0)
+
+
+def test_invalid_block_number_ttl():
+    with pytest.raises(ValueError):
+        OrderResolver(AsyncWeb3(QuoterStandInProvider(standin_outcomes)), 1, order_quoters[1], block_number_ttl=-1)
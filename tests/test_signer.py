@@ -0,0 +1,203 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+from eth_abi import decode
+from eth_utils import to_bytes
+import pytest
+from web3 import AsyncWeb3
+from web3.exceptions import ContractLogicError
+
+from tests.conftest import (
+    order_4,
+    wallet,
+)
+from tests.test_encoder import order_1
+from tests.test_resolver import (
+    encoded_order_1,
+    encoded_order_2,
+    encoded_order_3,
+    encoded_order_4,
+    QuoterStandInProvider,
+    resolved_order_2,
+    signature_1,
+    signature_2,
+    signature_3,
+    signature_4,
+    standin_outcomes,
+)
+from uniswapx_sdk.encoder import (
+    ExclusiveDutchOrder,
+    ExclusiveDutchOrderEncoder,
+)
+from uniswapx_sdk.exceptions import InvalidSignatureError
+from uniswapx_sdk.resolver import OrderResolver
+from uniswapx_sdk.signer import (
+    _async_map_chunks,
+    async_encode_and_sign_many,
+    async_verify_signatures_many,
+    encode_and_sign_many,
+    recover_swapper,
+    SignedOrder,
+    verify_signatures,
+    verify_signatures_many,
+)
+
+
+orders = [ExclusiveDutchOrder.from_dataclasses(*order) for order in (order_1, order_4) * 5]
+
+
+def expected_signed_orders(chain_id):
+    encoder = ExclusiveDutchOrderEncoder(chain_id)
+    result = []
+    for order in orders:
+        encoded_order, signable_message = encoder.encode_compact_order(order)
+        signature = bytes(wallet.sign_message(signable_message).signature)
+        result.append(SignedOrder(encoded_order, signature, encoder.encode_execute(encoded_order, signature)))
+    return result
+
+
+@pytest.mark.parametrize("chunk_size", (1, 3, 64))
+def test_encode_and_sign_many(chunk_size):
+    with ThreadPoolExecutor(4) as executor:
+        signed_orders = encode_and_sign_many(1, orders, wallet.key, executor=executor, chunk_size=chunk_size)
+    assert signed_orders == expected_signed_orders(1)
+
+
+def test_encode_and_sign_many_with_process_pool():
+    assert encode_and_sign_many(137, orders, wallet.key, max_workers=2, chunk_size=4) == expected_signed_orders(137)
+
+    with pytest.raises(ValueError):
+        encode_and_sign_many(1, orders, wallet.key, chunk_size=0)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_async_encode_and_sign_many():
+    signed_orders = await async_encode_and_sign_many(1, orders, wallet.key, max_workers=2, chunk_size=3)
+    assert signed_orders == expected_signed_orders(1)
+
+    with ThreadPoolExecutor(2) as executor:
+        signed_orders = await async_encode_and_sign_many(1, orders, wallet.key, executor=executor)
+    assert signed_orders == expected_signed_orders(1)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_async_map_chunks_cancellation():
+    started, release = threading.Event(), threading.Event()
+    processed = []
+
+    def process(chunk):
+        started.set()
+        release.wait(5)
+        processed.append(chunk)
+        return chunk
+
+    with ThreadPoolExecutor(1) as executor:
+        task = asyncio.ensure_future(_async_map_chunks(process, range(10), executor, None, 2))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release.set()
+    assert processed == [[0, 1]]  # the chunks not started yet were cancelled
+
+
+signed_orders = [
+    (encoded_order_1, signature_1),
+    (encoded_order_2, signature_2),
+    (to_bytes(hexstr=encoded_order_3), to_bytes(hexstr=signature_3)),
+    (encoded_order_4, signature_4),
+]
+
+
+def to_compact(signature):
+    # EIP-2098: the parity of v is stored in the highest bit of s
+    signature = to_bytes(hexstr=signature)
+    vs = int.from_bytes(signature[32:64], "big") | (signature[64] - 27) << 255
+    return signature[:32] + vs.to_bytes(32, "big")
+
+
+def test_recover_swapper():
+    assert recover_swapper(1, encoded_order_2, signature_2) == resolved_order_2[0][1]
+    assert recover_swapper(1, encoded_order_2, to_compact(signature_2)) == resolved_order_2[0][1]
+    assert recover_swapper(137, encoded_order_2, signature_2) != resolved_order_2[0][1]
+
+    signed_order = expected_signed_orders(1)[1]
+    assert recover_swapper(1, signed_order.encoded_order, signed_order.signature) == wallet.address
+
+    with pytest.raises(InvalidSignatureError) as e:
+        recover_swapper(1, encoded_order_2, to_bytes(hexstr=signature_2)[:63])
+    assert e.value.data == "0x4be6321b"
+    with pytest.raises(InvalidSignatureError) as e:
+        recover_swapper(1, encoded_order_2, to_bytes(hexstr=signature_2)[:64] + b"\x00")
+    assert e.value.data == "0x8baa579f"
+
+
+def test_verify_signatures():
+    mismatched_signature = (encoded_order_1, signature_2)
+    results = verify_signatures(1, signed_orders + [mismatched_signature])
+    assert results[:3] == [None, None, None]
+    assert isinstance(results[3], InvalidSignatureError)
+    assert results[3].data == "0x8baa579f"
+    assert isinstance(results[4], InvalidSignatureError)
+    assert results[4].data == "0x815e1d64"
+
+    with ThreadPoolExecutor(2) as executor:
+        assert verify_signatures_many(1, signed_orders, executor=executor, chunk_size=1)[:3] == [None, None, None]
+
+
+@pytest.mark.parametrize("bad_encoded_order", ("0x1234", encoded_order_2[:-64], b"\x00" * 32))
+def test_verify_signatures_with_undecodable_order(bad_encoded_order):
+    batch = signed_orders[:2] + [(bad_encoded_order, signature_2)] + signed_orders[2:3]
+    for results in (verify_signatures(1, batch), verify_signatures_many(1, batch, max_workers=2, chunk_size=2)):
+        assert results[:2] + results[3:] == [None, None, None]
+        assert isinstance(results[2], InvalidSignatureError)
+        assert results[2].data is None
+        assert results[2].message.startswith("Undecodable order")
+
+
+def test_verify_signatures_many_with_process_pool():
+    assert verify_signatures_many(1, signed_orders * 3, max_workers=2, chunk_size=2)[:3] == [None, None, None]
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_async_verify_signatures_many():
+    results = await async_verify_signatures_many(1, signed_orders, max_workers=2, chunk_size=3)
+    assert results[:3] == [None, None, None]
+    assert isinstance(results[3], InvalidSignatureError)
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.submit_count = 0
+
+    def submit(self, *args, **kwargs):
+        self.submit_count += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_resolver_with_signature_check():
+    undecodable_order = encoded_order_2[:-64]
+    provider = QuoterStandInProvider({**standin_outcomes, to_bytes(hexstr=undecodable_order): (False, b"")})
+    resolver = await OrderResolver.create(w3=AsyncWeb3(provider), check_signatures=True)
+
+    with pytest.raises(InvalidSignatureError):
+        await resolver.resolve(encoded_order_4, signature_4)
+    assert not [method for method, _ in provider.requests if method == "eth_call"]
+    assert await resolver.resolve(encoded_order_2, signature_2) == resolved_order_2
+
+    executor = CountingExecutor(2)
+    resolver.signature_executor = executor
+    with executor:
+        results = await resolver.resolve_many(signed_orders + [(undecodable_order, signature_2)])
+    assert results[1] == resolved_order_2
+    assert isinstance(results[3], InvalidSignatureError)
+    # the signatures are verified in one chunk, on the executor
+    assert executor.submit_count == 1
+    assert isinstance(results[4], ContractLogicError)
+    eth_calls = [params for method, params in provider.requests if method == "eth_call"]
+    _, calls = decode(["bool", "(address,bytes)[]"], to_bytes(hexstr=eth_calls[-1][0]["data"])[4:])
+    # the undecodable order is quoted, for the quoter to tell why it is invalid
+    assert len(calls) == 4
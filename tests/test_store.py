@@ -0,0 +1,82 @@
+from eth_utils import to_bytes
+import pytest
+
+from uniswapx_sdk.exceptions import ExpiredOrderError
+from uniswapx_sdk.models import APIOrder
+from uniswapx_sdk.store import OrderStore
+
+from .test_api import order_1
+from .test_resolver import (
+    encoded_order_2,
+    resolved_order_2,
+    signature_2,
+)
+
+
+order_hash_2 = resolved_order_2[4]
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "orders.db")
+
+
+def test_orders(store_path):
+    with OrderStore(store_path) as store:
+        store.put_order(order_hash_2, encoded_order_2, signature_2, {"orderStatus": "open"})
+        store.put_api_orders([APIOrder.from_dict(order_1)])
+        assert len(store) == 2
+        assert order_hash_2 in store and "0x" + "00" * 32 not in store
+        assert store._connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    # reopened
+    with OrderStore(store_path) as store:
+        stored_order = store.get_order("0x" + bytes(order_hash_2).hex())
+        assert stored_order.order_hash == bytes(order_hash_2)
+        assert stored_order.encoded_order == to_bytes(hexstr=encoded_order_2)
+        assert stored_order.signature == to_bytes(hexstr=signature_2)
+        assert stored_order.metadata == {"orderStatus": "open"}
+        api_fields = {name: value for name, value in order_1.items() if name not in ("orderHash", "encodedOrder", "signature")}  # noqa
+        assert store.get_order(order_1["orderHash"]).metadata == api_fields
+        assert {order.order_hash for order in store.iter_orders(batch_size=1)} == {
+            bytes(order_hash_2), to_bytes(hexstr=order_1["orderHash"])
+        }
+
+        # replaced
+        store.put_order(order_hash_2, encoded_order_2, signature_2)
+        assert store.get_order(order_hash_2).metadata is None
+        assert len(store) == 2
+
+        store.delete_orders([order_hash_2])
+        assert store.get_order(order_hash_2) is None
+        assert len(store) == 1
+
+
+def test_replay_order_after_update(store_path):
+    order_hashes = [bytes([i]) * 32 for i in range(3)]
+    with OrderStore(store_path) as store:
+        for order_hash in order_hashes:
+            store.put_order(order_hash, encoded_order_2, signature_2, {"orderStatus": "open"})
+        store.put_order(order_hashes[0], encoded_order_2, signature_2, {"orderStatus": "filled"})
+        assert [order.order_hash for order in store.iter_orders()] == order_hashes
+        assert store.get_order(order_hashes[0]).metadata == {"orderStatus": "filled"}
+        assert len(store) == 3
+
+
+def test_outcomes(store_path):
+    with OrderStore(store_path) as store:
+        assert store.get_outcome(order_hash_2) is None
+        store.put_outcome(order_hash_2, 100, resolved_order_2)
+        store.put_outcome(order_hash_2, 101, ExpiredOrderError(message="0x70f65caa", data="0x70f65caa"))
+
+        outcome = store.get_outcome(order_hash_2)
+        assert (outcome.block_number, outcome.resolved_order) == (101, None)
+        assert (outcome.error_type, outcome.error_data) == ("ExpiredOrderError", "0x70f65caa")
+
+        outcome = store.get_outcome(order_hash_2, 100)
+        assert outcome.resolved_order == resolved_order_2
+        assert outcome.error_type is None
+        assert store.get_outcome(order_hash_2, 99) is None
+
+        store.delete_orders([order_hash_2])
+        assert store.get_outcome(order_hash_2) is None
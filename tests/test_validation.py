@@ -0,0 +1,117 @@
+import pytest
+
+from uniswapx_sdk.decoder import (
+    DecodedExclusiveDutchOrder,
+    ExclusiveDutchOrderDecoder,
+)
+from uniswapx_sdk.exceptions import (
+    ExclusivityPeriodError,
+    ExpiredOrderError,
+    InvalidOrderFieldsError,
+)
+from uniswapx_sdk.validation import (
+    DEADLINE_BEFORE_END_TIME,
+    DEADLINE_PASSED,
+    END_TIME_BEFORE_START_TIME,
+    INCORRECT_AMOUNTS,
+    INPUT_AND_OUTPUT_DECAY,
+    INVALID_REACTOR,
+    NO_EXCLUSIVE_OVERRIDE,
+    OrderPreValidator,
+)
+
+from .test_resolver import (
+    encoded_order_1,
+    encoded_order_2,
+)
+
+
+reactor = "0x6000da47483062A0D734Ba3dc7576Ce6A0B645C4"
+exclusive_filler = "0x" + "55" * 20
+zero_address = "0x" + "00" * 20
+
+
+def build_order(
+        decay_times=(100, 200),
+        deadline=300,
+        input_amounts=(10, 10),
+        output_amounts=((20, 10), ),
+        exclusive_filler=zero_address,
+        bps=0,
+        order_reactor=reactor):
+    return (
+        (order_reactor, "0x" + "22" * 20, 0, deadline, zero_address, b""),
+        *decay_times,
+        exclusive_filler,
+        bps,
+        ("0x" + "33" * 20, *input_amounts),
+        tuple(("0x" + "44" * 20, start, end, "0x" + "22" * 20) for start, end in output_amounts),
+    )
+
+
+@pytest.mark.parametrize(
+    "order, timestamp, expected_exception, expected_reason",
+    (
+        (build_order(), 150, None, None),
+        (build_order(decay_times=(200, 100)), 150, InvalidOrderFieldsError, END_TIME_BEFORE_START_TIME),
+        (build_order(deadline=199), 150, InvalidOrderFieldsError, DEADLINE_BEFORE_END_TIME),
+        (build_order(input_amounts=(10, 20)), 150, InvalidOrderFieldsError, INPUT_AND_OUTPUT_DECAY),
+        (build_order(input_amounts=(10, 20), output_amounts=((20, 20), )), 150, None, None),
+        (build_order(input_amounts=(20, 10), output_amounts=((20, 20), )), 150, InvalidOrderFieldsError, INCORRECT_AMOUNTS),  # noqa
+        (build_order(output_amounts=((20, 20), (10, 20))), 150, InvalidOrderFieldsError, INCORRECT_AMOUNTS),
+        (build_order(exclusive_filler=exclusive_filler), 100, ExclusivityPeriodError, NO_EXCLUSIVE_OVERRIDE),
+        (build_order(exclusive_filler=exclusive_filler), 101, None, None),
+        (build_order(exclusive_filler=exclusive_filler, bps=100), 100, None, None),
+        (build_order(order_reactor="0x" + "66" * 20), 150, InvalidOrderFieldsError, INVALID_REACTOR),
+        (build_order(), 301, ExpiredOrderError, DEADLINE_PASSED),
+        (build_order(decay_times=(200, 100), deadline=50), 301, InvalidOrderFieldsError, DEADLINE_BEFORE_END_TIME),
+        (build_order(decay_times=(200, 100), input_amounts=(20, 10), output_amounts=((20, 20), )), 150, InvalidOrderFieldsError, INCORRECT_AMOUNTS),  # noqa
+        (build_order(decay_times=(200, 100), output_amounts=((10, 20), )), 150, InvalidOrderFieldsError, END_TIME_BEFORE_START_TIME),  # noqa
+    )
+)
+def test_validate(order, timestamp, expected_exception, expected_reason):
+    validator = OrderPreValidator(reactor=reactor)
+    error = validator.validate(order, timestamp)
+    if expected_exception is None:
+        assert error is None
+        assert not validator.rejection_counts
+    else:
+        assert isinstance(error, expected_exception)
+        assert validator.rejection_counts == {expected_reason: 1}
+
+
+def test_validate_exclusivity():
+    order = build_order(exclusive_filler=exclusive_filler, bps=100)
+    assert OrderPreValidator(reject_exclusivity_override=True).validate(order, 100) is not None
+    assert OrderPreValidator(filler=exclusive_filler.upper().replace("0X", "0x")).validate(build_order(exclusive_filler=exclusive_filler), 100) is None  # noqa
+
+
+def test_validate_configured_checks():
+    order = build_order(decay_times=(200, 100))
+    assert OrderPreValidator(checks=(DEADLINE_PASSED, )).validate(order, 150) is None
+    assert OrderPreValidator().validate(build_order(order_reactor="0x" + "66" * 20), 150) is None  # no reactor given
+    with pytest.raises(ValueError):
+        OrderPreValidator(checks=("unknown", ))
+
+
+def test_validate_many_decoded_orders():
+    decoder = ExclusiveDutchOrderDecoder()
+    orders = [decoder.decode(encoded_order_1)[0], decoder.decode_lazy(encoded_order_2), build_order(deadline=10)]
+    validator = OrderPreValidator(reactor=reactor)
+    errors = validator.validate_many(orders, timestamp=0x658a8f66)
+    assert isinstance(errors[0], ExpiredOrderError)
+    assert errors[1] is None
+    assert isinstance(errors[2], InvalidOrderFieldsError)
+    assert validator.filter_plausible(orders, timestamp=0x658a8f66) == [1]
+    assert validator.rejection_counts == {DEADLINE_PASSED: 2, DEADLINE_BEFORE_END_TIME: 2}
+    validator.reset_counts()
+    assert not validator.rejection_counts
+
+
+def test_validate_lazy_order_without_full_decoding(monkeypatch):
+    def fail(self):
+        raise AssertionError("fully decoded")
+
+    monkeypatch.setattr(DecodedExclusiveDutchOrder, "to_tuple", fail)
+    order = ExclusiveDutchOrderDecoder.decode_lazy(encoded_order_2)
+    assert OrderPreValidator(reactor=reactor).validate(order, timestamp=0x658a8f66) is None
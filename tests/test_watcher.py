@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from uniswapx_sdk.api import UniswapXAPI
+from uniswapx_sdk.decoder import ExclusiveDutchOrderDecoder
+from uniswapx_sdk.watcher import (
+    ADDED,
+    OrderWatcher,
+    REMOVED,
+    STATUS_CHANGED,
+)
+
+from .test_api import (
+    OrdersAPIStandIn,
+    start_api,
+)
+from .test_resolver import (
+    encoded_order_1,
+    encoded_order_2,
+)
+
+
+def api_order(order_hash, encoded_order="0x", order_status="open"):
+    return {"orderHash": order_hash, "encodedOrder": encoded_order, "orderStatus": order_status}
+
+
+class CountingWatcher(OrderWatcher):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.decoded_hashes = []
+
+    def _decode(self, order):
+        self.decoded_hashes.append(order["orderHash"])
+        return super()._decode(order)
+
+
+def test_update():
+    watcher = CountingWatcher(UniswapXAPI(1))
+    events = watcher.update([api_order("0xA1", encoded_order_1), api_order("0xa2", encoded_order_2)])
+    assert [(event.kind, event.order_hash) for event in events] == [(ADDED, "0xa1"), (ADDED, "0xa2")]
+    assert events[1].decoded_order == ExclusiveDutchOrderDecoder().decode(encoded_order_2)[0]
+
+    assert watcher.update([api_order("0xa1", encoded_order_1), api_order("0xa2", encoded_order_2)]) == []
+
+    events = watcher.update([api_order("0xa2", encoded_order_2, "filled"), api_order("0xa3")])
+    assert [(event.kind, event.order_hash) for event in events] == [(STATUS_CHANGED, "0xa2"), (ADDED, "0xa3"), (REMOVED, "0xa1")]  # noqa
+    assert events[0].order["orderStatus"] == "filled"
+    assert events[0].decoded_order is not None
+    assert events[1].decoded_order is None  # undecodable
+    assert events[2].order["encodedOrder"] == encoded_order_1
+
+    # only the new orders are decoded
+    assert watcher.decoded_hashes == ["0xA1", "0xa2", "0xa3"]
+    assert len(watcher) == 2
+    assert list(watcher.orders) == ["0xa2", "0xa3"]
+
+    # the missing orders whose status changed are not reported as removed
+    events = watcher.update([], [api_order("0xA2", encoded_order_2, "cancelled"), api_order("0xa3")])
+    assert [(event.kind, event.order_hash) for event in events] == [(STATUS_CHANGED, "0xa2"), (REMOVED, "0xa3")]
+    assert events[0].order["orderStatus"] == "cancelled"
+    assert len(watcher) == 0
+
+
+def test_invalid_interval():
+    with pytest.raises(ValueError):
+        OrderWatcher(UniswapXAPI(1), interval=-1)
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_watch():
+    stand_in = OrdersAPIStandIn(5)
+    server = await start_api(stand_in)
+    try:
+        async with UniswapXAPI(1, orders_endpoint=str(server.make_url("/orders"))) as api:
+            watcher = OrderWatcher(api, interval=0.01, limit=2, swapper="0x00")
+            events = watcher.watch()
+            assert [(await events.__anext__()).kind for _ in range(5)] == [ADDED] * 5
+            assert all(query["orderStatus"] == "open" for query in stand_in.requests)
+
+            # the API no longer returns the cancelled order with the open ones
+            stand_in.orders[1]["orderStatus"] = "cancelled"
+            del stand_in.orders[3]
+            stand_in.requests.clear()
+            event = await asyncio.wait_for(events.__anext__(), 1)
+            assert (event.kind, event.order_hash, event.order["orderStatus"]) == (STATUS_CHANGED, "0x1", "cancelled")
+            event = await asyncio.wait_for(events.__anext__(), 1)
+            assert (event.kind, event.order_hash, event.order["orderStatus"]) == (REMOVED, "0x3", "open")
+            await events.aclose()
+    finally:
+        await server.close()
+    assert list(watcher.orders) == ["0x0", "0x2", "0x4"]
+    polls = [query for query in stand_in.requests if "orderStatus" in query]
+    assert all(query["swapper"] == "0x00" and query["limit"] == "2" for query in polls)
+    assert [query for query in stand_in.requests if "orderHashes" in query][0]["orderHashes"] == "0x1,0x3"
@@ -0,0 +1,103 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import (
+    NamedTuple,
+    Union,
+)
+
+from eth_typing import (
+    ChecksumAddress,
+    HexStr,
+)
+from eth_utils import to_checksum_address as _to_checksum_address
+
+from uniswapx_sdk.instrumentation import (
+    CHECKSUM_ADDRESS,
+    instrumented,
+)
+
+
+# Only the cache misses are instrumented: the hits are a dict lookup
+_checksum_address = instrumented(CHECKSUM_ADDRESS)(_to_checksum_address)
+
+
+class AddressCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+
+
+class AddressCache:
+    """
+    Bounded and thread-safe LRU cache of checksum addresses, so the keccak of an address recurring in orders
+    (reactors, tokens, swappers, ...) is computed only once.
+    """
+    def __init__(self, max_size: int = 4096) -> None:
+        self._check_max_size(max_size)
+        self._max_size = max_size
+        self._addresses: "OrderedDict[Union[str, bytes], ChecksumAddress]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _check_max_size(max_size: int) -> None:
+        if max_size <= 0:
+            raise ValueError(f"Invalid max_size: {max_size}. Must be a positive integer")
+
+    def to_checksum_address(
+            self,
+            address: Union[ChecksumAddress, HexStr, str, bytes, bytearray, memoryview]) -> ChecksumAddress:
+        """
+        Same as Web3.to_checksum_address(), with the result being cached.
+        :param address: an address as a hex string or as bytes-like object
+        :return: the checksum address
+        """
+        # bytearray and memoryview are not hashable (nor immutable): they are cached as bytes
+        key = address if isinstance(address, (str, bytes)) else bytes(address)
+        with self._lock:
+            checksum_address = self._addresses.get(key)
+            if checksum_address is not None:
+                self._hits += 1
+                self._addresses.move_to_end(key)
+                return checksum_address
+            self._misses += 1
+
+        checksum_address = _checksum_address(key)
+        with self._lock:
+            self._addresses[key] = checksum_address
+            while len(self._addresses) > self._max_size:
+                self._addresses.popitem(last=False)
+        return checksum_address
+
+    def set_max_size(self, max_size: int) -> None:
+        """
+        Change the cache max size, evicting the least recently used addresses if needed.
+        """
+        self._check_max_size(max_size)
+        with self._lock:
+            self._max_size = max_size
+            while len(self._addresses) > self._max_size:
+                self._addresses.popitem(last=False)
+
+    def cache_info(self) -> AddressCacheInfo:
+        with self._lock:
+            return AddressCacheInfo(self._hits, self._misses, self._max_size, len(self._addresses))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._addresses.clear()
+            self._hits = self._misses = 0
+
+
+address_cache = AddressCache()
+
+
+def to_checksum_address(address: Union[ChecksumAddress, HexStr, str, bytes, bytearray, memoryview]) -> ChecksumAddress:
+    """
+    Checksum an address through the SDK-wide address cache.
+    :param address: an address as a hex string or as bytes-like object
+    :return: the checksum address
+    """
+    return address_cache.to_checksum_address(address)
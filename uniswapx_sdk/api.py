@@ -1,42 +1,446 @@
+import asyncio
+from collections import deque
+import math
+import random
+import time
+from types import TracebackType
 from typing import (
     Any,
+    AsyncIterator,
+    Callable,
     cast,
+    Collection,
+    Deque,
     Dict,
+    Iterable,
+    List,
     Optional,
+    Set,
+    Type,
+    TYPE_CHECKING,
+    TypeVar,
 )
-
-from aiohttp import ClientSession
+import warnings
 
 from uniswapx_sdk.constants import uniswapx_orders_endpoint
+from uniswapx_sdk.instrumentation import (
+    API_PARSE,
+    API_REQUEST,
+    instrumented,
+    timer,
+)
+from uniswapx_sdk.models import (
+    json_loads,
+    OrdersPage,
+)
+
+
+if TYPE_CHECKING:
+    # aiohttp is imported on first use, not with this module
+    from aiohttp import ClientSession
+
+
+T = TypeVar("T")
+# the response bodies are parsed by the loads function given to _get_orders()
+_json_loads: Callable[[bytes], Dict[str, Any]] = instrumented(API_PARSE)(json_loads)
+_orders_page_loads: Callable[[bytes], OrdersPage] = instrumented(API_PARSE)(OrdersPage.from_json)
+
+
+class RequestMetrics:
+    """
+    Latency metrics of the requests to UniswapX API, in seconds.
+    Percentiles are computed over the latest max_samples requests.
+    """
+    def __init__(self, max_samples: int = 1024) -> None:
+        self.count = 0
+        self.error_count = 0
+        self.retry_count = 0
+        self.hedge_count = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.latencies: Deque[float] = deque(maxlen=max_samples)
+
+    def record(self, latency: float, failed: bool = False) -> None:
+        self.count += 1
+        self.error_count += failed
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.latencies.append(latency)
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        :param q: the percentile, between 0 and 100
+        :return: the latency percentile (nearest rank) over the latest requests
+        """
+        if not 0 <= q <= 100:
+            raise ValueError(f"Invalid percentile: {q}. Must be between 0 and 100")
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        return latencies[max(0, math.ceil(len(latencies) * q / 100) - 1)]
+
+    def reset(self) -> None:
+        self.count = 0
+        self.error_count = 0
+        self.retry_count = 0
+        self.hedge_count = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.latencies.clear()
+
+
+class TokenBucket:
+    """
+    Client-side rate limiter: up to burst requests at once, then rate requests per second.
+    """
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"Invalid rate limit: {rate}/s with a burst of {burst}. Must be positive numbers")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """
+        Wait until a request can be sent.
+        """
+        while True:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self._paused_until and self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep(max(self._paused_until - now, (1 - self._tokens) / self.rate))
+
+    def pause(self, delay: float) -> None:
+        """
+        Hold all the requests for delay seconds, e.g. when the API answers with a 429 status.
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        self._tokens = 0.0
+
+
+def _is_json(content_type: str) -> bool:
+    # as aiohttp ClientResponse.json() does
+    return content_type == "application/json" or content_type.endswith("+json")
+
+
+class _RetryableError(Exception):
+    def __init__(self, error: Exception, retry_after: Optional[float] = None) -> None:
+        self.error = error
+        self.retry_after = retry_after
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:  # HTTP date, not supported
+        return None
 
 
 class UniswapXAPI:
-    def __init__(self, chain_id: int) -> None:
+    """
+    UniswapX API client. When no session is given to its methods, it uses its own long-lived session, which keeps
+    the connections alive between calls: use it as an async context manager, or close() it when done. A ResourceWarning
+    is emitted if it is garbage collected with its session still open.
+    The requests can be rate limited, their concurrency bounded, retried on transient errors and hedged.
+    """
+    def __init__(
+            self,
+            chain_id: int,
+            orders_endpoint: str = uniswapx_orders_endpoint,
+            limit_per_host: int = 10,
+            keepalive_timeout: float = 30.0,
+            ttl_dns_cache: Optional[int] = 300,
+            rate_limit: Optional[float] = None,
+            burst: int = 1,
+            max_concurrency: Optional[int] = None,
+            max_retries: int = 0,
+            retry_statuses: Collection[int] = (429, 500, 502, 503, 504),
+            backoff: float = 0.1,
+            max_backoff: float = 5.0,
+            hedge_delay: Optional[float] = None) -> None:
+        """
+        :param chain_id: the chain id
+        :param orders_endpoint: the UniswapX API orders endpoint
+        :param limit_per_host: the max number of simultaneous connections to the API
+        :param keepalive_timeout: how long (in seconds) an idle connection is kept open
+        :param ttl_dns_cache: how long (in seconds) the API address is cached, or None to cache it forever
+        :param rate_limit: optional. The max number of requests per second. No limit if not given.
+        :param burst: the number of requests which can be sent at once, within the rate limit
+        :param max_concurrency: optional. The max number of requests in flight. No limit if not given.
+        :param max_retries: the max number of times a request is retried on a connection error or a retry_statuses
+        status. 0 to disable the retries.
+        :param retry_statuses: the HTTP statuses on which a request is retried. When the retries are disabled,
+        the JSON body of these responses is returned, as for any other status.
+        :param backoff: the base delay (in seconds) between two attempts, doubled at each retry, with full jitter.
+        The Retry-After header, if any, takes precedence, and a 429 status also holds the rate limiter.
+        :param max_backoff: the max delay (in seconds) between two attempts
+        :param hedge_delay: optional. If given, a second identical request is sent when the first one takes longer
+        than hedge_delay seconds, and the first response is used.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"Invalid max_concurrency: {max_concurrency}. Must be a positive integer")
+        if max_retries < 0:
+            raise ValueError(f"Invalid max_retries: {max_retries}. Must be a positive integer or 0")
         self.chain_id = chain_id
+        self.orders_endpoint = orders_endpoint
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.rate_limiter = TokenBucket(rate_limit, burst) if rate_limit is not None else None
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_statuses = frozenset(retry_statuses)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.hedge_delay = hedge_delay
+        self.metrics = RequestMetrics()
+        self._session: Optional["ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "UniswapXAPI":
+        return self
+
+    async def __aexit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc_val: Optional[BaseException],
+            exc_tb: Optional[TracebackType]) -> None:
+        await self.close()
 
-    @staticmethod
-    async def _get_orders(session: ClientSession, **params: str) -> Dict[str, Any]:
-        async with session.get(url=uniswapx_orders_endpoint, params=params) as response:
-            return cast(Dict[str, Any], await response.json())
+    def __del__(self) -> None:
+        session = getattr(self, "_session", None)
+        if session is not None and not session.closed:
+            warnings.warn(
+                f"Unclosed {type(self).__name__}: its session is still open. Use it as an async context manager, "
+                f"or await close() when done.",
+                ResourceWarning,
+                source=self,
+            )
+
+    @property
+    def session(self) -> "ClientSession":
+        """
+        The session owned by this instance, created on first use
+        """
+        if self._session is None or self._session.closed:
+            from aiohttp import (
+                ClientSession,
+                TCPConnector,
+            )
+            connector = TCPConnector(
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache,
+                use_dns_cache=True,
+            )
+            self._session = ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request(self, session: "ClientSession", params: Dict[str, str], loads: Callable[[bytes], T]) -> T:
+        if self.max_concurrency is not None and self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self._semaphore is not None:
+            async with self._semaphore:
+                return await self._send(session, params, loads)
+        return await self._send(session, params, loads)
+
+    async def _send(self, session: "ClientSession", params: Dict[str, str], loads: Callable[[bytes], T]) -> T:
+        from aiohttp import (
+            ClientConnectionError,
+            ClientResponseError,
+            ContentTypeError,
+        )
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        start = time.perf_counter()
+        try:
+            with timer(API_REQUEST):
+                async with session.get(url=self.orders_endpoint, params=params) as response:
+                    if self.max_retries and response.status in self.retry_statuses:
+                        retry_after = _retry_after(response.headers.get("Retry-After"))
+                        try:
+                            response.raise_for_status()
+                        except ClientResponseError as e:
+                            raise _RetryableError(e, retry_after)
+                    if not _is_json(response.content_type):
+                        raise ContentTypeError(
+                            response.request_info,
+                            response.history,
+                            status=response.status,
+                            message=f"Attempt to decode JSON with unexpected mimetype: {response.content_type}",
+                            headers=response.headers,
+                        )
+                    result = loads(await response.read())
+        except ClientConnectionError as e:
+            self.metrics.record(time.perf_counter() - start, failed=True)
+            raise _RetryableError(e)
+        except Exception:
+            self.metrics.record(time.perf_counter() - start, failed=True)
+            raise
+        self.metrics.record(time.perf_counter() - start)
+        return result
+
+    async def _request_with_retries(
+            self,
+            session: "ClientSession",
+            params: Dict[str, str],
+            loads: Callable[[bytes], T]) -> T:
+        attempt = 0
+        while True:
+            try:
+                return await self._request(session, params, loads)
+            except _RetryableError as e:
+                if attempt >= self.max_retries:
+                    raise e.error
+                from aiohttp import ClientResponseError
+                delay = e.retry_after
+                if delay is None:
+                    delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+                if isinstance(e.error, ClientResponseError) and e.error.status == 429 and self.rate_limiter:
+                    self.rate_limiter.pause(delay)
+                attempt += 1
+                self.metrics.retry_count += 1
+                await asyncio.sleep(delay)
+
+    async def _get_orders(self, session: "ClientSession", params: Dict[str, str], loads: Callable[[bytes], T]) -> T:
+        if self.hedge_delay is None:
+            return await self._request_with_retries(session, params, loads)
+
+        first = asyncio.ensure_future(self._request_with_retries(session, params, loads))
+        pending: Set["asyncio.Future[T]"] = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_delay)
+            if not done:
+                self.metrics.hedge_count += 1
+                pending.add(asyncio.ensure_future(self._request_with_retries(session, params, loads)))
+            error: Optional[BaseException] = None
+            while pending or done:
+                if not done:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        return future.result()
+                    error = error or future.exception()
+                done = set()
+            raise cast(BaseException, error)
+        finally:
+            for future in pending:
+                future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _params(self, order_status: str, limit: int, kwargs: Dict[str, str]) -> Dict[str, str]:
+        params = kwargs.copy()
+        params.update({"chainId": str(self.chain_id), "orderStatus": order_status, "limit": str(limit)})
+        return params
 
     async def get_orders(
             self,
             order_status: str = "open",
             limit: int = 10,
-            session: Optional[ClientSession] = None,
+            session: Optional["ClientSession"] = None,
             **kwargs: str) -> Dict[str, Any]:
         """
         Get orders from UniswapX API (https://api.uniswap.org/v2/orders)
         :param order_status: one of the following str: open, expired, error, cancelled, filled, insufficient-funds
         :param limit: result max count
-        :param session: optional. A valid aiohttp.ClientSession instance
+        :param session: optional. A valid aiohttp.ClientSession instance. Default to the instance own session.
         :param kwargs: other possible parameters as describe here: https://api.uniswap.org/v2/uniswapx/docs
         :return: The list of corresponding orders
         """
-        params = kwargs.copy()
-        params.update({"chainId": str(self.chain_id), "orderStatus": order_status, "limit": str(limit)})
-        if session:
-            return await self._get_orders(session, **params)
-        else:
-            async with ClientSession() as client_session:
-                return await self._get_orders(client_session, **params)
+        params = self._params(order_status, limit, kwargs)
+        return await self._get_orders(session or self.session, params, _json_loads)
+
+    async def get_orders_page(
+            self,
+            order_status: str = "open",
+            limit: int = 10,
+            session: Optional["ClientSession"] = None,
+            **kwargs: str) -> OrdersPage:
+        """
+        Same as get_orders(), with the orders parsed from the response body into typed APIOrder objects.
+        :param order_status: one of the following str: open, expired, error, cancelled, filled, insufficient-funds
+        :param limit: result max count
+        :param session: optional. A valid aiohttp.ClientSession instance. Default to the instance own session.
+        :param kwargs: other possible parameters as describe here: https://api.uniswap.org/v2/uniswapx/docs
+        :return: The page of corresponding orders, with the cursor to the next page
+        """
+        params = self._params(order_status, limit, kwargs)
+        return await self._get_orders(session or self.session, params, _orders_page_loads)
+
+    async def get_orders_by_hash(
+            self,
+            order_hashes: Iterable[str],
+            session: Optional["ClientSession"] = None,
+            batch_size: int = 50) -> List[Dict[str, Any]]:
+        """
+        Get the orders with the given hashes from UniswapX API, whatever their status.
+        :param order_hashes: the order hashes
+        :param session: optional. A valid aiohttp.ClientSession instance. Default to the instance own session.
+        :param batch_size: the max number of order hashes per request
+        :return: the orders found, as returned by the API
+        """
+        if batch_size <= 0:
+            raise ValueError(f"Invalid batch_size: {batch_size}. Must be a positive integer")
+        order_hashes = list(order_hashes)
+        client_session = session or self.session
+        orders: List[Dict[str, Any]] = []
+        for i in range(0, len(order_hashes), batch_size):
+            batch = order_hashes[i:i + batch_size]
+            params = {"chainId": str(self.chain_id), "orderHashes": ",".join(batch), "limit": str(len(batch))}
+            page = await self._get_orders(client_session, params, _json_loads)
+            orders.extend(page.get("orders") or [])
+        return orders
+
+    async def iter_orders(
+            self,
+            order_status: str = "open",
+            limit: int = 100,
+            session: Optional["ClientSession"] = None,
+            **kwargs: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all the orders from UniswapX API, one at a time, following the pagination cursor.
+        The next page is fetched while the orders of the current page are consumed,
+        and at most two pages are held in memory.
+        :param order_status: one of the following str: open, expired, error, cancelled, filled, insufficient-funds
+        :param limit: page size
+        :param session: optional. A valid aiohttp.ClientSession instance. Default to the instance own session.
+        :param kwargs: other possible parameters as describe here: https://api.uniswap.org/v2/uniswapx/docs
+        :return: an async iterator over the corresponding orders
+        """
+        params = self._params(order_status, limit, kwargs)
+        client_session = session or self.session
+        next_page: Optional["asyncio.Task[Dict[str, Any]]"] = asyncio.create_task(
+            self._get_orders(client_session, params, _json_loads)
+        )
+        try:
+            while next_page:
+                page = await next_page
+                next_page = None
+                cursor = page.get("cursor")
+                orders = page.get("orders") or []
+                if cursor and orders:
+                    params["cursor"] = cursor
+                    next_page = asyncio.create_task(self._get_orders(client_session, params, _json_loads))
+                for order in orders:
+                    yield order
+        finally:
+            if next_page:
+                next_page.cancel()
+                await asyncio.gather(next_page, return_exceptions=True)
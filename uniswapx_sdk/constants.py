@@ -1,21 +1,53 @@
-from web3 import AsyncWeb3
-from web3.types import HexStr
+from functools import lru_cache
+import json
+from typing import (
+    Any,
+    cast,
+    Dict,
+    List,
+)
+
+from eth_typing import (
+    ChecksumAddress,
+    HexStr,
+)
+
+
+def _checksummed(address: str) -> ChecksumAddress:
+    # The addresses below are already checksummed (which is tested), so web3 is not needed at import
+    return cast(ChecksumAddress, address)
 
 
 # https://github.com/Uniswap/uniswapx-sdk/blob/main/src/constants.ts
 order_quoters = {  # ORDER_QUOTER_MAPPING
-    1: AsyncWeb3.to_checksum_address("0x54539967a06Fc0E3C3ED0ee320Eb67362D13C5fF"),
-    5: AsyncWeb3.to_checksum_address("0x54539967a06Fc0E3C3ED0ee320Eb67362D13C5fF"),
-    137: AsyncWeb3.to_checksum_address("0x54539967a06Fc0E3C3ED0ee320Eb67362D13C5fF"),
-    12341234: AsyncWeb3.to_checksum_address("0xbea0901A41177811b099F787D753436b2c47690E"),
+    1: _checksummed("0x54539967a06Fc0E3C3ED0ee320Eb67362D13C5fF"),
+    5: _checksummed("0x54539967a06Fc0E3C3ED0ee320Eb67362D13C5fF"),
+    137: _checksummed("0x54539967a06Fc0E3C3ED0ee320Eb67362D13C5fF"),
+    12341234: _checksummed("0xbea0901A41177811b099F787D753436b2c47690E"),
 }
 order_quoter_abi = '[{"inputs":[],"name":"OrdersLengthIncorrect","type":"error"},{"inputs":[{"internalType":"bytes","name":"order","type":"bytes"}],"name":"getReactor","outputs":[{"internalType":"contract IReactor","name":"reactor","type":"address"}],"stateMutability":"pure","type":"function"},{"inputs":[{"internalType":"bytes","name":"order","type":"bytes"},{"internalType":"bytes","name":"sig","type":"bytes"}],"name":"quote","outputs":[{"components":[{"components":[{"internalType":"contract IReactor","name":"reactor","type":"address"},{"internalType":"address","name":"swapper","type":"address"},{"internalType":"uint256","name":"nonce","type":"uint256"},{"internalType":"uint256","name":"deadline","type":"uint256"},{"internalType":"contract IValidationCallback","name":"additionalValidationContract","type":"address"},{"internalType":"bytes","name":"additionalValidationData","type":"bytes"}],"internalType":"struct OrderInfo","name":"info","type":"tuple"},{"components":[{"internalType":"contract ERC20","name":"token","type":"address"},{"internalType":"uint256","name":"amount","type":"uint256"},{"internalType":"uint256","name":"maxAmount","type":"uint256"}],"internalType":"struct InputToken","name":"input","type":"tuple"},{"components":[{"internalType":"address","name":"token","type":"address"},{"internalType":"uint256","name":"amount","type":"uint256"},{"internalType":"address","name":"recipient","type":"address"}],"internalType":"struct OutputToken[]","name":"outputs","type":"tuple[]"},{"internalType":"bytes","name":"sig","type":"bytes"},{"internalType":"bytes32","name":"hash","type":"bytes32"}],"internalType":"struct ResolvedOrder","name":"result","type":"tuple"}],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"components":[{"components":[{"internalType":"contract IReactor","name":"reactor","type":"address"},{"internalType":"address","name":"swapper","type":"address"},{"internalType":"uint256","name":"nonce","type":"uint256"},{"internalType":"uint256","name":"deadline","type":"uint256"},{"internalType":"contract IValidationCallback","name":"additionalValidationContract","type":"address"},{"internalType":"bytes","name":"additionalValidationData","type":"bytes"}],"internalType":"struct OrderInfo","name":"info","type":"tuple"},{"components":[{"internalType":"contract ERC20","name":"token","type":"address"},{"internalType":"uint256","name":"amount","type":"uint256"},{"internalType":"uint256","name":"maxAmount","type":"uint256"}],"internalType":"struct InputToken","name":"input","type":"tuple"},{"components":[{"internalType":"address","name":"token","type":"address"},{"internalType":"uint256","name":"amount","type":"uint256"},{"internalType":"address","name":"recipient","type":"address"}],"internalType":"struct OutputToken[]","name":"outputs","type":"tuple[]"},{"internalType":"bytes","name":"sig","type":"bytes"},{"internalType":"bytes32","name":"hash","type":"bytes32"}],"internalType":"struct ResolvedOrder[]","name":"resolvedOrders","type":"tuple[]"},{"internalType":"bytes","name":"","type":"bytes"}],"name":"reactorCallback","outputs":[],"stateMutability":"pure","type":"function"}]'  # noqa
 
 _execute_function_selector = HexStr("0x3f62192e")
 
+# https://github.com/mds1/multicall
+multicall3_address = _checksummed("0xcA11bde05977b3631167028862bE2a173976CA11")
+multicall3_abi = '[{"inputs":[{"internalType":"bool","name":"requireSuccess","type":"bool"},{"components":[{"internalType":"address","name":"target","type":"address"},{"internalType":"bytes","name":"callData","type":"bytes"}],"internalType":"struct Multicall3.Call[]","name":"calls","type":"tuple[]"}],"name":"tryAggregate","outputs":[{"components":[{"internalType":"bool","name":"success","type":"bool"},{"internalType":"bytes","name":"returnData","type":"bytes"}],"internalType":"struct Multicall3.Result[]","name":"returnData","type":"tuple[]"}],"stateMutability":"payable","type":"function"}]'  # noqa
+resolved_order_abi = ['((address,address,uint256,uint256,address,bytes),(address,uint256,uint256),(address,uint256,address)[],bytes,bytes32)']  # noqa
+
 uniswapx_api_root = "https://api.uniswap.org/v2/"
 uniswapx_orders_endpoint = f"{uniswapx_api_root}orders"
 
+permit2_address = _checksummed("0x000000000022D473030F116dDEE9F6B43aC78BA3")
 permit2_domain_data = {"name": "Permit2", "chainId": 1, "verifyingContract": "0x000000000022D473030F116dDEE9F6B43aC78BA3"}  # noqa
 exclusive_dutch_order_abi = ['((address,address,uint256,uint256,address,bytes),uint256,uint256,address,uint256,(address,uint256,uint256),(address,uint256,uint256,address)[])']  # noqa
 exclusive_dutch_order_types = {'PermitWitnessTransferFrom': [{'name': 'permitted', 'type': 'TokenPermissions'}, {'name': 'spender', 'type': 'address'}, {'name': 'nonce', 'type': 'uint256'}, {'name': 'deadline', 'type': 'uint256'}, {'name': 'witness', 'type': 'ExclusiveDutchOrder'}], 'TokenPermissions': [{'name': 'token', 'type': 'address'}, {'name': 'amount', 'type': 'uint256'}], 'ExclusiveDutchOrder': [{'name': 'info', 'type': 'OrderInfo'}, {'name': 'decayStartTime', 'type': 'uint256'}, {'name': 'decayEndTime', 'type': 'uint256'}, {'name': 'exclusiveFiller', 'type': 'address'}, {'name': 'exclusivityOverrideBps', 'type': 'uint256'}, {'name': 'inputToken', 'type': 'address'}, {'name': 'inputStartAmount', 'type': 'uint256'}, {'name': 'inputEndAmount', 'type': 'uint256'}, {'name': 'outputs', 'type': 'DutchOutput[]'}], 'OrderInfo': [{'name': 'reactor', 'type': 'address'}, {'name': 'swapper', 'type': 'address'}, {'name': 'nonce', 'type': 'uint256'}, {'name': 'deadline', 'type': 'uint256'}, {'name': 'additionalValidationContract', 'type': 'address'}, {'name': 'additionalValidationData', 'type': 'bytes'}], 'DutchOutput': [{'name': 'token', 'type': 'address'}, {'name': 'startAmount', 'type': 'uint256'}, {'name': 'endAmount', 'type': 'uint256'}, {'name': 'recipient', 'type': 'address'}]}  # noqa
+
+
+@lru_cache(maxsize=None)
+def get_parsed_abi(abi: str) -> List[Dict[str, Any]]:
+    """
+    Parse a JSON ABI (e.g. order_quoter_abi) once, the parsed ABI being shared by all the contracts built from it.
+    It must not be modified.
+    """
+    parsed_abi: List[Dict[str, Any]] = json.loads(abi)
+    return parsed_abi
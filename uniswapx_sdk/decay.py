@@ -0,0 +1,271 @@
+from typing import (
+    Any,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import numpy.typing as npt
+
+from uniswapx_sdk.decoder import DecodedExclusiveDutchOrder
+
+
+BPS = 10_000
+_ZERO_ADDRESS = "0x" + "00" * 20
+
+# uint256 amounts are split into limbs of 32 bits, most significant first, stored in uint64 so that
+# a limb multiplied by a 32-bit factor, plus a carry, never overflows.
+# Only the limbs needed by the largest amount are kept (at most 8), as most amounts fit in 3 or 4 limbs.
+_LIMB_BITS = 32
+_LIMB_MASK = np.uint64(2 ** _LIMB_BITS - 1)
+_LIMB_SHIFT = np.uint64(_LIMB_BITS)
+_MAX_FACTOR = 2 ** _LIMB_BITS - 1
+_INT64_MAX = 2 ** 63 - 1
+
+Limbs = npt.NDArray[np.uint64]
+DecodedOrder = Union[DecodedExclusiveDutchOrder, Tuple[Any, ...]]
+
+
+def decay(start_amount: int, end_amount: int, decay_start_time: int, decay_end_time: int, timestamp: int) -> int:
+    """
+    Scalar reference of the reactor DutchDecayLib.decay(), with its rounding (down).
+    :return: the amount decayed at timestamp
+    """
+    if decay_end_time < decay_start_time:
+        raise ValueError("EndTimeBeforeStartTime")
+    elif decay_end_time <= timestamp:
+        return end_amount
+    elif decay_start_time >= timestamp:
+        return start_amount
+    elapsed = timestamp - decay_start_time
+    duration = decay_end_time - decay_start_time
+    if end_amount < start_amount:
+        return start_amount - (start_amount - end_amount) * elapsed // duration
+    else:
+        return start_amount + (end_amount - start_amount) * elapsed // duration
+
+
+def _to_limbs(values: Sequence[int], limb_count: int) -> Limbs:
+    size = limb_count * _LIMB_BITS // 8
+    buffer = b"".join(value.to_bytes(size, "big") for value in values)
+    return np.frombuffer(buffer, dtype=">u4").reshape(len(values), limb_count).astype(np.uint64)
+
+
+def _limb_count(values: Sequence[int]) -> int:
+    return max(1, -(-max(values, default=0).bit_length() // _LIMB_BITS))
+
+
+def _from_limbs(limbs: Limbs) -> List[int]:
+    size = limbs.shape[1] * _LIMB_BITS // 8
+    buffer = memoryview(limbs.astype(">u4").tobytes())
+    return [int.from_bytes(buffer[i:i + size], "big") for i in range(0, len(buffer), size)]
+
+
+def _to_float(limbs: Limbs) -> "npt.NDArray[np.float64]":
+    weights = 2.0 ** (_LIMB_BITS * np.arange(limbs.shape[1] - 1, -1, -1))
+    result: "npt.NDArray[np.float64]" = limbs.astype(np.float64) @ weights
+    return result
+
+
+def _mul_small(limbs: Limbs, factors: "npt.NDArray[np.uint64]") -> Limbs:
+    """
+    Multiply each row by a factor < 2**32, the result having one more limb.
+    """
+    result = np.empty((limbs.shape[0], limbs.shape[1] + 1), dtype=np.uint64)
+    carry = np.zeros(limbs.shape[0], dtype=np.uint64)
+    for k in range(limbs.shape[1] - 1, -1, -1):
+        product = limbs[:, k] * factors + carry
+        result[:, k + 1] = product & _LIMB_MASK
+        carry = product >> _LIMB_SHIFT
+    result[:, 0] = carry
+    return result
+
+
+def _div_small(limbs: Limbs, divisors: "npt.NDArray[np.uint64]") -> Limbs:
+    """
+    Floor divide each row by a divisor in [1, 2**32), with a long division from the most significant limb.
+    """
+    result = np.empty_like(limbs)
+    remainder = np.zeros(limbs.shape[0], dtype=np.uint64)
+    for k in range(limbs.shape[1]):
+        current = (remainder << _LIMB_SHIFT) | limbs[:, k]
+        result[:, k] = current // divisors
+        remainder = current % divisors
+    return result
+
+
+def _add(a: Limbs, b: Limbs) -> Limbs:
+    result = np.empty_like(a)
+    carry = np.zeros(a.shape[0], dtype=np.uint64)
+    for k in range(a.shape[1] - 1, -1, -1):
+        total = a[:, k] + b[:, k] + carry
+        result[:, k] = total & _LIMB_MASK
+        carry = total >> _LIMB_SHIFT
+    return result
+
+
+def _sub(a: Limbs, b: Limbs) -> Limbs:
+    """
+    a - b for a >= b, computed as a + ~b + 1
+    """
+    result = np.empty_like(a)
+    carry = np.ones(a.shape[0], dtype=np.uint64)
+    for k in range(a.shape[1] - 1, -1, -1):
+        total = a[:, k] + (_LIMB_MASK - b[:, k]) + carry
+        result[:, k] = total & _LIMB_MASK
+        carry = total >> _LIMB_SHIFT
+    return result
+
+
+class _DecayArrays:
+    """
+    Start amounts and absolute amount differences of Dutch amounts as limbs, along with their decay times,
+    ready to be decayed at any timestamp.
+    """
+    def __init__(self, amounts: Sequence[Tuple[int, int]], decay_times: Sequence[Tuple[int, int]]) -> None:
+        start_amounts = [start for start, _ in amounts]
+        amount_diffs = [abs(end - start) for start, end in amounts]
+        limb_count = max(_limb_count(start_amounts), _limb_count(amount_diffs))
+        # one more limb for the start amounts, the width of the delta
+        self.start_amounts = _to_limbs(start_amounts, limb_count + 1)
+        self.amount_diffs = _to_limbs(amount_diffs, limb_count)
+        self.decreasing = np.array([end < start for start, end in amounts], dtype=bool).reshape(-1, 1)
+        self.decay_start_times = np.array([start for start, _ in decay_times], dtype=np.int64).reshape(-1)
+        self.decay_end_times = np.array([end for _, end in decay_times], dtype=np.int64).reshape(-1)
+        self.durations = np.maximum(self.decay_end_times - self.decay_start_times, 1).astype(np.uint64)
+
+    def decay(self, timestamp: int) -> Limbs:
+        """
+        Vectorized DutchDecayLib.decay(): elapsed is clamped to the decay period, so the bounds are exact.
+        """
+        elapsed = np.minimum(np.maximum(timestamp - self.decay_start_times, 0).astype(np.uint64), self.durations)
+        elapsed = np.where(self.decay_end_times <= timestamp, self.durations, elapsed)
+        delta = _div_small(_mul_small(self.amount_diffs, elapsed), self.durations)
+        decayed: Limbs = np.where(
+            self.decreasing, _sub(self.start_amounts, delta), _add(self.start_amounts, delta)
+        )
+        return decayed
+
+
+class DecayedAmounts:
+    """
+    The amounts of the evaluated orders. The outputs of the i-th order are at output_offsets[i]:output_offsets[i + 1].
+    The exact amounts are converted to Python integers on first access, while their float approximations are
+    cheap to get, e.g. to rank the orders.
+    """
+    def __init__(
+            self,
+            input_limbs: Limbs,
+            input_max_amounts: List[int],
+            output_limbs: Limbs,
+            output_offsets: "npt.NDArray[np.intp]",
+            fillable: "npt.NDArray[np.bool_]") -> None:
+        self._input_limbs = input_limbs
+        self._output_limbs = output_limbs
+        self._input_amounts: Optional[List[int]] = None
+        self._output_amounts: Optional[List[int]] = None
+        self.input_max_amounts = input_max_amounts
+        self.output_offsets = output_offsets
+        self.fillable = fillable
+
+    @property
+    def input_amounts(self) -> List[int]:
+        if self._input_amounts is None:
+            self._input_amounts = _from_limbs(self._input_limbs)
+        return self._input_amounts
+
+    @property
+    def output_amounts(self) -> List[int]:
+        if self._output_amounts is None:
+            self._output_amounts = _from_limbs(self._output_limbs)
+        return self._output_amounts
+
+    def order_output_amounts(self, order_index: int) -> List[int]:
+        return self.output_amounts[self.output_offsets[order_index]:self.output_offsets[order_index + 1]]
+
+    def input_amounts_as_float(self) -> "npt.NDArray[np.float64]":
+        return _to_float(self._input_limbs)
+
+    def output_amounts_as_float(self) -> "npt.NDArray[np.float64]":
+        return _to_float(self._output_limbs)
+
+
+class DutchDecayEvaluator:
+    """
+    Compute the input and output amounts of many ExclusiveDutchOrders at a given timestamp, as the reactor would
+    resolve them (decay, exclusivity override and rounding), without any RPC call.
+    The orders are loaded once into arrays of 32-bit limbs, so they can be evaluated repeatedly, e.g. every block,
+    with vectorized operations which stay exact at uint256.
+    The orders the reactor would reject (decay end before decay start) or whose decay period or override bps
+    do not fit in 32 bits are never fillable, and their amounts are not meaningful.
+    Requires numpy: pip install uniswapx-sdk[numpy]
+    """
+    def __init__(self, orders: Sequence[DecodedOrder]) -> None:
+        """
+        :param orders: the decoded orders, as returned by ExclusiveDutchOrderDecoder.decode()[0] or decode_lazy()
+        """
+        order_tuples = [
+            order.to_tuple() if isinstance(order, DecodedExclusiveDutchOrder) else order for order in orders
+        ]
+        self.size = len(order_tuples)
+        valid = [self._is_supported(order) for order in order_tuples]
+        decay_times = [(order[1], order[2]) if ok else (0, 0) for order, ok in zip(order_tuples, valid)]
+        self._valid = np.array(valid, dtype=bool)
+        self._inputs = _DecayArrays([(order[5][1], order[5][2]) for order in order_tuples], decay_times)
+        self._input_max_amounts = [order[5][2] for order in order_tuples]
+        self._deadlines = np.array([min(order[0][3], _INT64_MAX) for order in order_tuples], dtype=np.int64)
+        self._exclusive_fillers = np.array([order[3].lower() for order in order_tuples], dtype=object)
+        self._exclusive = self._exclusive_fillers != _ZERO_ADDRESS
+        self._override_factors = np.array(
+            [BPS + order[4] if ok else BPS for order, ok in zip(order_tuples, valid)], dtype=np.uint64
+        )
+
+        output_counts = [len(order[6]) for order in order_tuples]
+        self._output_offsets: "npt.NDArray[np.intp]" = np.zeros(self.size + 1, dtype=np.intp)
+        np.cumsum(output_counts, out=self._output_offsets[1:])
+        self._output_order_index = np.repeat(np.arange(self.size), output_counts)
+        self._outputs = _DecayArrays(
+            [(output[1], output[2]) for order in order_tuples for output in order[6]],
+            [times for times, count in zip(decay_times, output_counts) for _ in range(count)],
+        )
+
+    @staticmethod
+    def _is_supported(order: Tuple[Any, ...]) -> bool:
+        decay_start_time, decay_end_time, override_bps = order[1], order[2], order[4]
+        return bool(
+            decay_start_time <= decay_end_time <= _INT64_MAX
+            and decay_end_time - decay_start_time <= _MAX_FACTOR
+            and BPS + override_bps <= _MAX_FACTOR
+        )
+
+    def __len__(self) -> int:
+        return self.size
+
+    def evaluate(self, timestamp: int, filler: Optional[str] = None) -> DecayedAmounts:
+        """
+        :param timestamp: the block timestamp at which the orders are resolved
+        :param filler: optional. The filler address. If it is not the exclusive filler, or not given (as when quoting),
+        the exclusivity override is applied to the outputs during the exclusivity period.
+        :return: the resolved amounts, and whether each order can be filled at this timestamp
+        """
+        input_limbs = self._inputs.decay(timestamp)
+        output_limbs = self._outputs.decay(timestamp)
+
+        # the exclusivity period ends at the decay start time
+        exclusive = self._exclusive & (self._inputs.decay_start_times >= timestamp)
+        if filler is not None:
+            exclusive &= self._exclusive_fillers != filler.lower()
+        # the override may add a limb, and only the overridden outputs are scaled
+        output_limbs = np.pad(output_limbs, ((0, 0), (1, 0)))
+        overridden = np.flatnonzero(exclusive[self._output_order_index])
+        if len(overridden):
+            factors = self._override_factors[self._output_order_index[overridden]]
+            scaled = _mul_small(output_limbs[overridden, 1:], factors)
+            output_limbs[overridden] = _div_small(scaled, np.full_like(factors, BPS))
+
+        strict_exclusivity = exclusive & (self._override_factors == BPS)
+        fillable = self._valid & (self._deadlines >= timestamp) & ~strict_exclusivity
+        return DecayedAmounts(input_limbs, self._input_max_amounts, output_limbs, self._output_offsets, fillable)
@@ -1,35 +1,289 @@
 from typing import (
     Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    overload,
     Sequence,
     Tuple,
+    Type,
+    TypeVar,
     Union,
 )
 
-from eth_abi import decode
-from eth_utils import to_bytes
-from web3.types import (
-    HexBytes,
-    HexStr,
+from eth_abi.decoding import (
+    ContextFramesBytesIO,
+    TupleDecoder,
+)
+from eth_abi.exceptions import (
+    InsufficientDataBytes,
+    NonEmptyPaddingBytes,
 )
+from eth_abi.registry import registry
+from eth_typing import HexStr
+from eth_utils import to_bytes
+from hexbytes import HexBytes
 
 from uniswapx_sdk.constants import exclusive_dutch_order_abi
+from uniswapx_sdk.fast_codec import (
+    _ADDRESS_PADDING,
+    _ceil32,
+    _read_uint,
+    _WORD,
+    decode_exclusive_dutch_order,
+)
+from uniswapx_sdk.instrumentation import (
+    DECODE,
+    instrumented,
+)
+
+
+EncodedOrder = Union[HexStr, HexBytes, bytes, bytearray, memoryview]
+
+
+def _as_buffer(encoded_order: EncodedOrder) -> Union[bytes, bytearray, memoryview]:
+    if isinstance(encoded_order, str):
+        return to_bytes(hexstr=encoded_order)
+    return encoded_order
+
+
+T = TypeVar("T")
+
+
+class _LazyField(Generic[T]):
+    """
+    Descriptor which decodes a field on first access and caches it in the instance slot named after it.
+    """
+    def __init__(self, read: Callable[[Any], T]) -> None:
+        self._read = read
+        self._slot = ""
+
+    def __set_name__(self, owner: Type["_LazyView"], name: str) -> None:
+        self._slot = f"_{name}"
+
+    @overload
+    def __get__(self, instance: None, owner: Type["_LazyView"]) -> "_LazyField[T]": ...
+
+    @overload
+    def __get__(self, instance: "_LazyView", owner: Type["_LazyView"]) -> T: ...
+
+    def __get__(self, instance: Optional["_LazyView"], owner: Type["_LazyView"]) -> Union["_LazyField[T]", T]:
+        if instance is None:
+            return self
+        try:
+            value: T = getattr(instance, self._slot)
+        except AttributeError:
+            value = self._read(instance)
+            setattr(instance, self._slot, value)
+        return value
+
+
+def _uint_field(index: int) -> _LazyField[int]:
+    return _LazyField(lambda view: view._uint(index))
+
+
+def _address_field(index: int) -> _LazyField[str]:
+    return _LazyField(lambda view: view._address(index))
+
+
+class _LazyView:
+    __slots__ = ("_view", "_start")
+
+    def __init__(self, view: memoryview, start: int) -> None:
+        self._view = view
+        self._start = start
+
+    def _uint(self, index: int) -> int:
+        return _read_uint(self._view, self._start + index * _WORD)
+
+    def _address(self, index: int) -> str:
+        position = self._start + index * _WORD
+        if self._view[position:position + 12] != _ADDRESS_PADDING:
+            raise NonEmptyPaddingBytes(f"Padding bytes were not empty for the address at position {position}")
+        return "0x" + self._view[position + 12:position + _WORD].hex()
+
+    def _pointer(self, index: int, min_size: int) -> int:
+        position = self._start + self._uint(index)
+        if position + min_size > self._view.nbytes:
+            raise InsufficientDataBytes(f"The pointer at position {self._start + index * _WORD} is out of bounds")
+        return position
+
+
+class DecodedOrderInfo(_LazyView):
+    """
+    Lazy view on the OrderInfo of an encoded ExclusiveDutchOrder
+    """
+    __slots__ = (
+        "_reactor",
+        "_swapper",
+        "_nonce",
+        "_deadline",
+        "_validation_contract",
+        "_validation_data",
+        "_validation_data_start",
+        "_validation_data_length",
+    )
+
+    reactor = _address_field(0)
+    swapper = _address_field(1)
+    nonce = _uint_field(2)
+    deadline = _uint_field(3)
+    validation_contract = _address_field(4)
+
+    def __init__(self, view: memoryview, start: int) -> None:
+        super().__init__(view, start)
+        self._validation_data_start = self._pointer(5, _WORD)
+        self._validation_data_length = _read_uint(view, self._validation_data_start)
+        if self._validation_data_start + _WORD + _ceil32(self._validation_data_length) > view.nbytes:
+            raise InsufficientDataBytes("The validation data is out of bounds")
+
+    def _read_validation_data(self) -> bytes:
+        start = self._validation_data_start + _WORD
+        end = start + self._validation_data_length
+        if any(self._view[end:start + _ceil32(self._validation_data_length)]):
+            raise NonEmptyPaddingBytes("Padding bytes were not empty for the validation data")
+        return self._view[start:end].tobytes()
+
+    validation_data = _LazyField(_read_validation_data)
+
+    def to_tuple(self) -> Tuple[Any, ...]:
+        return self.reactor, self.swapper, self.nonce, self.deadline, self.validation_contract, self.validation_data
+
+
+class DecodedDutchOutput(_LazyView):
+    """
+    Lazy view on one output of an encoded ExclusiveDutchOrder
+    """
+    __slots__ = ("_token", "_start_amount", "_end_amount", "_recipient")
+
+    token = _address_field(0)
+    start_amount = _uint_field(1)
+    end_amount = _uint_field(2)
+    recipient = _address_field(3)
+
+    def to_tuple(self) -> Tuple[Any, ...]:
+        return self.token, self.start_amount, self.end_amount, self.recipient
+
+
+class DecodedExclusiveDutchOrder(_LazyView):
+    """
+    Lazy and zero-copy view on an encoded ExclusiveDutchOrder.
+    The pointers are validated at creation, but each field is only decoded on first access, and then cached.
+    """
+    __slots__ = (
+        "_info",
+        "_decay_start_time",
+        "_decay_end_time",
+        "_exclusive_filler",
+        "_exclusivity_override_bps",
+        "_input_token",
+        "_input_start_amount",
+        "_input_end_amount",
+        "_outputs",
+        "_outputs_start",
+        "_output_count",
+    )
+
+    decay_start_time = _uint_field(1)
+    decay_end_time = _uint_field(2)
+    exclusive_filler = _address_field(3)
+    exclusivity_override_bps = _uint_field(4)
+    input_token = _address_field(5)
+    input_start_amount = _uint_field(6)
+    input_end_amount = _uint_field(7)
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        view = memoryview(data)
+        if view.format != "B":
+            view = view.cast("B")
+        if view.nbytes < _WORD or _read_uint(view, 0) + 9 * _WORD > view.nbytes:
+            raise InsufficientDataBytes("The encoded order is too short")
+        super().__init__(view, _read_uint(view, 0))
+        self._info = DecodedOrderInfo(view, self._pointer(0, 6 * _WORD))
+        outputs_pointer = self._pointer(8, _WORD)
+        self._outputs_start = outputs_pointer + _WORD
+        self._output_count = _read_uint(view, outputs_pointer)
+        if self._outputs_start + self._output_count * 4 * _WORD > view.nbytes:
+            raise InsufficientDataBytes("The outputs are out of bounds")
+
+    @property
+    def info(self) -> DecodedOrderInfo:
+        return self._info
+
+    def _read_outputs(self) -> Tuple[DecodedDutchOutput, ...]:
+        return tuple(
+            DecodedDutchOutput(self._view, self._outputs_start + i * 4 * _WORD) for i in range(self._output_count)
+        )
+
+    outputs = _LazyField(_read_outputs)
+
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """
+        :return: the fully decoded order, as returned by ExclusiveDutchOrderDecoder.decode()
+        """
+        return (
+            self.info.to_tuple(),
+            self.decay_start_time,
+            self.decay_end_time,
+            self.exclusive_filler,
+            self.exclusivity_override_bps,
+            (self.input_token, self.input_start_amount, self.input_end_amount),
+            tuple(output.to_tuple() for output in self.outputs),
+        )
 
 
 class Decoder:
     def __init__(self, abi: Sequence[str]) -> None:
         self.abi = abi
+        # Build the decoder tree once, instead of resolving the type strings for each order
+        self._tuple_decoder = TupleDecoder(  # type: ignore[no-untyped-call]
+            decoders=tuple(registry.get_decoder(type_str) for type_str in abi)
+        )
+
+    def _decode(self, data: Union[bytes, bytearray, memoryview]) -> Tuple[Any, ...]:
+        decoded: Tuple[Any, ...] = self._tuple_decoder(ContextFramesBytesIO(data))  # type: ignore[no-untyped-call]
+        return decoded
 
-    def decode(self, encoded_order: Union[HexStr, HexBytes]) -> Tuple[Any, ...]:
+    @instrumented(DECODE)
+    def decode(self, encoded_order: EncodedOrder) -> Tuple[Any, ...]:
         """
         Decode UniswapX orders
         :param encoded_order: A UniswapX encoded order
         :return: The decoded order
         """
-        order = encoded_order.hex() if isinstance(encoded_order, bytes) else encoded_order
-        data = to_bytes(hexstr=order)
-        return decode(self.abi, data)
+        return self._decode(_as_buffer(encoded_order))
+
+    def decode_many(self, encoded_orders: Iterable[EncodedOrder]) -> Iterator[Tuple[Any, ...]]:
+        """
+        Lazily decode several UniswapX orders, reusing the same precompiled decoder.
+        Bytes and memoryviews are decoded as is, hex strings are converted once.
+        :param encoded_orders: An iterable of UniswapX encoded orders
+        :return: An iterator over the decoded orders, in the same order
+        """
+        for encoded_order in encoded_orders:
+            yield self.decode(encoded_order)
 
 
 class ExclusiveDutchOrderDecoder(Decoder):
     def __init__(self) -> None:
         super().__init__(exclusive_dutch_order_abi)
+
+    def _decode(self, data: Union[bytes, bytearray, memoryview]) -> Tuple[Any, ...]:
+        order = decode_exclusive_dutch_order(data)
+        if order is None:
+            # not the canonical layout: let eth_abi decode it or raise the relevant error
+            return super()._decode(data)
+        return (order, )
+
+    @staticmethod
+    @instrumented(DECODE)
+    def decode_lazy(encoded_order: EncodedOrder) -> DecodedExclusiveDutchOrder:
+        """
+        Create a lazy view on an ExclusiveDutchOrder, whose fields are decoded only when accessed.
+        The underlying buffer is not copied, so it must not be modified while the view is in use.
+        :param encoded_order: A UniswapX encoded ExclusiveDutchOrder
+        :return: The lazily decoded order
+        """
+        return DecodedExclusiveDutchOrder(_as_buffer(encoded_order))
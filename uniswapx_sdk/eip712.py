@@ -0,0 +1,170 @@
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TYPE_CHECKING,
+)
+
+from eth_utils import keccak
+from hexbytes import HexBytes
+
+from uniswapx_sdk.constants import (
+    exclusive_dutch_order_types,
+    permit2_domain_data,
+)
+from uniswapx_sdk.instrumentation import (
+    EIP712_BUILD,
+    instrumented,
+)
+
+
+if TYPE_CHECKING:
+    from eth_account.messages import SignableMessage
+
+
+def _encode_struct_type(struct_type: str, types: Dict[str, List[Dict[str, str]]]) -> str:
+    return f"{struct_type}({','.join(field['type'] + ' ' + field['name'] for field in types[struct_type])})"
+
+
+def _encode_type(primary_type: str, types: Dict[str, List[Dict[str, str]]]) -> str:
+    """
+    EIP-712 encodeType: the primary type followed by all the referenced struct types, sorted by name.
+    """
+    dependencies: List[str] = []
+    pending = [primary_type]
+    while pending:
+        for field in types[pending.pop()]:
+            field_type = field["type"].split("[")[0]
+            if field_type in types and field_type != primary_type and field_type not in dependencies:
+                dependencies.append(field_type)
+                pending.append(field_type)
+    return "".join(_encode_struct_type(struct_type, types) for struct_type in [primary_type] + sorted(dependencies))
+
+
+# Type hashes are computed once, instead of re-parsing the types for each message
+_domain_types = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+    ]
+}
+_domain_type_hash = keccak(text=_encode_type("EIP712Domain", _domain_types))
+_permit_witness_transfer_from_type_hash = keccak(
+    text=_encode_type("PermitWitnessTransferFrom", exclusive_dutch_order_types)
+)
+_token_permissions_type_hash = keccak(text=_encode_type("TokenPermissions", exclusive_dutch_order_types))
+_exclusive_dutch_order_type_hash = keccak(text=_encode_type("ExclusiveDutchOrder", exclusive_dutch_order_types))
+_order_info_type_hash = keccak(text=_encode_type("OrderInfo", exclusive_dutch_order_types))
+_dutch_output_type_hash = keccak(text=_encode_type("DutchOutput", exclusive_dutch_order_types))
+_signable_message_version = HexBytes(b"\x01")
+_signable_message_class: Optional[Type["SignableMessage"]] = None
+
+
+def _signable_message(header: bytes, body: bytes) -> "SignableMessage":
+    # eth_account is slow to import, so it is imported on the first message built, not with this module
+    global _signable_message_class
+    if _signable_message_class is None:
+        from eth_account.messages import SignableMessage
+        _signable_message_class = SignableMessage
+    return _signable_message_class(_signable_message_version, header, body)
+
+
+def _uint(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+def _address(value: str) -> bytes:
+    return bytes(12) + bytes.fromhex(value[2:])
+
+
+@lru_cache(maxsize=None)
+def get_permit2_domain_separator(chain_id: int) -> bytes:
+    """
+    :param chain_id: the chain id
+    :return: the (cached) EIP-712 domain separator of Permit2 on this chain
+    """
+    return keccak(
+        _domain_type_hash
+        + keccak(text=str(permit2_domain_data["name"]))
+        + _uint(chain_id)
+        + _address(str(permit2_domain_data["verifyingContract"]))
+    )
+
+
+def hash_order_info(order_info: Sequence[Any]) -> bytes:
+    """
+    :param order_info: the OrderInfo tuple (reactor, swapper, nonce, deadline, validation contract, validation data)
+    :return: the EIP-712 struct hash of the OrderInfo
+    """
+    reactor, swapper, nonce, deadline, validation_contract, validation_data = order_info
+    return keccak(
+        _order_info_type_hash
+        + _address(reactor)
+        + _address(swapper)
+        + _uint(nonce)
+        + _uint(deadline)
+        + _address(validation_contract)
+        + keccak(validation_data)
+    )
+
+
+def hash_exclusive_dutch_order(order: Sequence[Any]) -> bytes:
+    """
+    Compute the EIP-712 struct hash of an ExclusiveDutchOrder, which is also its UniswapX order hash.
+    :param order: the order tuple, as given to the ABI encoder or returned by the decoder
+    :return: the EIP-712 struct hash of the ExclusiveDutchOrder
+    """
+    info, decay_start_time, decay_end_time, exclusive_filler, override_bps, dutch_input, dutch_outputs = order
+    input_token, input_start_amount, input_end_amount = dutch_input
+    outputs_hash = keccak(
+        b"".join(
+            keccak(_dutch_output_type_hash + _address(token) + _uint(start) + _uint(end) + _address(recipient))
+            for token, start, end, recipient in dutch_outputs
+        )
+    )
+    return keccak(
+        _exclusive_dutch_order_type_hash
+        + hash_order_info(info)
+        + _uint(decay_start_time)
+        + _uint(decay_end_time)
+        + _address(exclusive_filler)
+        + _uint(override_bps)
+        + _address(input_token)
+        + _uint(input_start_amount)
+        + _uint(input_end_amount)
+        + outputs_hash
+    )
+
+
+def hash_permit_witness_transfer_from(order: Sequence[Any]) -> bytes:
+    """
+    :param order: the order tuple, as given to the ABI encoder or returned by the decoder
+    :return: the EIP-712 struct hash of the Permit2 PermitWitnessTransferFrom message whose witness is the order
+    """
+    info, _, _, _, _, dutch_input, _ = order
+    reactor, _, nonce, deadline, _, _ = info
+    input_token, _, input_end_amount = dutch_input
+    return keccak(
+        _permit_witness_transfer_from_type_hash
+        + keccak(_token_permissions_type_hash + _address(input_token) + _uint(input_end_amount))
+        + _address(reactor)
+        + _uint(nonce)
+        + _uint(deadline)
+        + hash_exclusive_dutch_order(order)
+    )
+
+
+@instrumented(EIP712_BUILD)
+def create_exclusive_dutch_order_signable_message(chain_id: int, order: Sequence[Any]) -> "SignableMessage":
+    """
+    Create the Permit2 signable message of an ExclusiveDutchOrder, without re-parsing the EIP-712 types.
+    :param chain_id: the chain id
+    :param order: the order tuple, as given to the ABI encoder or returned by the decoder
+    :return: the same SignableMessage as eth_account's encode_typed_data()
+    """
+    return _signable_message(get_permit2_domain_separator(chain_id), hash_permit_witness_transfer_from(order))
@@ -1,8 +1,4 @@
-from dataclasses import (
-    asdict,
-    astuple,
-    dataclass,
-)
+from dataclasses import dataclass
 from random import randint
 import time
 from typing import (
@@ -10,26 +6,34 @@ from typing import (
     Dict,
     Sequence,
     Tuple,
+    TYPE_CHECKING,
     Union,
 )
 
 from eth_abi import encode
-from eth_account.messages import (
-    encode_typed_data,
-    SignableMessage,
-)
-from web3 import Web3
-from web3.types import (
+from eth_typing import (
     ChecksumAddress,
     HexStr,
 )
 
+from uniswapx_sdk.address import to_checksum_address
 from uniswapx_sdk.constants import (
     _execute_function_selector,
     exclusive_dutch_order_abi,
     exclusive_dutch_order_types,
     permit2_domain_data,
 )
+from uniswapx_sdk.eip712 import create_exclusive_dutch_order_signable_message
+from uniswapx_sdk.fast_codec import encode_exclusive_dutch_order
+from uniswapx_sdk.instrumentation import (
+    ABI_ENCODE,
+    EIP712_BUILD,
+    instrumented,
+)
+
+
+if TYPE_CHECKING:
+    from eth_account.messages import SignableMessage
 
 
 @dataclass
@@ -42,9 +46,9 @@ class ExclusiveDutchOrderInfo:
     validation_data: bytes = b""
 
     def __post_init__(self) -> None:
-        self.reactor = Web3.to_checksum_address(self.reactor)
-        self.swapper = Web3.to_checksum_address(self.swapper)
-        self.validation_callback = Web3.to_checksum_address(self.validation_callback)
+        self.reactor = to_checksum_address(self.reactor)
+        self.swapper = to_checksum_address(self.swapper)
+        self.validation_callback = to_checksum_address(self.validation_callback)
 
 
 @dataclass
@@ -54,7 +58,7 @@ class ExclusiveDutchOrderInput:
     end_amount: int
 
     def __post_init__(self) -> None:
-        self.token = Web3.to_checksum_address(self.token)
+        self.token = to_checksum_address(self.token)
 
 
 @dataclass
@@ -63,7 +67,7 @@ class ExclusiveDutchOrderOutput(ExclusiveDutchOrderInput):
 
     def __post_init__(self) -> None:
         super().__post_init__()
-        self.recipient = Web3.to_checksum_address(self.recipient)
+        self.recipient = to_checksum_address(self.recipient)
 
 
 @dataclass(frozen=True)
@@ -78,7 +82,135 @@ class ExclusiveFiller:
     override_bps: int = 0
 
     def __post_init__(self) -> None:
-        self.filler = Web3.to_checksum_address(self.filler)
+        self.filler = to_checksum_address(self.filler)
+
+
+class ExclusiveDutchOrder:
+    """
+    Compact representation of a whole ExclusiveDutchOrder, which directly produces
+    the ABI argument tuple and the EIP-712 message data without intermediate copies.
+    """
+    __slots__ = (
+        "reactor",
+        "swapper",
+        "nonce",
+        "deadline",
+        "validation_callback",
+        "validation_data",
+        "decay_start_time",
+        "decay_end_time",
+        "exclusive_filler",
+        "exclusivity_override_bps",
+        "input_token",
+        "input_start_amount",
+        "input_end_amount",
+        "outputs",
+    )
+
+    def __init__(
+            self,
+            reactor: Union[ChecksumAddress, HexStr, str, bytes],
+            swapper: Union[ChecksumAddress, HexStr, str, bytes],
+            nonce: int,
+            deadline: int,
+            decay_start_time: int,
+            decay_end_time: int,
+            input_token: Union[ChecksumAddress, HexStr, str, bytes],
+            input_start_amount: int,
+            input_end_amount: int,
+            outputs: Sequence[Tuple[Union[ChecksumAddress, HexStr, str, bytes], int, int, Union[ChecksumAddress, HexStr, str, bytes]]],  # noqa
+            exclusive_filler: Union[ChecksumAddress, HexStr, str, bytes] = "0x0000000000000000000000000000000000000000",  # noqa
+            exclusivity_override_bps: int = 0,
+            validation_callback: Union[ChecksumAddress, HexStr, str, bytes] = "0x0000000000000000000000000000000000000000",  # noqa
+            validation_data: bytes = b"") -> None:
+        """
+        :param outputs: the (token, start_amount, end_amount, recipient) of each output
+        """
+        self.reactor = to_checksum_address(reactor)
+        self.swapper = to_checksum_address(swapper)
+        self.nonce = nonce
+        self.deadline = deadline
+        self.validation_callback = to_checksum_address(validation_callback)
+        self.validation_data = validation_data
+        self.decay_start_time = decay_start_time
+        self.decay_end_time = decay_end_time
+        self.exclusive_filler = to_checksum_address(exclusive_filler)
+        self.exclusivity_override_bps = exclusivity_override_bps
+        self.input_token = to_checksum_address(input_token)
+        self.input_start_amount = input_start_amount
+        self.input_end_amount = input_end_amount
+        self.outputs = tuple(
+            (to_checksum_address(token), start_amount, end_amount, to_checksum_address(recipient))
+            for token, start_amount, end_amount, recipient in outputs
+        )
+
+    @classmethod
+    def from_dataclasses(
+            cls,
+            order_info: ExclusiveDutchOrderInfo,
+            decay_time: DecayTime,
+            dutch_input: ExclusiveDutchOrderInput,
+            dutch_outputs: Tuple[ExclusiveDutchOrderOutput, ...],
+            exclusive_filler: ExclusiveFiller = ExclusiveFiller()) -> "ExclusiveDutchOrder":
+        """
+        Build a compact order from the order dataclasses.
+        """
+        return cls(
+            reactor=order_info.reactor,
+            swapper=order_info.swapper,
+            nonce=order_info.nonce,
+            deadline=order_info.deadline,
+            decay_start_time=decay_time.decay_start_time,
+            decay_end_time=decay_time.decay_end_time,
+            input_token=dutch_input.token,
+            input_start_amount=dutch_input.start_amount,
+            input_end_amount=dutch_input.end_amount,
+            outputs=[(o.token, o.start_amount, o.end_amount, o.recipient) for o in dutch_outputs],
+            exclusive_filler=exclusive_filler.filler,
+            exclusivity_override_bps=exclusive_filler.override_bps,
+            validation_callback=order_info.validation_callback,
+            validation_data=order_info.validation_data,
+        )
+
+    def to_args(self) -> Tuple[Any, ...]:
+        """
+        :return: the order tuple to be ABI encoded
+        """
+        return (
+            (self.reactor, self.swapper, self.nonce, self.deadline, self.validation_callback, self.validation_data),
+            self.decay_start_time,
+            self.decay_end_time,
+            self.exclusive_filler,
+            self.exclusivity_override_bps,
+            (self.input_token, self.input_start_amount, self.input_end_amount),
+            self.outputs,
+        )
+
+    def to_message_data(self) -> Dict[str, Any]:
+        """
+        :return: the EIP-712 ExclusiveDutchOrder message data (the Permit2 witness)
+        """
+        return {
+            "info": {
+                "reactor": self.reactor,
+                "swapper": self.swapper,
+                "nonce": self.nonce,
+                "deadline": self.deadline,
+                "additionalValidationContract": self.validation_callback,
+                "additionalValidationData": self.validation_data,
+            },
+            "decayStartTime": self.decay_start_time,
+            "decayEndTime": self.decay_end_time,
+            "exclusiveFiller": self.exclusive_filler,
+            "exclusivityOverrideBps": self.exclusivity_override_bps,
+            "inputToken": self.input_token,
+            "inputStartAmount": self.input_start_amount,
+            "inputEndAmount": self.input_end_amount,
+            "outputs": [
+                {"token": token, "startAmount": start_amount, "endAmount": end_amount, "recipient": recipient}
+                for token, start_amount, end_amount, recipient in self.outputs
+            ],
+        }
 
 
 def get_deadline(duration: int = 10 * 60) -> int:
@@ -102,10 +234,13 @@ class Encoder:
         self.chain_id = chain_id
         self.order_abi = order_abi
 
+    @instrumented(ABI_ENCODE)
     def encode(self, args: Sequence[Any]) -> bytes:
         return encode(self.order_abi, args)
 
-    def create_signable_message(self, message_types: Dict[str, Any], message_data: Dict[str, Any]) -> SignableMessage:
+    @instrumented(EIP712_BUILD)
+    def create_signable_message(self, message_types: Dict[str, Any], message_data: Dict[str, Any]) -> "SignableMessage":
+        from eth_account.messages import encode_typed_data
         domain_data = dict(permit2_domain_data)
         domain_data["chainId"] = self.chain_id
         return encode_typed_data(
@@ -129,6 +264,14 @@ class ExclusiveDutchOrderEncoder(Encoder):
     def __init__(self, chain_id: int) -> None:
         super().__init__(chain_id, exclusive_dutch_order_abi)
 
+    @instrumented(ABI_ENCODE)
+    def encode(self, args: Sequence[Any]) -> bytes:
+        if len(args) == 1:
+            encoded_order = encode_exclusive_dutch_order(args[0])
+            if encoded_order is not None:
+                return encoded_order
+        return encode(self.order_abi, args)
+
     @staticmethod
     def _create_args(
             order_info: ExclusiveDutchOrderInfo,
@@ -136,12 +279,9 @@ class ExclusiveDutchOrderEncoder(Encoder):
             dutch_input: ExclusiveDutchOrderInput,
             dutch_outputs: Tuple[ExclusiveDutchOrderOutput, ...],
             exclusive_filler: ExclusiveFiller) -> Tuple[Any, ...]:
-        args = [astuple(order_info)]
-        args.extend(astuple(decay_time))
-        args.extend(astuple(exclusive_filler))
-        args.append(astuple(dutch_input))
-        args.append(tuple(map(lambda dutch_output: astuple(dutch_output), dutch_outputs)))
-        return tuple(args)
+        return ExclusiveDutchOrder.from_dataclasses(
+            order_info, decay_time, dutch_input, dutch_outputs, exclusive_filler
+        ).to_args()
 
     def encode_order(
             self,
@@ -149,7 +289,7 @@ class ExclusiveDutchOrderEncoder(Encoder):
             decay_time: DecayTime,
             dutch_input: ExclusiveDutchOrderInput,
             dutch_outputs: Tuple[ExclusiveDutchOrderOutput, ...],
-            exclusive_filler: ExclusiveFiller = ExclusiveFiller()) -> Tuple[bytes, SignableMessage]:
+            exclusive_filler: ExclusiveFiller = ExclusiveFiller()) -> Tuple[bytes, "SignableMessage"]:
         """
         Encode the order and create the signable message to be signed.
         :param order_info: a valid instance of ExclusiveDutchOrderInfo
@@ -161,9 +301,18 @@ class ExclusiveDutchOrderEncoder(Encoder):
         """
         args = self._create_args(order_info, decay_time, dutch_input, dutch_outputs, exclusive_filler)
         encoded_order = self.encode([args, ])
-        message = self._create_signable_message(order_info, decay_time, dutch_input, dutch_outputs, exclusive_filler)
+        message = create_exclusive_dutch_order_signable_message(self.chain_id, args)
         return encoded_order, message
 
+    def encode_compact_order(self, order: ExclusiveDutchOrder) -> Tuple[bytes, "SignableMessage"]:
+        """
+        Encode the compact order and create the signable message to be signed.
+        :param order: a valid instance of ExclusiveDutchOrder
+        :return: the encoded order as bytes and a SignableMessage ready to be signed
+        """
+        args = order.to_args()
+        return self.encode([args, ]), create_exclusive_dutch_order_signable_message(self.chain_id, args)
+
     @staticmethod
     def _create_message_data(
             order_info: ExclusiveDutchOrderInfo,
@@ -171,29 +320,9 @@ class ExclusiveDutchOrderEncoder(Encoder):
             dutch_input: ExclusiveDutchOrderInput,
             dutch_outputs: Tuple[ExclusiveDutchOrderOutput, ...],
             exclusive_filler: ExclusiveFiller) -> Dict[str, Any]:
-
-        order_info_data = asdict(order_info)
-        order_info_data["additionalValidationContract"] = order_info_data.pop("validation_callback")
-        order_info_data["additionalValidationData"] = order_info_data.pop("validation_data")
-
-        outputs = []
-        for output in dutch_outputs:
-            output_data = asdict(output)
-            output_data["startAmount"] = output_data.pop("start_amount")
-            output_data["endAmount"] = output_data.pop("end_amount")
-            outputs.append(output_data)
-
-        return {
-            "info": order_info_data,
-            "decayStartTime": decay_time.decay_start_time,
-            "decayEndTime": decay_time.decay_end_time,
-            "exclusiveFiller": exclusive_filler.filler,
-            "exclusivityOverrideBps": exclusive_filler.override_bps,
-            "inputToken": dutch_input.token,
-            "inputStartAmount": dutch_input.start_amount,
-            "inputEndAmount": dutch_input.end_amount,
-            "outputs": outputs,
-        }
+        return ExclusiveDutchOrder.from_dataclasses(
+            order_info, decay_time, dutch_input, dutch_outputs, exclusive_filler
+        ).to_message_data()
 
     def _create_signable_message(
             self,
@@ -201,7 +330,21 @@ class ExclusiveDutchOrderEncoder(Encoder):
             decay_time: DecayTime,
             dutch_input: ExclusiveDutchOrderInput,
             dutch_outputs: Tuple[ExclusiveDutchOrderOutput, ...],
-            exclusive_filler: ExclusiveFiller = ExclusiveFiller()) -> SignableMessage:
+            exclusive_filler: ExclusiveFiller = ExclusiveFiller()) -> "SignableMessage":
+        args = self._create_args(order_info, decay_time, dutch_input, dutch_outputs, exclusive_filler)
+        return create_exclusive_dutch_order_signable_message(self.chain_id, args)
+
+    def _create_typed_data_signable_message(
+            self,
+            order_info: ExclusiveDutchOrderInfo,
+            decay_time: DecayTime,
+            dutch_input: ExclusiveDutchOrderInput,
+            dutch_outputs: Tuple[ExclusiveDutchOrderOutput, ...],
+            exclusive_filler: ExclusiveFiller = ExclusiveFiller()) -> "SignableMessage":
+        """
+        Create the signable message with the generic EIP-712 implementation of eth_account,
+        which is slower than the precompiled hashing but used as a reference.
+        """
         witness_data = self._create_message_data(order_info, decay_time, dutch_input, dutch_outputs, exclusive_filler)
         message_data = {
             "permitted": {
@@ -16,7 +16,11 @@ class OrderValidationError(UniswapXException):
     """
     Base class for all order validation errors
     """
-    def __init__(self, info: str, message: Optional[str], data: Optional[Union[str, Dict[str, str]]]) -> None:
+    def __init__(
+            self,
+            info: str = "Order Validation Error",
+            message: Optional[str] = None,
+            data: Optional[Union[str, Dict[str, str]]] = None) -> None:
         self.info = info
         self.message = message
         self.data = data
@@ -60,6 +64,7 @@ class InsufficientFundsError(OrderValidationError):
 order_validation_exceptions = {
     "0x8baa579f": InvalidSignatureError,
     "0x815e1d64": InvalidSignatureError,
+    "0x4be6321b": InvalidSignatureError,
     "0x756688fe": NonceUsedError,
     "0x302e5b7c": InvalidOrderFieldsError,
     "0x773a6187": InvalidOrderFieldsError,
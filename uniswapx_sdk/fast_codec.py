@@ -0,0 +1,193 @@
+from typing import (
+    Any,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+
+# Canonical ABI layout of '((address,address,uint256,uint256,address,bytes),uint256,uint256,address,uint256,(address,uint256,uint256),(address,uint256,uint256,address)[])'  # noqa
+# The order is a dynamic tuple, so the payload starts with its offset, followed by:
+#   - the order head: info offset, decayStartTime, decayEndTime, exclusiveFiller, exclusivityOverrideBps,
+#     inputToken, inputStartAmount, inputEndAmount, outputs offset
+#   - the info tuple: reactor, swapper, nonce, deadline, additionalValidationContract, validation data offset,
+#     then the validation data length and its right padded content
+#   - the outputs array: its length, then each (token, startAmount, endAmount, recipient) output
+_WORD = 32
+_ORDER_OFFSET = _WORD
+_ORDER_HEAD_SIZE = 9 * _WORD
+_INFO_HEAD_SIZE = 6 * _WORD
+_OUTPUT_SIZE = 4 * _WORD
+_UINT256_LIMIT = 2**256
+_ADDRESS_PADDING = bytes(12)
+_ORDER_OFFSET_WORD = _ORDER_OFFSET.to_bytes(_WORD, "big")
+_INFO_OFFSET_WORD = _ORDER_HEAD_SIZE.to_bytes(_WORD, "big")
+_VALIDATION_DATA_OFFSET_WORD = _INFO_HEAD_SIZE.to_bytes(_WORD, "big")
+
+
+def _ceil32(length: int) -> int:
+    return (length + _WORD - 1) // _WORD * _WORD
+
+
+def _read_uint(view: memoryview, position: int) -> int:
+    return int.from_bytes(view[position:position + _WORD], "big")
+
+
+def _read_address(view: memoryview, position: int) -> Optional[str]:
+    if view[position:position + 12] != _ADDRESS_PADDING:
+        return None
+    return "0x" + view[position + 12:position + _WORD].hex()
+
+
+def decode_exclusive_dutch_order(data: Union[bytes, bytearray, memoryview]) -> Optional[Tuple[Any, ...]]:
+    """
+    Decode an encoded ExclusiveDutchOrder by reading its canonical ABI layout directly.
+    The result is identical to what eth_abi returns for the order tuple.
+    :param data: the encoded order
+    :return: the decoded order tuple, or None if the payload does not follow the canonical layout,
+    in which case it must be decoded with eth_abi.
+    """
+    view = memoryview(data)
+    if view.format != "B":
+        view = view.cast("B")
+    size = view.nbytes
+    info_start = _ORDER_OFFSET + _ORDER_HEAD_SIZE
+    if size < info_start + _INFO_HEAD_SIZE + _WORD:
+        return None
+    if (
+            view[0:_WORD] != _ORDER_OFFSET_WORD
+            or view[_ORDER_OFFSET:_ORDER_OFFSET + _WORD] != _INFO_OFFSET_WORD
+            or view[info_start + 5 * _WORD:info_start + _INFO_HEAD_SIZE] != _VALIDATION_DATA_OFFSET_WORD
+    ):
+        return None
+
+    validation_data_length = _read_uint(view, info_start + _INFO_HEAD_SIZE)
+    validation_data_start = info_start + _INFO_HEAD_SIZE + _WORD
+    validation_data_end = validation_data_start + validation_data_length
+    outputs_start = validation_data_start + _ceil32(validation_data_length)
+    if outputs_start + _WORD > size or any(view[validation_data_end:outputs_start]):
+        return None
+    if _read_uint(view, _ORDER_OFFSET + 8 * _WORD) != outputs_start - _ORDER_OFFSET:
+        return None
+
+    output_count = _read_uint(view, outputs_start)
+    outputs_start += _WORD
+    if outputs_start + output_count * _OUTPUT_SIZE > size:
+        return None
+    outputs = []
+    for position in range(outputs_start, outputs_start + output_count * _OUTPUT_SIZE, _OUTPUT_SIZE):
+        output_token = _read_address(view, position)
+        recipient = _read_address(view, position + 3 * _WORD)
+        if output_token is None or recipient is None:
+            return None
+        outputs.append(
+            (output_token, _read_uint(view, position + _WORD), _read_uint(view, position + 2 * _WORD), recipient)
+        )
+
+    reactor = _read_address(view, info_start)
+    swapper = _read_address(view, info_start + _WORD)
+    validation_contract = _read_address(view, info_start + 4 * _WORD)
+    exclusive_filler = _read_address(view, _ORDER_OFFSET + 3 * _WORD)
+    input_token = _read_address(view, _ORDER_OFFSET + 5 * _WORD)
+    if reactor is None or swapper is None or validation_contract is None or exclusive_filler is None or input_token is None:  # noqa
+        return None
+
+    return (
+        (
+            reactor,
+            swapper,
+            _read_uint(view, info_start + 2 * _WORD),
+            _read_uint(view, info_start + 3 * _WORD),
+            validation_contract,
+            view[validation_data_start:validation_data_end].tobytes(),
+        ),
+        _read_uint(view, _ORDER_OFFSET + _WORD),
+        _read_uint(view, _ORDER_OFFSET + 2 * _WORD),
+        exclusive_filler,
+        _read_uint(view, _ORDER_OFFSET + 4 * _WORD),
+        (
+            input_token,
+            _read_uint(view, _ORDER_OFFSET + 6 * _WORD),
+            _read_uint(view, _ORDER_OFFSET + 7 * _WORD),
+        ),
+        tuple(outputs),
+    )
+
+
+def _uint_word(value: Any) -> Optional[bytes]:
+    if type(value) is not int or not 0 <= value < _UINT256_LIMIT:
+        return None
+    return value.to_bytes(_WORD, "big")
+
+
+def _address_word(value: Any) -> Optional[bytes]:
+    if isinstance(value, str):
+        if len(value) != 42 or not value.startswith("0x"):
+            return None
+        try:
+            return _ADDRESS_PADDING + bytes.fromhex(value[2:])
+        except ValueError:
+            return None
+    if isinstance(value, (bytes, bytearray)) and len(value) == 20:
+        return _ADDRESS_PADDING + value
+    return None
+
+
+def encode_exclusive_dutch_order(order: Sequence[Any]) -> Optional[bytes]:
+    """
+    Encode an ExclusiveDutchOrder argument tuple by writing its canonical ABI layout directly.
+    The result is identical to what eth_abi returns for the order tuple.
+    Addresses are expected to have been checksummed already, as done by the order dataclasses.
+    :param order: the order argument tuple, as built by ExclusiveDutchOrderEncoder._create_args()
+    :return: the encoded order, or None if a value cannot be encoded by the fast path,
+    in which case it must be encoded with eth_abi.
+    """
+    try:
+        info, decay_start_time, decay_end_time, exclusive_filler, override_bps, dutch_input, dutch_outputs = order
+        reactor, swapper, nonce, deadline, validation_contract, validation_data = info
+        input_token, input_start_amount, input_end_amount = dutch_input
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(validation_data, (bytes, bytearray)) or not isinstance(dutch_outputs, (list, tuple)):
+        return None
+
+    validation_data_length = len(validation_data)
+    padded_validation_data_length = _ceil32(validation_data_length)
+    outputs_offset = _ORDER_HEAD_SIZE + _INFO_HEAD_SIZE + _WORD + padded_validation_data_length
+    words = [
+        _ORDER_OFFSET_WORD,
+        # order head
+        _INFO_OFFSET_WORD,
+        _uint_word(decay_start_time),
+        _uint_word(decay_end_time),
+        _address_word(exclusive_filler),
+        _uint_word(override_bps),
+        _address_word(input_token),
+        _uint_word(input_start_amount),
+        _uint_word(input_end_amount),
+        _uint_word(outputs_offset),
+        # info
+        _address_word(reactor),
+        _address_word(swapper),
+        _uint_word(nonce),
+        _uint_word(deadline),
+        _address_word(validation_contract),
+        _VALIDATION_DATA_OFFSET_WORD,
+        _uint_word(validation_data_length),
+        bytes(validation_data) + bytes(padded_validation_data_length - validation_data_length),
+        # outputs
+        _uint_word(len(dutch_outputs)),
+    ]
+    for dutch_output in dutch_outputs:
+        try:
+            output_token, start_amount, end_amount, recipient = dutch_output
+        except (TypeError, ValueError):
+            return None
+        words.extend(
+            (_address_word(output_token), _uint_word(start_amount), _uint_word(end_amount), _address_word(recipient))
+        )
+
+    if None in words:
+        return None
+    return b"".join(words)  # type: ignore[arg-type]
@@ -0,0 +1,247 @@
+"""
+Opt-in timing and counting of the SDK hot paths.
+Nothing is recorded until a sink is set with set_sink(): when disabled, an instrumented call costs a global lookup.
+"""
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from bisect import bisect_left
+from functools import wraps
+from threading import Lock
+import time
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+
+# Instrumented stages
+CHECKSUM_ADDRESS = "checksum_address"
+ABI_ENCODE = "abi_encode"
+EIP712_BUILD = "eip712_build"
+DECODE = "decode"
+API_REQUEST = "api_request"
+API_PARSE = "api_parse"
+QUOTER_RPC = "quoter_rpc"
+ERROR_MAPPING = "error_mapping"
+
+# Upper bounds of the histogram buckets, in seconds
+default_buckets = (
+    1e-6, 2.5e-6, 5e-6,
+    1e-5, 2.5e-5, 5e-5,
+    1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3,
+    1e-2, 2.5e-2, 5e-2,
+    0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Sink(ABC):
+    """
+    Receives the measures of the instrumented stages. Subclass it to publish them anywhere.
+    """
+    @abstractmethod
+    def record(self, stage: str, duration: float, error: bool = False) -> None:
+        """
+        :param stage: the stage name, e.g. DECODE
+        :param duration: the stage duration, in seconds
+        :param error: True if the stage raised an exception
+        """
+
+
+_sink: Optional[Sink] = None
+
+
+def set_sink(sink: Optional[Sink]) -> Optional[Sink]:
+    """
+    Enable the instrumentation, publishing to sink, or disable it if sink is None.
+    :return: the previous sink, if any
+    """
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+
+def get_sink() -> Optional[Sink]:
+    return _sink
+
+
+def instrumented(stage: str) -> Callable[[F], F]:
+    """
+    Decorator recording the duration of each call of a (synchronous) function as the given stage.
+    """
+    def decorator(function: F) -> F:
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            sink = _sink
+            if sink is None:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            except BaseException:
+                sink.record(stage, time.perf_counter() - start, True)
+                raise
+            sink.record(stage, time.perf_counter() - start)
+            return result
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+class _Timer:
+    __slots__ = ("sink", "stage", "start")
+
+    def __init__(self, sink: Sink, stage: str) -> None:
+        self.sink = sink
+        self.stage = stage
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc_val: Optional[BaseException],
+            exc_tb: Optional[TracebackType]) -> None:
+        self.sink.record(self.stage, time.perf_counter() - self.start, exc_type is not None)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc_val: Optional[BaseException],
+            exc_tb: Optional[TracebackType]) -> None:
+        pass
+
+
+_null_timer = _NullTimer()
+
+
+def timer(stage: str) -> Any:
+    """
+    Context manager recording the duration of its block as the given stage. Usable around awaits.
+    """
+    sink = _sink
+    return _null_timer if sink is None else _Timer(sink, stage)
+
+
+class Histogram:
+    """
+    Duration histogram of a stage, with fixed buckets.
+    """
+    def __init__(self, buckets: Sequence[float] = default_buckets) -> None:
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)  # the last one is +Inf
+        self.count = 0
+        self.error_count = 0
+        self.total = 0.0
+
+    def observe(self, duration: float, error: bool = False) -> None:
+        self.bucket_counts[bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.error_count += error
+        self.total += duration
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        :param q: the percentile, between 0 and 100
+        :return: the upper bound of the bucket holding the percentile (inf if above the last bucket, 0 if empty)
+        """
+        if not 0 <= q <= 100:
+            raise ValueError(f"Invalid percentile: {q}. Must be between 0 and 100")
+        rank = max(1, q * self.count / 100)
+        cumulative_count = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= rank:
+                return self.buckets[i] if i < len(self.buckets) else float("inf")
+        return 0.0
+
+
+class HistogramSink(Sink):
+    """
+    Thread-safe sink keeping a duration histogram per stage in memory, which can be exported in the Prometheus
+    text format.
+    """
+    def __init__(self, buckets: Sequence[float] = default_buckets) -> None:
+        self.buckets = tuple(buckets)
+        self.histograms: Dict[str, Histogram] = {}
+        self._lock = Lock()
+
+    def record(self, stage: str, duration: float, error: bool = False) -> None:
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram(self.buckets)
+            histogram.observe(duration, error)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+
+    def export_prometheus(self, prefix: str = "uniswapx_sdk") -> str:
+        """
+        :param prefix: the metric name prefix
+        :return: the histograms in the Prometheus text exposition format
+        """
+        duration_name, errors_name = f"{prefix}_stage_duration_seconds", f"{prefix}_stage_errors_total"
+        durations: List[str] = [
+            f"# HELP {duration_name} Duration of the SDK stages.",
+            f"# TYPE {duration_name} histogram",
+        ]
+        errors: List[str] = [
+            f"# HELP {errors_name} Number of SDK stages which raised an exception.",
+            f"# TYPE {errors_name} counter",
+        ]
+        with self._lock:
+            for stage, histogram in sorted(self.histograms.items()):
+                cumulative_count = 0
+                for bound, bucket_count in zip(self.buckets, histogram.bucket_counts):
+                    cumulative_count += bucket_count
+                    durations.append(f'{duration_name}_bucket{{stage="{stage}",le="{bound!r}"}} {cumulative_count}')
+                durations.append(f'{duration_name}_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+                durations.append(f'{duration_name}_sum{{stage="{stage}"}} {histogram.total!r}')
+                durations.append(f'{duration_name}_count{{stage="{stage}"}} {histogram.count}')
+                errors.append(f'{errors_name}{{stage="{stage}"}} {histogram.error_count}')
+        return "\n".join(durations + errors) + "\n"
+
+
+class OpenTelemetrySink(Sink):
+    """
+    Sink recording the durations in an OpenTelemetry histogram, with the stage and error as attributes.
+    Requires opentelemetry-api if no meter is given.
+    """
+    def __init__(self, meter: Optional[Any] = None, name: str = "uniswapx_sdk.stage.duration") -> None:
+        """
+        :param meter: optional. An OpenTelemetry Meter. Default to the 'uniswapx_sdk' meter of the global provider.
+        :param name: the histogram name
+        """
+        if meter is None:
+            from opentelemetry import metrics
+            meter = metrics.get_meter("uniswapx_sdk")
+        self._histogram = meter.create_histogram(name, unit="s", description="Duration of the SDK stages")
+
+    def record(self, stage: str, duration: float, error: bool = False) -> None:
+        self._histogram.record(duration, {"stage": stage, "error": error})
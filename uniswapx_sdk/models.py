@@ -0,0 +1,165 @@
+import json
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from uniswapx_sdk.decoder import (
+    DecodedExclusiveDutchOrder,
+    ExclusiveDutchOrderDecoder,
+)
+
+
+try:
+    import orjson
+    json_loads: Callable[[Union[str, bytes]], Any] = orjson.loads
+except ImportError:  # pragma: no cover
+    json_loads = json.loads
+
+_decoder = ExclusiveDutchOrderDecoder()
+
+
+def _hex_to_bytes(value: Optional[str]) -> bytes:
+    if not value:
+        return b""
+    return bytes.fromhex(value[2:] if value[:2] in ("0x", "0X") else value)
+
+
+# the API order fields mapped to an APIOrder attribute
+_mapped_fields = frozenset(
+    ("orderHash", "orderStatus", "encodedOrder", "signature", "chainId", "createdAt", "type", "txHash")
+)
+
+
+class APIOrder:
+    """
+    An order returned by UniswapX API, with its encoded order and signature as bytes.
+    The encoded order is decoded lazily, on first access to decoded_order.
+    The fields of the API order which are not mapped to an attribute (input, outputs, settledAmounts, ...)
+    are kept as is in extra.
+    """
+    __slots__ = (
+        "order_hash",
+        "order_status",
+        "encoded_order",
+        "signature",
+        "chain_id",
+        "created_at",
+        "order_type",
+        "tx_hash",
+        "extra",
+        "_decoded_order",
+    )
+
+    def __init__(
+            self,
+            order_hash: str,
+            order_status: str,
+            encoded_order: bytes,
+            signature: bytes,
+            chain_id: Optional[int] = None,
+            created_at: Optional[int] = None,
+            order_type: Optional[str] = None,
+            tx_hash: Optional[str] = None,
+            extra: Optional[Dict[str, Any]] = None) -> None:
+        self.order_hash = order_hash
+        self.order_status = order_status
+        self.encoded_order = encoded_order
+        self.signature = signature
+        self.chain_id = chain_id
+        self.created_at = created_at
+        self.order_type = order_type
+        self.tx_hash = tx_hash
+        self.extra = extra if extra is not None else {}
+        self._decoded_order: Optional[DecodedExclusiveDutchOrder] = None
+
+    @classmethod
+    def from_dict(cls, order: Dict[str, Any]) -> "APIOrder":
+        """
+        :param order: an order as returned by the API
+        :return: the typed order
+        """
+        return cls(
+            order["orderHash"],
+            order["orderStatus"],
+            _hex_to_bytes(order.get("encodedOrder")),
+            _hex_to_bytes(order.get("signature")),
+            order.get("chainId"),
+            order.get("createdAt"),
+            order.get("type"),
+            order.get("txHash"),
+            {name: value for name, value in order.items() if name not in _mapped_fields},
+        )
+
+    @property
+    def decoded_order(self) -> DecodedExclusiveDutchOrder:
+        """
+        The lazy view on the encoded order, as returned by ExclusiveDutchOrderDecoder.decode_lazy()
+        """
+        if self._decoded_order is None:
+            self._decoded_order = _decoder.decode_lazy(self.encoded_order)
+        return self._decoded_order
+
+    def decode(self) -> Tuple[Any, ...]:
+        """
+        :return: the fully decoded order, as returned by ExclusiveDutchOrderDecoder.decode()[0]
+        """
+        decoded_order: Tuple[Any, ...] = _decoder.decode(self.encoded_order)[0]
+        return decoded_order
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, APIOrder):
+            return NotImplemented
+        return (
+            self.order_hash == other.order_hash
+            and self.order_status == other.order_status
+            and self.encoded_order == other.encoded_order
+            and self.signature == other.signature
+            and self.chain_id == other.chain_id
+            and self.created_at == other.created_at
+            and self.order_type == other.order_type
+            and self.tx_hash == other.tx_hash
+            and self.extra == other.extra
+        )
+
+    def __repr__(self) -> str:
+        return f"APIOrder(order_hash={self.order_hash!r}, order_status={self.order_status!r})"
+
+
+class OrdersPage:
+    """
+    A page of orders returned by UniswapX API, with the cursor to the next page, if any.
+    """
+    __slots__ = ("orders", "cursor")
+
+    def __init__(self, orders: List[APIOrder], cursor: Optional[str] = None) -> None:
+        self.orders = orders
+        self.cursor = cursor
+
+    @classmethod
+    def from_dict(cls, page: Dict[str, Any]) -> "OrdersPage":
+        return cls([APIOrder.from_dict(order) for order in page.get("orders") or []], page.get("cursor"))
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> "OrdersPage":
+        """
+        Parse an API response body, dropping each order dict as soon as it is converted, so the whole page is never
+        held twice in memory.
+        :param data: an API response body
+        :return: the parsed page
+        """
+        page = json_loads(data)
+        raw_orders: List[Dict[str, Any]] = page.pop("orders", None) or []
+        raw_orders.reverse()
+        orders = []
+        while raw_orders:
+            orders.append(APIOrder.from_dict(raw_orders.pop()))
+        return cls(orders, page.get("cursor"))
+
+    def __len__(self) -> int:
+        return len(self.orders)
@@ -0,0 +1,224 @@
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Mapping,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from eth_abi import (
+    decode,
+    encode,
+)
+from eth_typing import (
+    ChecksumAddress,
+    HexStr,
+)
+from eth_utils import (
+    function_signature_to_4byte_selector,
+    keccak,
+    to_bytes,
+)
+
+from uniswapx_sdk.address import to_checksum_address
+from uniswapx_sdk.constants import (
+    get_parsed_abi,
+    multicall3_abi,
+    multicall3_address,
+    permit2_address,
+)
+from uniswapx_sdk.decoder import (
+    EncodedOrder,
+    ExclusiveDutchOrderDecoder,
+)
+from uniswapx_sdk.exceptions import NonceUsedError
+
+
+if TYPE_CHECKING:
+    from web3 import AsyncWeb3
+    from web3.types import BlockIdentifier
+
+
+_nonce_bitmap_function_selector = function_signature_to_4byte_selector("nonceBitmap(address,uint256)")
+unordered_nonce_invalidation_topic = keccak(text="UnorderedNonceInvalidation(address,uint256,uint256)")
+fill_topic = keccak(text="Fill(bytes32,address,address,uint256)")
+_invalid_nonce_error = HexStr("0x756688fe")  # Permit2 InvalidNonce()
+
+
+def _as_bytes(value: Union[str, bytes]) -> bytes:
+    return to_bytes(hexstr=HexStr(value)) if isinstance(value, str) else bytes(value)
+
+
+def _address_key(address: Union[str, bytes]) -> str:
+    if isinstance(address, str):
+        return address.lower()
+    return "0x" + bytes(address)[-20:].hex()
+
+
+def split_nonce(nonce: int) -> Tuple[int, int]:
+    """
+    :param nonce: a Permit2 unordered nonce
+    :return: the position of the nonceBitmap word and the position of the nonce bit in this word
+    """
+    return nonce >> 8, nonce & 0xff
+
+
+class NonceBitmapIndex:
+    """
+    Local index of the Permit2 nonceBitmap words, per swapper, used to reject locally the orders whose nonce has
+    already been used, without quoting them.
+    The words are fetched in bulk through Multicall3 and kept up to date from the Permit2 UnorderedNonceInvalidation
+    and the reactor Fill events. Nonces can only be used once, so a bit set in the index is never wrong:
+    is_used() returns True only for the nonces known to be used.
+    Only the events emitted by Permit2 and by the given reactors are applied: the Fill events are ignored if no reactor
+    is given.
+    """
+    def __init__(
+            self,
+            reactors: Collection[Union[str, bytes]] = (),
+            permit2: Union[str, bytes] = permit2_address) -> None:
+        """
+        :param reactors: the addresses of the reactors whose Fill events are applied
+        :param permit2: the address of the Permit2 contract whose UnorderedNonceInvalidation events are applied
+        """
+        self._bitmaps: Dict[str, Dict[int, int]] = {}
+        self._reactors = frozenset(_address_key(reactor) for reactor in reactors)
+        self._permit2_address = to_checksum_address(permit2)
+        self._permit2 = self._permit2_address.lower()
+
+    def __len__(self) -> int:
+        return len(self._bitmaps)
+
+    def word_count(self) -> int:
+        return sum(len(words) for words in self._bitmaps.values())
+
+    def has_word(self, swapper: Union[str, bytes], word_pos: int) -> bool:
+        return word_pos in self._bitmaps.get(_address_key(swapper), {})
+
+    def set_word(self, swapper: Union[str, bytes], word_pos: int, bitmap: int) -> None:
+        """
+        Merge a nonceBitmap word into the index.
+        :param swapper: the swapper (Permit2 owner) address
+        :param word_pos: the word position
+        :param bitmap: the word value (bits set for used nonces)
+        """
+        words = self._bitmaps.setdefault(_address_key(swapper), {})
+        words[word_pos] = words.get(word_pos, 0) | bitmap
+
+    def mark_used(self, swapper: Union[str, bytes], nonce: int) -> None:
+        word_pos, bit_pos = split_nonce(nonce)
+        self.set_word(swapper, word_pos, 1 << bit_pos)
+
+    def is_used(self, swapper: Union[str, bytes], nonce: int) -> bool:
+        """
+        :param swapper: the swapper address
+        :param nonce: the order nonce
+        :return: True if the nonce is known to be used, False otherwise
+        """
+        words = self._bitmaps.get(_address_key(swapper))
+        if not words:
+            return False
+        word_pos, bit_pos = split_nonce(nonce)
+        return bool(words.get(word_pos, 0) >> bit_pos & 1)
+
+    def check(self, encoded_order: EncodedOrder) -> None:
+        """
+        Raise a NonceUsedError if the nonce of the order is known to be used.
+        :param encoded_order: A UniswapX encoded ExclusiveDutchOrder
+        """
+        info = ExclusiveDutchOrderDecoder.decode_lazy(encoded_order).info
+        if self.is_used(info.swapper, info.nonce):
+            raise NonceUsedError(message=_invalid_nonce_error, data=_invalid_nonce_error)
+
+    def remove_swapper(self, swapper: Union[str, bytes]) -> None:
+        self._bitmaps.pop(_address_key(swapper), None)
+
+    def clear(self) -> None:
+        self._bitmaps.clear()
+
+    def process_log(self, log: Mapping[str, Any]) -> bool:
+        """
+        Update the index from a Permit2 UnorderedNonceInvalidation or a reactor Fill event log.
+        :param log: the event log, as returned by eth_getLogs
+        :return: True if the log has been applied, False if it is not a nonce related event from Permit2 or
+        from a known reactor
+        """
+        topics = log["topics"]
+        emitter = log.get("address")
+        if not topics or emitter is None:
+            return False
+        topic = _as_bytes(topics[0])
+        if topic == unordered_nonce_invalidation_topic and _address_key(emitter) == self._permit2:
+            word_pos, mask = decode(["uint256", "uint256"], _as_bytes(log["data"]))
+            self.set_word(_as_bytes(topics[1]), word_pos, mask)
+            return True
+        elif topic == fill_topic and _address_key(emitter) in self._reactors:
+            nonce = decode(["uint256"], _as_bytes(log["data"]))[0]
+            self.mark_used(_as_bytes(topics[3]), nonce)
+            return True
+        return False
+
+    def process_logs(self, logs: Iterable[Mapping[str, Any]]) -> int:
+        """
+        :param logs: event logs, as returned by eth_getLogs
+        :return: the number of logs applied to the index
+        """
+        return sum(self.process_log(log) for log in logs)
+
+    async def fetch(
+            self,
+            w3: "AsyncWeb3",
+            words: Iterable[Tuple[Union[str, bytes], int]],
+            block_identifier: "BlockIdentifier" = "latest",
+            batch_size: int = 500,
+            multicall_address: ChecksumAddress = multicall3_address) -> None:
+        """
+        Fetch in bulk the given nonceBitmap words from the configured Permit2, with Multicall3 tryAggregate() calls.
+        :param w3: an AsyncWeb3 instance
+        :param words: the (swapper, word position) to fetch
+        :param block_identifier: Optional block number or string identifier. Default to 'latest'.
+        :param batch_size: the max number of words fetched per RPC call
+        """
+        if batch_size <= 0:
+            raise ValueError(f"Invalid batch_size: {batch_size}. Must be a positive integer")
+        keys = list(dict.fromkeys((_address_key(swapper), word_pos) for swapper, word_pos in words))
+        multicall = w3.eth.contract(address=multicall_address, abi=get_parsed_abi(multicall3_abi))
+        for i in range(0, len(keys), batch_size):
+            batch = keys[i:i + batch_size]
+            calls = [
+                (
+                    self._permit2_address,
+                    _nonce_bitmap_function_selector + encode(["address", "uint256"], [swapper, word_pos]),
+                )
+                for swapper, word_pos in batch
+            ]
+            call_results = await multicall.functions.tryAggregate(False, calls).call(block_identifier=block_identifier)
+            for (swapper, word_pos), (success, return_data) in zip(batch, call_results):
+                if success:
+                    self.set_word(swapper, word_pos, int.from_bytes(return_data, "big"))
+
+    async def fetch_for_orders(
+            self,
+            w3: "AsyncWeb3",
+            encoded_orders: Iterable[EncodedOrder],
+            block_identifier: "BlockIdentifier" = "latest",
+            batch_size: int = 500,
+            multicall_address: ChecksumAddress = multicall3_address) -> None:
+        """
+        Fetch the nonceBitmap words of the given orders which are not in the index yet.
+        :param w3: an AsyncWeb3 instance
+        :param encoded_orders: UniswapX encoded ExclusiveDutchOrders
+        :param block_identifier: Optional block number or string identifier. Default to 'latest'.
+        :param batch_size: the max number of words fetched per RPC call
+        """
+        missing_words: Set[Tuple[str, int]] = set()
+        for encoded_order in encoded_orders:
+            info = ExclusiveDutchOrderDecoder.decode_lazy(encoded_order).info
+            word_pos = split_nonce(info.nonce)[0]
+            if not self.has_word(info.swapper, word_pos):
+                missing_words.add((_address_key(info.swapper), word_pos))
+        await self.fetch(w3, missing_words, block_identifier, batch_size, multicall_address)
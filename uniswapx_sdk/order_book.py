@@ -0,0 +1,200 @@
+import heapq
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from uniswapx_sdk.decoder import DecodedExclusiveDutchOrder
+from uniswapx_sdk.validation import DecodedOrder
+
+
+_ZERO_ADDRESS = "0x" + "00" * 20
+
+
+class BookEntry(NamedTuple):
+    order_hash: str
+    order: DecodedOrder  # as given to OrderBook.add()
+    input_token: str
+    output_tokens: Tuple[str, ...]
+    swapper: str
+    exclusive_filler: Optional[str]  # None if no exclusive filler
+    deadline: int
+    payload: Any  # anything given along with the order, e.g. its signature or its APIOrder
+
+
+def _entry(order_hash: str, order: DecodedOrder, payload: Any) -> BookEntry:
+    if isinstance(order, DecodedExclusiveDutchOrder):
+        info = order.info
+        swapper, deadline = info.swapper, info.deadline
+        exclusive_filler, input_token = order.exclusive_filler, order.input_token
+        output_tokens = tuple(output.token.lower() for output in order.outputs)
+    else:
+        swapper, deadline = order[0][1], order[0][3]
+        exclusive_filler, input_token = order[3], order[5][0]
+        output_tokens = tuple(output[0].lower() for output in order[6])
+    exclusive_filler = exclusive_filler.lower()
+    return BookEntry(
+        order_hash.lower(),
+        order,
+        input_token.lower(),
+        output_tokens,
+        swapper.lower(),
+        exclusive_filler if exclusive_filler != _ZERO_ADDRESS else None,
+        deadline,
+        payload,
+    )
+
+
+class OrderBook:
+    """
+    In-memory book of decoded orders, keyed by order hash, with indexes by (input token, output token) pair,
+    by swapper and by exclusive filler, so lookups don't scan the book.
+    The orders are evicted once their deadline has passed: a min-heap of the deadlines is checked before
+    each operation, so the eviction costs O(log n) per expired order and nothing otherwise.
+    Addresses are case-insensitive.
+    """
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        """
+        :param clock: the function returning the current timestamp, against which the deadlines are checked
+        """
+        self.clock = clock
+        self._entries: Dict[str, BookEntry] = {}
+        self._by_pair: Dict[Tuple[str, str], Set[str]] = {}
+        self._by_swapper: Dict[str, Set[str]] = {}
+        self._by_exclusive_filler: Dict[str, Set[str]] = {}
+        # (deadline, order hash), including the entries removed since, which are skipped when popped
+        self._deadlines: List[Tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        self.evict_expired()
+        return len(self._entries)
+
+    def __contains__(self, order_hash: str) -> bool:
+        return self.get(order_hash) is not None
+
+    def __iter__(self) -> Iterator[BookEntry]:
+        self.evict_expired()
+        return iter(list(self._entries.values()))
+
+    @staticmethod
+    def _index_add(index: Dict[Any, Set[str]], key: Any, order_hash: str) -> None:
+        index.setdefault(key, set()).add(order_hash)
+
+    @staticmethod
+    def _index_remove(index: Dict[Any, Set[str]], key: Any, order_hash: str) -> None:
+        order_hashes = index.get(key)
+        if order_hashes is not None:
+            order_hashes.discard(order_hash)
+            if not order_hashes:
+                del index[key]
+
+    def add(self, order_hash: str, order: DecodedOrder, payload: Any = None) -> Optional[BookEntry]:
+        """
+        Add an order to the book, or replace the one with the same hash.
+        :param order_hash: the order hash
+        :param order: a decoded order, as returned by ExclusiveDutchOrderDecoder.decode()[0] or decode_lazy()
+        :param payload: optional. Anything to keep along with the order.
+        :return: the book entry, or None if the order has already expired
+        """
+        self.evict_expired()
+        entry = _entry(order_hash, order, payload)
+        self.remove(entry.order_hash)
+        if entry.deadline < self.clock():
+            return None
+        self._entries[entry.order_hash] = entry
+        for output_token in entry.output_tokens:
+            self._index_add(self._by_pair, (entry.input_token, output_token), entry.order_hash)
+        self._index_add(self._by_swapper, entry.swapper, entry.order_hash)
+        if entry.exclusive_filler:
+            self._index_add(self._by_exclusive_filler, entry.exclusive_filler, entry.order_hash)
+        heapq.heappush(self._deadlines, (entry.deadline, entry.order_hash))
+        return entry
+
+    def remove(self, order_hash: str) -> Optional[BookEntry]:
+        """
+        :param order_hash: the order hash
+        :return: the removed entry, or None if the order is not in the book
+        """
+        entry = self._entries.pop(order_hash.lower(), None)
+        if entry is None:
+            return None
+        for output_token in entry.output_tokens:
+            self._index_remove(self._by_pair, (entry.input_token, output_token), entry.order_hash)
+        self._index_remove(self._by_swapper, entry.swapper, entry.order_hash)
+        if entry.exclusive_filler:
+            self._index_remove(self._by_exclusive_filler, entry.exclusive_filler, entry.order_hash)
+        if len(self._deadlines) > 2 * len(self._entries) + 1024:
+            self._deadlines = [(entry.deadline, order_hash) for order_hash, entry in self._entries.items()]
+            heapq.heapify(self._deadlines)
+        return entry
+
+    def get(self, order_hash: str) -> Optional[BookEntry]:
+        self.evict_expired()
+        return self._entries.get(order_hash.lower())
+
+    def evict_expired(self, timestamp: Optional[float] = None) -> List[BookEntry]:
+        """
+        Remove the orders whose deadline has passed.
+        :param timestamp: optional. The current timestamp. Default to clock().
+        :return: the evicted entries
+        """
+        if not self._deadlines:
+            return []
+        if timestamp is None:
+            timestamp = self.clock()
+        evicted = []
+        while self._deadlines and self._deadlines[0][0] < timestamp:
+            deadline, order_hash = heapq.heappop(self._deadlines)
+            entry = self._entries.get(order_hash)
+            if entry is not None and entry.deadline == deadline:
+                self.remove(order_hash)
+                evicted.append(entry)
+        return evicted
+
+    def next_deadline(self) -> Optional[int]:
+        """
+        :return: the earliest deadline of the orders in the book, or None if it is empty
+        """
+        self.evict_expired()
+        while self._deadlines:
+            deadline, order_hash = self._deadlines[0]
+            entry = self._entries.get(order_hash)
+            if entry is not None and entry.deadline == deadline:
+                return deadline
+            heapq.heappop(self._deadlines)
+        return None
+
+    def _lookup(self, index: Dict[Any, Set[str]], key: Any) -> List[BookEntry]:
+        self.evict_expired()
+        return [self._entries[order_hash] for order_hash in index.get(key, ())]
+
+    def by_pair(self, input_token: str, output_token: str) -> List[BookEntry]:
+        """
+        :return: the orders selling input_token for (at least) output_token
+        """
+        return self._lookup(self._by_pair, (input_token.lower(), output_token.lower()))
+
+    def by_swapper(self, swapper: str) -> List[BookEntry]:
+        return self._lookup(self._by_swapper, swapper.lower())
+
+    def by_exclusive_filler(self, exclusive_filler: str) -> List[BookEntry]:
+        return self._lookup(self._by_exclusive_filler, exclusive_filler.lower())
+
+    def pairs(self) -> List[Tuple[str, str]]:
+        self.evict_expired()
+        return list(self._by_pair)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_pair.clear()
+        self._by_swapper.clear()
+        self._by_exclusive_filler.clear()
+        self._deadlines.clear()
@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from typing import (
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from eth_typing import HexStr
+from eth_utils import to_bytes
+from hexbytes import HexBytes
+
+from uniswapx_sdk.decoder import (
+    EncodedOrder,
+    ExclusiveDutchOrderDecoder,
+)
+from uniswapx_sdk.eip712 import hash_exclusive_dutch_order
+
+
+_decoder = ExclusiveDutchOrderDecoder()
+
+
+def compute_order_hash(encoded_order: EncodedOrder) -> HexBytes:
+    """
+    Compute locally the UniswapX order hash of an encoded ExclusiveDutchOrder,
+    which is the same as the 'hash' field of the order resolved by the OrderQuoter, or the API orderHash.
+    :param encoded_order: A UniswapX encoded ExclusiveDutchOrder
+    :return: the order hash
+    """
+    return HexBytes(hash_exclusive_dutch_order(_decoder.decode(encoded_order)[0]))
+
+
+class OrderDeduplicator:
+    """
+    Keep track of the orders already seen, keyed by their order hash, so they can be dropped before being resolved.
+    If max_size is given, the oldest order hashes are forgotten once this size is reached.
+    """
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        if max_size is not None and max_size <= 0:
+            raise ValueError(f"Invalid max_size: {max_size}. Must be a positive integer or None")
+        self.max_size = max_size
+        self._order_hashes: "OrderedDict[bytes, None]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._order_hashes)
+
+    def __contains__(self, order_hash: Union[HexStr, bytes]) -> bool:
+        if isinstance(order_hash, str):
+            order_hash = to_bytes(hexstr=order_hash)
+        return bytes(order_hash) in self._order_hashes
+
+    def add_hash(self, order_hash: Union[HexStr, bytes]) -> bool:
+        """
+        :param order_hash: an order hash
+        :return: True if the order hash had not been seen before, False otherwise
+        """
+        if isinstance(order_hash, str):
+            order_hash = to_bytes(hexstr=order_hash)
+        order_hash = bytes(order_hash)
+        if order_hash in self._order_hashes:
+            return False
+        self._order_hashes[order_hash] = None
+        if self.max_size is not None and len(self._order_hashes) > self.max_size:
+            self._order_hashes.popitem(last=False)
+        return True
+
+    def add(self, encoded_order: EncodedOrder) -> bool:
+        """
+        :param encoded_order: A UniswapX encoded ExclusiveDutchOrder
+        :return: True if the order had not been seen before, False otherwise
+        """
+        return self.add_hash(compute_order_hash(encoded_order))
+
+    def filter_new(self, encoded_orders: Iterable[EncodedOrder]) -> Iterator[EncodedOrder]:
+        """
+        Lazily yield the orders that have not been seen before, and mark them as seen.
+        :param encoded_orders: UniswapX encoded ExclusiveDutchOrders
+        :return: an iterator over the orders not seen before
+        """
+        for encoded_order in encoded_orders:
+            if self.add(encoded_order):
+                yield encoded_order
+
+    def clear(self) -> None:
+        self._order_hashes.clear()
@@ -0,0 +1,160 @@
+import asyncio
+import json
+from typing import (
+    Any,
+    cast,
+    Collection,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from aiohttp import ClientSession
+from eth_typing import URI
+from web3 import AsyncHTTPProvider
+from web3.types import (
+    RPCEndpoint,
+    RPCResponse,
+)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex()
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class BatchingAsyncHTTPProvider(AsyncHTTPProvider):
+    """
+    AsyncHTTPProvider which automatically groups the concurrent requests made within a short time window
+    (or up to max_batch_size requests) into a single JSON-RPC batch request,
+    and dispatches the responses back to each caller.
+    Only the batched_methods are grouped, the other ones are sent as usual.
+    The chain id is fetched only once, since web3 requests it before each eth_call. It is cleared when endpoint_uri
+    is changed, or with clear_chain_id().
+    The batches are sent with a session owned by the provider, to be closed with disconnect().
+    """
+    def __init__(
+            self,
+            endpoint_uri: Optional[Union[URI, str]] = None,
+            batch_window: float = 0.005,
+            max_batch_size: int = 100,
+            batched_methods: Collection[str] = ("eth_call", ),
+            request_kwargs: Optional[Any] = None) -> None:
+        if batch_window < 0:
+            raise ValueError(f"Invalid batch_window: {batch_window}. Must be a positive number of seconds")
+        if max_batch_size <= 0:
+            raise ValueError(f"Invalid max_batch_size: {max_batch_size}. Must be a positive integer")
+        self._chain_id_response: Optional[RPCResponse] = None
+        super().__init__(endpoint_uri, request_kwargs)
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.batched_methods = frozenset(batched_methods)
+        self._pending: List[Tuple[Dict[str, Any], "asyncio.Future[RPCResponse]"]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set["asyncio.Task[None]"] = set()
+        self._session: Optional[ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def endpoint_uri(self) -> URI:
+        return self._endpoint_uri
+
+    @endpoint_uri.setter
+    def endpoint_uri(self, endpoint_uri: URI) -> None:
+        self._endpoint_uri = endpoint_uri
+        self.clear_chain_id()
+
+    def clear_chain_id(self) -> None:
+        """
+        Clear the cached chain id, to fetch it again on the next eth_chainId request
+        """
+        self._chain_id_response = None
+
+    @property
+    def session(self) -> ClientSession:
+        """
+        The session used to send the batches, created on first use in the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = ClientSession()
+            self._session_loop = loop
+        return self._session
+
+    async def disconnect(self) -> None:
+        """
+        Close the session used to send the batches
+        """
+        if self._session is not None:
+            if self._session_loop is asyncio.get_running_loop():
+                await self._session.close()
+            self._session = None
+            self._session_loop = None
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        if method == "eth_chainId":
+            if self._chain_id_response is None:
+                response = await super().make_request(method, params)
+                if "result" not in response:
+                    return response
+                self._chain_id_response = response
+            return self._chain_id_response
+        if method not in self.batched_methods:
+            return await super().make_request(method, params)
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[RPCResponse]" = loop.create_future()
+        request = {"jsonrpc": "2.0", "method": method, "params": params or [], "id": next(self.request_counter)}
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._send_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_batch(self, batch: List[Tuple[Dict[str, Any], "asyncio.Future[RPCResponse]"]]) -> None:
+        self.logger.debug(f"Making batch request HTTP. URI: {self.endpoint_uri}, Size: {len(batch)}")
+        try:
+            request_data = json.dumps([request for request, _ in batch], default=_json_default).encode()
+            request_kwargs = dict(self.get_request_kwargs())
+            async with self.session.post(self.endpoint_uri, data=request_data, **request_kwargs) as http_response:
+                http_response.raise_for_status()
+                responses = json.loads(await http_response.read())
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if isinstance(responses, dict):
+            # The whole batch has been rejected (ex: batches not supported): each caller gets the error
+            responses_by_id: Dict[Any, RPCResponse] = {
+                request["id"]: cast(RPCResponse, {**responses, "id": request["id"]}) for request, _ in batch
+            }
+        else:
+            responses_by_id = {response.get("id"): response for response in responses}
+        for request, future in batch:
+            if future.done():
+                continue
+            response = responses_by_id.get(request["id"])
+            if response is None:
+                future.set_exception(ValueError(f"No response for the request {request['id']} in the batch"))
+            else:
+                future.set_result(response)
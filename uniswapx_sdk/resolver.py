@@ -1,61 +1,323 @@
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Executor
+import time
 from typing import (
     Any,
+    cast,
+    Dict,
+    List,
+    NamedTuple,
     Optional,
+    Sequence,
     Tuple,
+    Type,
+    TYPE_CHECKING,
     Union,
 )
 
-from web3 import (
-    AsyncHTTPProvider,
-    AsyncWeb3,
+from eth_abi import (
+    decode,
+    encode,
 )
-from web3.exceptions import (
-    ContractCustomError,
-    ContractLogicError,
-)
-from web3.types import (
-    BlockIdentifier,
+from eth_typing import (
+    BlockNumber,
     ChecksumAddress,
-    HexBytes,
     HexStr,
 )
+from eth_utils import (
+    function_signature_to_4byte_selector,
+    to_bytes,
+)
+from hexbytes import HexBytes
 
+from uniswapx_sdk.address import to_checksum_address
 from uniswapx_sdk.constants import (
+    get_parsed_abi,
+    multicall3_abi,
+    multicall3_address,
     order_quoter_abi,
     order_quoters,
+    resolved_order_abi,
 )
 from uniswapx_sdk.exceptions import (
+    InvalidSignatureError,
+    NonceUsedError,
     order_validation_exceptions,
     OrderValidationError,
 )
+from uniswapx_sdk.instrumentation import (
+    ERROR_MAPPING,
+    instrumented,
+    QUOTER_RPC,
+    timer,
+)
+from uniswapx_sdk.nonces import NonceBitmapIndex
+from uniswapx_sdk.order_hash import compute_order_hash
+from uniswapx_sdk.signer import (
+    async_verify_signatures_many,
+    verify_signatures,
+)
+
+
+if TYPE_CHECKING:
+    # web3 is slow to import: it is imported on first use, if not already imported by the caller to build an AsyncWeb3
+    from web3 import AsyncWeb3
+    from web3.exceptions import ContractLogicError
+    from web3.types import BlockIdentifier
+
+
+ResolveResult = Union[Tuple[Any, ...], OrderValidationError, "ContractLogicError"]
+
+_quote_function_selector = function_signature_to_4byte_selector("quote(bytes,bytes)")
+_error_string_selector = bytes.fromhex("08c379a0")
+_panic_selector = bytes.fromhex("4e487b71")
+
+
+def _normalize_resolved_order(resolved_order: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """
+    Format an ABI decoded ResolvedOrder as web3 does when calling the quoter: checksum addresses and lists for arrays.
+    """
+    info, dutch_input, outputs, sig, order_hash = resolved_order
+    reactor, swapper, nonce, deadline, validation_contract, validation_data = info
+    return (
+        (
+            to_checksum_address(reactor),
+            to_checksum_address(swapper),
+            nonce,
+            deadline,
+            to_checksum_address(validation_contract),
+            validation_data,
+        ),
+        (to_checksum_address(dutch_input[0]), dutch_input[1], dutch_input[2]),
+        [(to_checksum_address(token), amount, to_checksum_address(recipient)) for token, amount, recipient in outputs],
+        sig,
+        order_hash,
+    )
+
+
+def _encode_quote(encoded_order: Union[HexStr, HexBytes], signature: Union[HexStr, HexBytes]) -> bytes:
+    order = to_bytes(hexstr=encoded_order) if isinstance(encoded_order, str) else encoded_order
+    sig = to_bytes(hexstr=signature) if isinstance(signature, str) else signature
+    return _quote_function_selector + encode(("bytes", "bytes"), (order, sig))
+
+
+@instrumented(ERROR_MAPPING)
+def _revert_to_exception(revert_data: bytes) -> Union[OrderValidationError, "ContractLogicError"]:
+    """
+    Map the revert data of a quote, as returned by Multicall3, to the exception OrderResolver.resolve() would raise.
+    """
+    from web3.exceptions import ContractLogicError
+    data = "0x" + revert_data.hex()
+    selector = revert_data[:4]
+    if len(revert_data) < 4 or selector == _panic_selector:
+        return ContractLogicError("execution reverted", data=data)
+    elif selector == _error_string_selector:
+        try:
+            message = f"execution reverted: {decode(['string'], revert_data[4:])[0]}"
+        except Exception:
+            return ContractLogicError("execution reverted", data=data)
+        if "TRANSFER_FROM_FAILED" in message:
+            insufficient_funds_error: OrderValidationError = order_validation_exceptions["TRANSFER_FROM_FAILED"](
+                message=message, data=data
+            )
+            return insufficient_funds_error
+        return ContractLogicError(message, data=data)
+    else:
+        ExceptionClass = order_validation_exceptions.get(
+            data, order_validation_exceptions.get(data[:10], OrderValidationError)
+        )
+        order_validation_error: OrderValidationError = ExceptionClass(message=data, data=data)
+        return order_validation_error
+
+
+ResolveCacheKey = Tuple[bytes, bytes, int]
+
+
+class ResolveCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+    block_number: Optional[int]
+
+
+class _CachedError(NamedTuple):
+    # the error is stored rather than the exception instance, so each cache hit raises a fresh exception,
+    # instead of the same instance whose traceback would grow at each raise
+    exception_class: Type[Union[OrderValidationError, "ContractLogicError"]]
+    message: Optional[str]
+    data: Any
+
+
+_CacheEntry = Union[Tuple[Any, ...], _CachedError]
+
+
+def _to_entry(outcome: ResolveResult) -> _CacheEntry:
+    if isinstance(outcome, Exception):
+        return _CachedError(type(outcome), outcome.message, outcome.data)
+    return outcome
+
+
+def _from_entry(entry: _CacheEntry) -> ResolveResult:
+    if isinstance(entry, _CachedError):
+        return entry.exception_class(message=entry.message, data=entry.data)
+    return entry
+
+
+class ResolveCache:
+    """
+    LRU cache of the resolve outcomes (resolved orders and validation errors), keyed by order hash, signature and
+    block number. The entries of the previous blocks are dropped as soon as a new block is seen.
+    """
+    def __init__(self, max_size: int = 1024) -> None:
+        if max_size <= 0:
+            raise ValueError(f"Invalid max_size: {max_size}. Must be a positive integer")
+        self._max_size = max_size
+        self._entries: "OrderedDict[ResolveCacheKey, _CacheEntry]" = OrderedDict()
+        self._block_number: Optional[int] = None
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def block_number(self) -> Optional[int]:
+        """
+        The most recent block seen by the cache, if any
+        """
+        return self._block_number
+
+    def get(self, key: ResolveCacheKey) -> Optional[ResolveResult]:
+        """
+        :return: the cached outcome, or None. Errors are returned as new exception instances.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return _from_entry(entry)
+
+    def put(self, key: ResolveCacheKey, outcome: ResolveResult) -> None:
+        self._entries[key] = _to_entry(outcome)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def new_block(self, block_number: int) -> None:
+        """
+        Invalidate the outcomes resolved against a block older than block_number, if it is a new block.
+        Can be called from a new block header subscription, to move the cache to the new block before the next
+        resolve() call.
+        """
+        if self._block_number is not None and block_number <= self._block_number:
+            return
+        self._block_number = block_number
+        for key in [key for key in self._entries if key[2] < block_number]:
+            del self._entries[key]
+
+    def cache_info(self) -> ResolveCacheInfo:
+        return ResolveCacheInfo(self._hits, self._misses, self._max_size, len(self._entries), self._block_number)
+
+    def cache_clear(self) -> None:
+        self._entries.clear()
+        self._block_number = None
+        self._hits = self._misses = 0
+
+
+def _as_bytes(value: Union[HexStr, HexBytes, bytes]) -> bytes:
+    return to_bytes(hexstr=value) if isinstance(value, str) else bytes(value)
 
 
 class OrderResolver:
-    def __init__(self,  w3: AsyncWeb3, chain_id: int, quoter_address: ChecksumAddress) -> None:
+    def __init__(
+            self,
+            w3: "AsyncWeb3",
+            chain_id: int,
+            quoter_address: ChecksumAddress,
+            multicall_address: ChecksumAddress = multicall3_address,
+            cache_size: Optional[int] = None,
+            nonce_index: Optional[NonceBitmapIndex] = None,
+            check_signatures: bool = False,
+            block_number_ttl: float = 1.0,
+            signature_executor: Optional[Executor] = None) -> None:
+        if block_number_ttl < 0:
+            raise ValueError(f"Invalid block_number_ttl: {block_number_ttl}. Must be a positive number of seconds")
         self._w3 = w3
         self._chain_id = chain_id
-        self._quoter = self._w3.eth.contract(address=quoter_address, abi=order_quoter_abi)
+        self._quoter = self._w3.eth.contract(address=quoter_address, abi=get_parsed_abi(order_quoter_abi))
+        self._multicall = self._w3.eth.contract(address=multicall_address, abi=get_parsed_abi(multicall3_abi))
+        self.cache = ResolveCache(cache_size) if cache_size is not None else None
+        self.nonce_index = nonce_index
+        self.check_signatures = check_signatures
+        self.signature_executor = signature_executor
+        self.block_number_ttl = block_number_ttl
+        self._block_number_request: Optional["asyncio.Future[BlockNumber]"] = None
+        self._block_number_request_time = 0.0
+        self._in_flight: Dict[ResolveCacheKey, "asyncio.Future[_CacheEntry]"] = {}
 
     @classmethod
     async def create(
             cls,
-            w3: Optional[AsyncWeb3] = None,
-            rpc_endpoint: Optional[str] = None) -> "OrderResolver":
+            w3: Optional["AsyncWeb3"] = None,
+            rpc_endpoint: Optional[str] = None,
+            batch_window: Optional[float] = None,
+            max_batch_size: int = 100,
+            cache_size: Optional[int] = None,
+            nonce_index: Optional[NonceBitmapIndex] = None,
+            check_signatures: bool = False,
+            block_number_ttl: float = 1.0,
+            signature_executor: Optional[Executor] = None) -> "OrderResolver":
         """
         Create an OrderResolver instance which is used to validate and quote UniswapX signed orders.
 
         :param w3: a valid AsyncWeb3 instance (if no rpc endpoint is given)
         :param rpc_endpoint: an rpc endpoint address (if no w3 instance is given)
+        :param batch_window: optional, only used with an rpc endpoint. If given, the concurrent resolve() calls made
+        within this time window (in seconds) are sent as a single JSON-RPC batch request.
+        :param max_batch_size: the max number of calls in a JSON-RPC batch request, if batch_window is given
+        :param cache_size: optional. If given, the resolve() outcomes are cached per block, up to cache_size entries.
+        :param block_number_ttl: only used with a cache. For how long (in seconds) the 'latest' block number is reused
+        before being requested again. The cache can also be moved to a new block with cache.new_block().
+        :param nonce_index: optional. If given, the orders whose nonce is known to be used are rejected locally
+        with a NonceUsedError, without being quoted.
+        :param check_signatures: if True, the signer of each order is recovered locally and the orders not signed by
+        their swapper are rejected with an InvalidSignatureError, without being quoted.
+        Not suitable for smart contract (EIP-1271) swappers.
+        :param signature_executor: optional, only used with check_signatures. The executor on which resolve_many()
+        verifies the signatures, by chunks. If not given, a ProcessPoolExecutor is created for each resolve_many() call.
         :return: an OrderResolver instance
         """
-        _w3 = cls._get_w3(rpc_endpoint, w3)
+        _w3 = cls._get_w3(rpc_endpoint, w3, batch_window, max_batch_size)
         chain_id = await _w3.eth.chain_id
-        return cls(_w3, chain_id, order_quoters[chain_id])
+        return cls(
+            _w3,
+            chain_id,
+            order_quoters[chain_id],
+            cache_size=cache_size,
+            nonce_index=nonce_index,
+            check_signatures=check_signatures,
+            block_number_ttl=block_number_ttl,
+            signature_executor=signature_executor,
+        )
 
     @staticmethod
-    def _get_w3(rpc_endpoint: Optional[str], w3: Optional[AsyncWeb3]) -> AsyncWeb3:
+    def _get_w3(
+            rpc_endpoint: Optional[str],
+            w3: Optional["AsyncWeb3"],
+            batch_window: Optional[float] = None,
+            max_batch_size: int = 100) -> "AsyncWeb3":
+        from web3 import (
+            AsyncHTTPProvider,
+            AsyncWeb3,
+        )
+
+        from uniswapx_sdk.providers import BatchingAsyncHTTPProvider
+
         if w3:
             return w3
+        elif rpc_endpoint and batch_window is not None:
+            return AsyncWeb3(BatchingAsyncHTTPProvider(rpc_endpoint, batch_window, max_batch_size))
         elif rpc_endpoint:
             return AsyncWeb3(AsyncHTTPProvider(rpc_endpoint))
         else:
@@ -65,25 +327,197 @@ class OrderResolver:
             self,
             encoded_order: Union[HexStr, HexBytes],
             signature: Union[HexStr, HexBytes],
-            block_identifier: BlockIdentifier = "latest") -> Tuple[Any, ...]:
+            block_identifier: "BlockIdentifier" = "latest") -> Tuple[Any, ...]:
         """
         Return the resolved order or raise an OrderValidationError
+        If the resolver has a cache, 'latest' is pinned to the current block number (requested at most once per
+        block_number_ttl, or set with cache.new_block()) and the outcome (resolved order or validation error) is cached
+        for this block. The concurrent calls resolving the same order share a single quote.
         :param encoded_order: the first parameter of a signed order sent to a reactor's execution function
         :param signature: the second parameter of a signed order sent to a reactor's execution function
         :param block_identifier: Optional block number or string identifier. Default to 'latest'.
         :return: the resolved order
         """
+        self._pre_check(encoded_order, signature)
+        if self.cache is None or not (block_identifier == "latest" or isinstance(block_identifier, int)):
+            return await self._resolve(encoded_order, signature, block_identifier)
+
+        if block_identifier == "latest":
+            self.cache.new_block(await self._latest_block_number())
+            block_number = cast(int, self.cache.block_number)
+        else:
+            block_number = int(block_identifier)
+            self.cache.new_block(block_number)
         try:
-            resolved_order: Tuple[Any, ...] = (
-                await self._quoter.functions.quote(encoded_order, signature).call(block_identifier=block_identifier)
-            )
+            key = (bytes(compute_order_hash(encoded_order)), _as_bytes(signature), block_number)
+        except Exception:
+            # not a decodable order: let the quoter tell why
+            return await self._resolve(encoded_order, signature, block_number)
+
+        outcome = self.cache.get(key)
+        in_flight = self._in_flight.get(key) if outcome is None else None
+        if in_flight is not None:
+            try:
+                outcome = _from_entry(await asyncio.shield(in_flight))
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # the call quoting this order has been cancelled: quote it here
+        if outcome is None:
+            outcome = await self._resolve_and_cache(key, encoded_order, signature)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def _latest_block_number(self) -> int:
+        """
+        The current block number, requested at most once per block_number_ttl, and once for concurrent calls
+        """
+        request = self._block_number_request
+        if (
+                request is None
+                or request.done() and (
+                    request.cancelled()
+                    or request.exception() is not None
+                    or time.monotonic() - self._block_number_request_time >= self.block_number_ttl
+                )
+        ):
+            request = self._block_number_request = asyncio.ensure_future(self._w3.eth.block_number)
+            self._block_number_request_time = time.monotonic()
+        return await asyncio.shield(request)
+
+    async def _resolve_and_cache(
+            self,
+            key: ResolveCacheKey,
+            encoded_order: Union[HexStr, HexBytes],
+            signature: Union[HexStr, HexBytes]) -> ResolveResult:
+        from web3.exceptions import (
+            ContractLogicError,
+            OffchainLookup,
+        )
+        in_flight: "asyncio.Future[_CacheEntry]" = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = in_flight
+        try:
+            try:
+                outcome: ResolveResult = await self._resolve(encoded_order, signature, key[2])
+            except OffchainLookup:
+                raise
+            except (OrderValidationError, ContractLogicError) as e:
+                outcome = e
+        except asyncio.CancelledError:
+            in_flight.cancel()
+            raise
+        except BaseException as e:
+            # not an order outcome (ex: transport error): the concurrent calls get it too, and it is not cached
+            in_flight.set_exception(e)
+            in_flight.exception()  # retrieved, even without concurrent calls
+            raise
+        finally:
+            del self._in_flight[key]
+        cast(ResolveCache, self.cache).put(key, outcome)
+        in_flight.set_result(_to_entry(outcome))
+        return outcome
+
+    def _pre_check(self, encoded_order: Union[HexStr, HexBytes], signature: Union[HexStr, HexBytes]) -> None:
+        """
+        Reject locally the orders known to be invalid, with the error the quoter would raise.
+        """
+        try:
+            if self.nonce_index is not None:
+                self.nonce_index.check(encoded_order)
+            if self.check_signatures:
+                error = verify_signatures(self._chain_id, [(encoded_order, signature)])[0]
+                if error is not None and error.data is not None:
+                    raise error
+        except (NonceUsedError, InvalidSignatureError):
+            raise
+        except Exception:
+            # not a decodable order: let the quoter tell why
+            pass
+
+    async def _resolve(
+            self,
+            encoded_order: Union[HexStr, HexBytes],
+            signature: Union[HexStr, HexBytes],
+            block_identifier: "BlockIdentifier") -> Tuple[Any, ...]:
+        from web3.exceptions import (
+            ContractCustomError,
+            ContractLogicError,
+        )
+        try:
+            with timer(QUOTER_RPC):
+                resolved_order: Tuple[Any, ...] = (
+                    await self._quoter.functions.quote(encoded_order, signature).call(block_identifier=block_identifier)
+                )
             return resolved_order
         except ContractCustomError as e:
-            ExceptionClass = order_validation_exceptions.get(e.message, OrderValidationError)
-            raise ExceptionClass(message=e.message, data=e.data)
+            with timer(ERROR_MAPPING):
+                ExceptionClass = order_validation_exceptions.get(e.message, OrderValidationError)
+                error = ExceptionClass(message=e.message, data=e.data)
+            raise error
         except ContractLogicError as e:
             if e.message and "TRANSFER_FROM_FAILED" in e.message:
-                ExceptionClass = order_validation_exceptions.get("TRANSFER_FROM_FAILED", OrderValidationError)
-                raise ExceptionClass(message=e.message, data=e.data)
+                with timer(ERROR_MAPPING):
+                    ExceptionClass = order_validation_exceptions.get("TRANSFER_FROM_FAILED", OrderValidationError)
+                    error = ExceptionClass(message=e.message, data=e.data)
+                raise error
             else:
                 raise
+
+    async def resolve_many(
+            self,
+            orders: Sequence[Tuple[Union[HexStr, HexBytes], Union[HexStr, HexBytes]]],
+            block_identifier: "BlockIdentifier" = "latest",
+            batch_size: int = 100) -> List[ResolveResult]:
+        """
+        Resolve many orders with a few Multicall3 tryAggregate() calls to the quoter, instead of one call per order.
+        Each order is resolved independently: a revert is mapped to the exception resolve() would raise,
+        but this exception is returned in place of the resolved order instead of being raised.
+        The orders rejected by the nonce index or by the signature check, if any, are not quoted. The signatures
+        are all verified on signature_executor before the quotes, without blocking the event loop.
+        :param orders: the (encoded_order, signature) of each order
+        :param block_identifier: Optional block number or string identifier. Default to 'latest'.
+        If several batches are needed, 'latest' is pinned to the current block number, so all orders are resolved
+        against the same block.
+        :param batch_size: the max number of orders resolved per RPC call
+        :return: the resolved order or the OrderValidationError (or ContractLogicError) of each order, in input order
+        """
+        if batch_size <= 0:
+            raise ValueError(f"Invalid batch_size: {batch_size}. Must be a positive integer")
+        results: List[Optional[ResolveResult]] = [None] * len(orders)
+        if self.nonce_index is not None:
+            for i, (encoded_order, _) in enumerate(orders):
+                try:
+                    self.nonce_index.check(encoded_order)
+                except NonceUsedError as e:
+                    results[i] = e
+                except Exception:
+                    # not a decodable order: let the quoter tell why
+                    pass
+        to_verify = [i for i, result in enumerate(results) if result is None]
+        if self.check_signatures and to_verify:
+            errors = await async_verify_signatures_many(
+                self._chain_id, [orders[i] for i in to_verify], executor=self.signature_executor
+            )
+            for i, error in zip(to_verify, errors):
+                # no error data: not a decodable order, let the quoter tell why
+                if error is not None and error.data is not None:
+                    results[i] = error
+        to_quote = [i for i, result in enumerate(results) if result is None]
+
+        if len(to_quote) > batch_size and block_identifier == "latest":
+            block_identifier = await self._w3.eth.block_number
+
+        for i in range(0, len(to_quote), batch_size):
+            indexes = to_quote[i:i + batch_size]
+            calls = [(self._quoter.address, _encode_quote(*orders[index])) for index in indexes]
+            with timer(QUOTER_RPC):
+                call_results = await self._multicall.functions.tryAggregate(False, calls).call(
+                    block_identifier=block_identifier
+                )
+            for index, (success, return_data) in zip(indexes, call_results):
+                if success:
+                    results[index] = _normalize_resolved_order(decode(resolved_order_abi, return_data)[0])
+                else:
+                    results[index] = _revert_to_exception(return_data)
+        return cast(List[ResolveResult], results)
@@ -0,0 +1,276 @@
+import asyncio
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+)
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from eth_keys import keys
+from eth_typing import (
+    ChecksumAddress,
+    HexStr,
+)
+from eth_utils import (
+    keccak,
+    to_bytes,
+)
+
+from uniswapx_sdk.address import to_checksum_address
+from uniswapx_sdk.decoder import (
+    EncodedOrder,
+    ExclusiveDutchOrderDecoder,
+)
+from uniswapx_sdk.eip712 import create_exclusive_dutch_order_signable_message
+from uniswapx_sdk.encoder import (
+    ExclusiveDutchOrder,
+    ExclusiveDutchOrderEncoder,
+)
+from uniswapx_sdk.exceptions import InvalidSignatureError
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+SignedEncodedOrder = Tuple[EncodedOrder, Union[HexStr, bytes]]
+# (message, data) of an InvalidSignatureError, the data being None for an undecodable order
+_SignatureError = Tuple[str, Optional[HexStr]]
+
+_invalid_signature_error = HexStr("0x8baa579f")  # Permit2 InvalidSignature()
+_invalid_signer_error = HexStr("0x815e1d64")  # Permit2 InvalidSigner()
+_invalid_signature_length_error = HexStr("0x4be6321b")  # Permit2 InvalidSignatureLength()
+_s_mask = (1 << 255) - 1
+_decoder = ExclusiveDutchOrderDecoder()
+
+
+class SignedOrder(NamedTuple):
+    encoded_order: bytes
+    signature: bytes
+    execute_calldata: HexStr
+
+
+def _chunk(orders: Iterable[T], chunk_size: int) -> List[List[T]]:
+    if chunk_size <= 0:
+        raise ValueError(f"Invalid chunk_size: {chunk_size}. Must be a positive integer")
+    orders = list(orders)
+    return [orders[i:i + chunk_size] for i in range(0, len(orders), chunk_size)]
+
+
+def encode_and_sign(
+        chain_id: int,
+        orders: Sequence[ExclusiveDutchOrder],
+        private_key: Union[HexStr, bytes]) -> List[SignedOrder]:
+    """
+    Encode and sign the orders in the current process.
+    :param chain_id: the chain id
+    :param orders: the orders to encode and sign, as ExclusiveDutchOrder instances
+    :param private_key: the swapper private key
+    :return: the encoded orders, their signatures and the corresponding reactor execute() calldata, in input order
+    """
+    from eth_account import Account
+    encoder = ExclusiveDutchOrderEncoder(chain_id)
+    account = Account.from_key(private_key)
+    signed_orders = []
+    for order in orders:
+        encoded_order, signable_message = encoder.encode_compact_order(order)
+        signature = bytes(account.sign_message(signable_message).signature)
+        signed_orders.append(SignedOrder(encoded_order, signature, encoder.encode_execute(encoded_order, signature)))
+    return signed_orders
+
+
+def encode_and_sign_many(
+        chain_id: int,
+        orders: Iterable[ExclusiveDutchOrder],
+        private_key: Union[HexStr, bytes],
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 64) -> List[SignedOrder]:
+    """
+    Encode and sign many orders, fanning the work out over a process pool by chunks.
+    :param chain_id: the chain id
+    :param orders: the orders to encode and sign, as ExclusiveDutchOrder instances
+    :param private_key: the swapper private key
+    :param executor: optional. The executor to use. If not given, a ProcessPoolExecutor is created for the call.
+    :param max_workers: optional. The number of worker processes, if no executor is given.
+    :param chunk_size: the number of orders sent at once to a worker
+    :return: the encoded orders, their signatures and the corresponding reactor execute() calldata, in input order
+    """
+    worker = partial(encode_and_sign, chain_id, private_key=private_key)
+    return _map_chunks(worker, orders, executor, max_workers, chunk_size)
+
+
+async def async_encode_and_sign_many(
+        chain_id: int,
+        orders: Iterable[ExclusiveDutchOrder],
+        private_key: Union[HexStr, bytes],
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 64) -> List[SignedOrder]:
+    """
+    Same as encode_and_sign_many(), without blocking the event loop.
+    """
+    worker = partial(encode_and_sign, chain_id, private_key=private_key)
+    return await _async_map_chunks(worker, orders, executor, max_workers, chunk_size)
+
+
+def _flatten(results: Iterable[List[T]]) -> List[T]:
+    return [item for result in results for item in result]
+
+
+def _map_chunks(
+        fn: Callable[[List[T]], List[R]],
+        items: Iterable[T],
+        executor: Optional[Executor],
+        max_workers: Optional[int],
+        chunk_size: int) -> List[R]:
+    """
+    Apply fn to the items by chunks on the executor, or on a process pool created for the call.
+    :return: the flattened results, in input order
+    """
+    chunks = _chunk(items, chunk_size)
+    if executor:
+        return _flatten(executor.map(fn, chunks))
+    with ProcessPoolExecutor(max_workers=max_workers) as process_pool:
+        return _flatten(process_pool.map(fn, chunks))
+
+
+async def _async_map_chunks(
+        fn: Callable[[List[T]], List[R]],
+        items: Iterable[T],
+        executor: Optional[Executor],
+        max_workers: Optional[int],
+        chunk_size: int) -> List[R]:
+    """
+    Same as _map_chunks(), without blocking the event loop. If cancelled (or on error), the chunks not started yet
+    are cancelled.
+    """
+    chunks = _chunk(items, chunk_size)
+    pool = executor or ProcessPoolExecutor(max_workers=max_workers)
+    futures = [pool.submit(fn, chunk) for chunk in chunks]
+    try:
+        results = await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    finally:
+        if not executor:
+            pool.shutdown(wait=False)
+    return _flatten(results)
+
+
+def _split_signature(signature: bytes) -> Tuple[int, int, int]:
+    """
+    Split a signature into (v, r, s) as Permit2 does: 65 bytes (r, s, v) or 64 bytes EIP-2098 compact (r, vs)
+    """
+    if len(signature) == 65:
+        return signature[64], int.from_bytes(signature[:32], "big"), int.from_bytes(signature[32:64], "big")
+    elif len(signature) == 64:
+        vs = int.from_bytes(signature[32:], "big")
+        return (vs >> 255) + 27, int.from_bytes(signature[:32], "big"), vs & _s_mask
+    raise InvalidSignatureError(message=_invalid_signature_length_error, data=_invalid_signature_length_error)
+
+
+def _recover_signer(chain_id: int, order: Sequence[Any], signature: Union[HexStr, bytes]) -> ChecksumAddress:
+    v, r, s = _split_signature(to_bytes(hexstr=signature) if isinstance(signature, str) else bytes(signature))
+    signable_message = create_exclusive_dutch_order_signable_message(chain_id, order)
+    digest = keccak(b"\x19" + signable_message.version + signable_message.header + signable_message.body)
+    try:
+        if v not in (27, 28):
+            raise ValueError(f"Invalid v: {v}")
+        public_key = keys.Signature(vrs=(v - 27, r, s)).recover_public_key_from_msg_hash(digest)
+    except Exception:
+        raise InvalidSignatureError(message=_invalid_signature_error, data=_invalid_signature_error)
+    return to_checksum_address(public_key.to_canonical_address())
+
+
+def recover_swapper(chain_id: int, encoded_order: EncodedOrder, signature: Union[HexStr, bytes]) -> ChecksumAddress:
+    """
+    Recover locally the signer of an order from its Permit2 EIP-712 digest, as Permit2 does with ecrecover.
+    :param chain_id: the chain id
+    :param encoded_order: A UniswapX encoded ExclusiveDutchOrder
+    :param signature: the order signature
+    :return: the signer address
+    :raise InvalidSignatureError: if no signer can be recovered from the signature
+    """
+    return _recover_signer(chain_id, _decoder.decode(encoded_order)[0], signature)
+
+
+def _signature_errors(chain_id: int, orders: Sequence[SignedEncodedOrder]) -> List[Optional[_SignatureError]]:
+    # returns the errors rather than the exceptions, which can't be pickled back from the worker processes
+    errors: List[Optional[_SignatureError]] = []
+    for encoded_order, signature in orders:
+        try:
+            order = _decoder.decode(encoded_order)[0]
+        except Exception as e:
+            errors.append((f"Undecodable order: {e!r}", None))
+            continue
+        try:
+            signer = _recover_signer(chain_id, order, signature)
+        except InvalidSignatureError as e:
+            errors.append((cast(str, e.message), cast(HexStr, e.data)))
+            continue
+        swapper = order[0][1]  # info.swapper
+        errors.append(None if signer.lower() == swapper.lower() else (_invalid_signer_error, _invalid_signer_error))
+    return errors
+
+
+def _to_exceptions(errors: Iterable[Optional[_SignatureError]]) -> List[Optional[InvalidSignatureError]]:
+    return [InvalidSignatureError(message=error[0], data=error[1]) if error else None for error in errors]
+
+
+def verify_signatures(
+        chain_id: int,
+        orders: Sequence[SignedEncodedOrder]) -> List[Optional[InvalidSignatureError]]:
+    """
+    Check locally, in the current process, that each order is signed by its swapper.
+    Orders from smart contract wallets (EIP-1271) can't be checked locally and would be reported as invalid.
+    An order which can't be decoded is reported as invalid too, with no error data.
+    :param chain_id: the chain id
+    :param orders: the (encoded_order, signature) of each order
+    :return: for each order, the InvalidSignatureError Permit2 would raise, or None if the signature is valid
+    """
+    return _to_exceptions(_signature_errors(chain_id, orders))
+
+
+def verify_signatures_many(
+        chain_id: int,
+        orders: Iterable[SignedEncodedOrder],
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 64) -> List[Optional[InvalidSignatureError]]:
+    """
+    Same as verify_signatures(), fanning the signer recoveries out over a process pool by chunks.
+    :param chain_id: the chain id
+    :param orders: the (encoded_order, signature) of each order
+    :param executor: optional. The executor to use. If not given, a ProcessPoolExecutor is created for the call.
+    :param max_workers: optional. The number of worker processes, if no executor is given.
+    :param chunk_size: the number of orders sent at once to a worker
+    :return: for each order, the InvalidSignatureError Permit2 would raise, or None if the signature is valid
+    """
+    worker = partial(_signature_errors, chain_id)
+    return _to_exceptions(_map_chunks(worker, orders, executor, max_workers, chunk_size))
+
+
+async def async_verify_signatures_many(
+        chain_id: int,
+        orders: Iterable[SignedEncodedOrder],
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 64) -> List[Optional[InvalidSignatureError]]:
+    """
+    Same as verify_signatures_many(), without blocking the event loop.
+    """
+    worker = partial(_signature_errors, chain_id)
+    return _to_exceptions(await _async_map_chunks(worker, orders, executor, max_workers, chunk_size))
@@ -0,0 +1,236 @@
+import json
+import sqlite3
+from types import TracebackType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from eth_abi import (
+    decode,
+    encode,
+)
+from eth_typing import HexStr
+from eth_utils import to_bytes
+
+from uniswapx_sdk.constants import resolved_order_abi
+from uniswapx_sdk.models import (
+    APIOrder,
+    json_loads,
+)
+from uniswapx_sdk.resolver import (
+    _normalize_resolved_order,
+    ResolveResult,
+)
+
+
+_schema = """
+CREATE TABLE IF NOT EXISTS orders (
+    order_hash BLOB NOT NULL UNIQUE,
+    encoded_order BLOB NOT NULL,
+    signature BLOB NOT NULL,
+    metadata TEXT
+);
+CREATE TABLE IF NOT EXISTS outcomes (
+    order_hash BLOB NOT NULL,
+    block_number INTEGER NOT NULL,
+    resolved_order BLOB,
+    error_type TEXT,
+    error_data TEXT,
+    PRIMARY KEY (order_hash, block_number)
+) WITHOUT ROWID;
+"""
+
+
+# (order_hash, encoded_order, signature, metadata)
+OrderRow = Tuple[Union[str, bytes], Union[str, bytes], Union[str, bytes], Optional[Dict[str, Any]]]
+
+
+def _as_bytes(value: Union[str, bytes]) -> bytes:
+    return to_bytes(hexstr=HexStr(value)) if isinstance(value, str) else bytes(value)
+
+
+class StoredOrder(NamedTuple):
+    order_hash: bytes
+    encoded_order: bytes
+    signature: bytes
+    metadata: Optional[Dict[str, Any]]
+
+
+class StoredOutcome(NamedTuple):
+    block_number: int
+    resolved_order: Optional[Tuple[Any, ...]]  # as returned by OrderResolver.resolve(), None on error
+    error_type: Optional[str]  # the exception class name, None if resolved
+    error_data: Optional[str]  # the exception data (the revert custom error or reason)
+
+
+class OrderStore:
+    """
+    Durable store of encoded orders, their signatures, API metadata and resolve outcomes, in a SQLite database
+    in WAL mode: the writes are appended to the log and don't block the readers. The orders are unique by hash
+    and kept in insertion order, even when updated, and the outcomes are keyed by (order hash, block number).
+    The database is memory-mapped, so a cold start can replay the stored orders without re-fetching nor re-decoding
+    them from the API.
+    """
+    def __init__(self, path: str, mmap_size: int = 1 << 30) -> None:
+        """
+        :param path: the database file path (or ':memory:')
+        :param mmap_size: the max number of bytes of the database file which are memory-mapped
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self._connection.executescript(_schema)
+
+    def __enter__(self) -> "OrderStore":
+        return self
+
+    def __exit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc_val: Optional[BaseException],
+            exc_tb: Optional[TracebackType]) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        count: int = self._connection.execute("SELECT COUNT(*) FROM orders").fetchone()[0]
+        return count
+
+    def __contains__(self, order_hash: Union[str, bytes]) -> bool:
+        row = self._connection.execute("SELECT 1 FROM orders WHERE order_hash = ?", (_as_bytes(order_hash), ))
+        return row.fetchone() is not None
+
+    def put_orders(self, orders: Iterable[OrderRow]) -> None:
+        """
+        Store orders, in a single transaction. An order already stored is updated in place, keeping its position
+        in the replay order.
+        :param orders: the (order_hash, encoded_order, signature, metadata) of each order, the metadata being
+        JSON serializable or None
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO orders VALUES (?, ?, ?, ?) ON CONFLICT(order_hash) DO UPDATE SET "
+                "encoded_order = excluded.encoded_order, signature = excluded.signature, metadata = excluded.metadata",
+                (
+                    (
+                        _as_bytes(order_hash),
+                        _as_bytes(encoded_order),
+                        _as_bytes(signature),
+                        json.dumps(metadata) if metadata is not None else None,
+                    )
+                    for order_hash, encoded_order, signature, metadata in orders
+                ),
+            )
+
+    def put_order(
+            self,
+            order_hash: Union[str, bytes],
+            encoded_order: Union[str, bytes],
+            signature: Union[str, bytes],
+            metadata: Optional[Dict[str, Any]] = None) -> None:
+        self.put_orders([(order_hash, encoded_order, signature, metadata)])
+
+    def put_api_orders(self, orders: Iterable[APIOrder]) -> None:
+        """
+        Store orders as returned by UniswapXAPI.get_orders_page(), with their API metadata: all the API fields
+        but the order hash, the encoded order and the signature, including the unmapped ones kept in APIOrder.extra.
+        """
+        self.put_orders(
+            (
+                order.order_hash,
+                order.encoded_order,
+                order.signature,
+                {
+                    **order.extra,
+                    "orderStatus": order.order_status,
+                    "chainId": order.chain_id,
+                    "createdAt": order.created_at,
+                    "type": order.order_type,
+                    "txHash": order.tx_hash,
+                },
+            )
+            for order in orders
+        )
+
+    @staticmethod
+    def _to_stored_order(row: Tuple[bytes, bytes, bytes, Optional[str]]) -> StoredOrder:
+        return StoredOrder(row[0], row[1], row[2], json_loads(row[3]) if row[3] is not None else None)
+
+    def get_order(self, order_hash: Union[str, bytes]) -> Optional[StoredOrder]:
+        row = self._connection.execute(
+            "SELECT * FROM orders WHERE order_hash = ?", (_as_bytes(order_hash), )
+        ).fetchone()
+        return self._to_stored_order(row) if row is not None else None
+
+    def delete_orders(self, order_hashes: Iterable[Union[str, bytes]]) -> None:
+        """
+        Delete orders along with their outcomes.
+        """
+        keys = [(_as_bytes(order_hash), ) for order_hash in order_hashes]
+        with self._connection:
+            self._connection.executemany("DELETE FROM orders WHERE order_hash = ?", keys)
+            self._connection.executemany("DELETE FROM outcomes WHERE order_hash = ?", keys)
+
+    def iter_orders(self, batch_size: int = 10_000) -> Iterator[StoredOrder]:
+        """
+        Replay all the stored orders, by batches of rows, in insertion order.
+        """
+        cursor = self._connection.execute("SELECT * FROM orders ORDER BY rowid")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield self._to_stored_order(row)
+
+    def put_outcome(self, order_hash: Union[str, bytes], block_number: int, outcome: ResolveResult) -> None:
+        """
+        Store the outcome of OrderResolver.resolve() (or resolve_many()) for an order at a block.
+        :param order_hash: the order hash
+        :param block_number: the block number at which the order was resolved
+        :param outcome: the resolved order, or the raised OrderValidationError or ContractLogicError
+        """
+        if isinstance(outcome, Exception):
+            data = getattr(outcome, "data", None)
+            row: Tuple[Any, ...] = (
+                _as_bytes(order_hash),
+                block_number,
+                None,
+                type(outcome).__name__,
+                data if data is None or isinstance(data, str) else json.dumps(data),
+            )
+        else:
+            row = (_as_bytes(order_hash), block_number, encode(resolved_order_abi, [outcome]), None, None)
+        with self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO outcomes VALUES (?, ?, ?, ?, ?)", row)
+
+    def get_outcome(self, order_hash: Union[str, bytes], block_number: Optional[int] = None) -> Optional[StoredOutcome]:
+        """
+        :param order_hash: the order hash
+        :param block_number: optional. The block number. Default to the latest one with an outcome.
+        :return: the stored outcome, or None if there is none
+        """
+        if block_number is None:
+            query = "SELECT * FROM outcomes WHERE order_hash = ? ORDER BY block_number DESC LIMIT 1"
+            row = self._connection.execute(query, (_as_bytes(order_hash), )).fetchone()
+        else:
+            query = "SELECT * FROM outcomes WHERE order_hash = ? AND block_number = ?"
+            row = self._connection.execute(query, (_as_bytes(order_hash), block_number)).fetchone()
+        if row is None:
+            return None
+        _, stored_block_number, resolved_order, error_type, error_data = row
+        if resolved_order is not None:
+            resolved_order = _normalize_resolved_order(decode(resolved_order_abi, resolved_order)[0])
+        return StoredOutcome(stored_block_number, resolved_order, error_type, error_data)
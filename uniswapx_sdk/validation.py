@@ -0,0 +1,186 @@
+from collections import Counter
+import time
+from typing import (
+    Any,
+    cast,
+    Collection,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from eth_typing import HexStr
+
+from uniswapx_sdk.decoder import DecodedExclusiveDutchOrder
+from uniswapx_sdk.exceptions import (
+    order_validation_exceptions,
+    OrderValidationError,
+)
+
+
+DecodedOrder = Union[DecodedExclusiveDutchOrder, Tuple[Any, ...]]
+
+_ZERO_ADDRESS = "0x" + "00" * 20
+
+END_TIME_BEFORE_START_TIME = "end_time_before_start_time"
+DEADLINE_BEFORE_END_TIME = "deadline_before_end_time"
+INPUT_AND_OUTPUT_DECAY = "input_and_output_decay"
+INCORRECT_AMOUNTS = "incorrect_amounts"
+NO_EXCLUSIVE_OVERRIDE = "no_exclusive_override"
+INVALID_REACTOR = "invalid_reactor"
+DEADLINE_PASSED = "deadline_passed"
+
+# check name -> reactor custom error. The reactor runs _validateOrder() (deadline before decay end time, input and
+# output decay) before decaying the input and then the outputs with DutchDecayLib: an incorrect input amount is
+# reported before an end time before the start time, which is reported before an incorrect output amount.
+# Then come the exclusivity check, and the ResolvedOrderLib checks (reactor, deadline).
+pre_validation_errors = {
+    DEADLINE_BEFORE_END_TIME: HexStr("0x773a6187"),
+    INPUT_AND_OUTPUT_DECAY: HexStr("0xd303758b"),
+    INCORRECT_AMOUNTS: HexStr("0x7c1f8113"),
+    END_TIME_BEFORE_START_TIME: HexStr("0x43133453"),
+    NO_EXCLUSIVE_OVERRIDE: HexStr("0xb9ec1e96"),
+    INVALID_REACTOR: HexStr("0x4ddf4a64"),
+    DEADLINE_PASSED: HexStr("0x70f65caa"),
+}
+
+
+def _fields(order: DecodedOrder) -> Tuple[int, int, int, int, int, List[Tuple[int, int]], int]:
+    """
+    :return: the (deadline, decay start time, decay end time, input start amount, input end amount,
+    (start amount, end amount) of each output, exclusivity override bps) of the order, without decoding the addresses
+    """
+    if isinstance(order, DecodedExclusiveDutchOrder):
+        return (
+            order.info.deadline,
+            order.decay_start_time,
+            order.decay_end_time,
+            order.input_start_amount,
+            order.input_end_amount,
+            [(output.start_amount, output.end_amount) for output in order.outputs],
+            order.exclusivity_override_bps,
+        )
+    info, decay_start_time, decay_end_time, _, override_bps, dutch_input, outputs = order
+    return (
+        info[3],
+        decay_start_time,
+        decay_end_time,
+        dutch_input[1],
+        dutch_input[2],
+        [(output[1], output[2]) for output in outputs],
+        override_bps,
+    )
+
+
+def _exclusive_filler(order: DecodedOrder) -> str:
+    return order.exclusive_filler if isinstance(order, DecodedExclusiveDutchOrder) else cast(str, order[3])
+
+
+def _reactor(order: DecodedOrder) -> str:
+    return order.info.reactor if isinstance(order, DecodedExclusiveDutchOrder) else cast(str, order[0][0])
+
+
+class OrderPreValidator:
+    """
+    Run locally, on decoded ExclusiveDutchOrders, the checks of the reactor which only depend on the order itself
+    and on the block timestamp, so the orders which would fail can be dropped before being quoted.
+    A rejected order gets the same OrderValidationError as the one OrderResolver.resolve() would raise.
+    The number of rejected orders per check is kept in rejection_counts.
+    """
+    def __init__(
+            self,
+            checks: Optional[Collection[str]] = None,
+            reactor: Optional[str] = None,
+            filler: Optional[str] = None,
+            reject_exclusivity_override: bool = False) -> None:
+        """
+        :param checks: optional. The names of the checks to run, among pre_validation_errors keys. Default to all.
+        :param reactor: optional. The expected reactor address. If not given, the reactor is not checked.
+        :param filler: optional. The filler address. If not given, or if it is not the exclusive filler,
+        the order exclusivity applies during the exclusivity period (as when quoting).
+        :param reject_exclusivity_override: if True, the orders in an exclusivity period of another filler are
+        rejected even if they can be filled with the exclusivity override.
+        """
+        self.checks = frozenset(pre_validation_errors if checks is None else checks)
+        unknown_checks = self.checks - pre_validation_errors.keys()
+        if unknown_checks:
+            raise ValueError(f"Unknown checks: {sorted(unknown_checks)}")
+        if reactor is None:
+            self.checks -= {INVALID_REACTOR}
+        self.reactor = reactor.lower() if reactor else None
+        self.filler = filler.lower() if filler else None
+        self.reject_exclusivity_override = reject_exclusivity_override
+        self.rejection_counts: "Counter[str]" = Counter()
+
+    def _failed_check(self, order: DecodedOrder, timestamp: int) -> Optional[str]:
+        deadline, start_time, end_time, input_start, input_end, output_amounts, override_bps = _fields(order)
+        checks = self.checks
+        if DEADLINE_BEFORE_END_TIME in checks and deadline < end_time:
+            return DEADLINE_BEFORE_END_TIME
+        if (
+                INPUT_AND_OUTPUT_DECAY in checks
+                and input_start != input_end
+                and any(start != end for start, end in output_amounts)):
+            return INPUT_AND_OUTPUT_DECAY
+        # the input amount can only increase and the output amounts can only decrease
+        if INCORRECT_AMOUNTS in checks and input_start > input_end:
+            return INCORRECT_AMOUNTS
+        if END_TIME_BEFORE_START_TIME in checks and end_time < start_time:
+            return END_TIME_BEFORE_START_TIME
+        if INCORRECT_AMOUNTS in checks and any(start < end for start, end in output_amounts):
+            return INCORRECT_AMOUNTS
+        if (
+                NO_EXCLUSIVE_OVERRIDE in checks
+                and timestamp <= start_time
+                and (override_bps == 0 or self.reject_exclusivity_override)
+                and _exclusive_filler(order).lower() not in (_ZERO_ADDRESS, self.filler)):
+            return NO_EXCLUSIVE_OVERRIDE
+        if INVALID_REACTOR in checks and _reactor(order).lower() != self.reactor:
+            return INVALID_REACTOR
+        if DEADLINE_PASSED in checks and deadline < timestamp:
+            return DEADLINE_PASSED
+        return None
+
+    def validate(self, order: DecodedOrder, timestamp: Optional[int] = None) -> Optional[OrderValidationError]:
+        """
+        :param order: a decoded order, as returned by ExclusiveDutchOrderDecoder.decode()[0] or decode_lazy()
+        :param timestamp: optional. The block timestamp at which the order would be filled. Default to now.
+        :return: the OrderValidationError the resolver would raise, or None if the order is plausible
+        """
+        return self.validate_many([order], timestamp)[0]
+
+    def validate_many(
+            self,
+            orders: Sequence[DecodedOrder],
+            timestamp: Optional[int] = None) -> List[Optional[OrderValidationError]]:
+        """
+        :param orders: decoded orders, as returned by ExclusiveDutchOrderDecoder.decode()[0] or decode_lazy()
+        :param timestamp: optional. The block timestamp at which the orders would be filled. Default to now.
+        :return: for each order, the OrderValidationError the resolver would raise, or None if it is plausible
+        """
+        if timestamp is None:
+            timestamp = int(time.time())
+        results: List[Optional[OrderValidationError]] = []
+        for order in orders:
+            failed_check = self._failed_check(order, timestamp)
+            if failed_check is None:
+                results.append(None)
+            else:
+                self.rejection_counts[failed_check] += 1
+                data = pre_validation_errors[failed_check]
+                error: OrderValidationError = order_validation_exceptions[data](message=data, data=data)
+                results.append(error)
+        return results
+
+    def filter_plausible(self, orders: Sequence[DecodedOrder], timestamp: Optional[int] = None) -> List[int]:
+        """
+        :param orders: decoded orders, as returned by ExclusiveDutchOrderDecoder.decode()[0] or decode_lazy()
+        :param timestamp: optional. The block timestamp at which the orders would be filled. Default to now.
+        :return: the indexes of the orders which pass all the checks
+        """
+        return [i for i, error in enumerate(self.validate_many(orders, timestamp)) if error is None]
+
+    def reset_counts(self) -> None:
+        self.rejection_counts.clear()
@@ -0,0 +1,143 @@
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from uniswapx_sdk.api import UniswapXAPI
+from uniswapx_sdk.decoder import ExclusiveDutchOrderDecoder
+
+
+ADDED = "added"
+REMOVED = "removed"
+STATUS_CHANGED = "status_changed"
+
+
+class OrderEvent(NamedTuple):
+    kind: str  # ADDED, REMOVED or STATUS_CHANGED
+    order_hash: str
+    order: Dict[str, Any]  # the order as returned by the API (the last seen one for a removed order)
+    decoded_order: Optional[Tuple[Any, ...]]  # as returned by ExclusiveDutchOrderDecoder.decode(), None if undecodable
+
+
+class _TrackedOrder(NamedTuple):
+    order: Dict[str, Any]
+    decoded_order: Optional[Tuple[Any, ...]]
+
+
+class OrderWatcher:
+    """
+    Poll UniswapX API and emit only the changes between two polls: the added orders, the removed ones
+    and the ones whose status changed. Orders are keyed by their orderHash and only the added orders are decoded,
+    so the cost of a poll, besides the request itself, scales with the churn instead of the book size.
+    The API only returns the orders in the watched status: the orders missing from a poll are looked up by hash,
+    and reported as status changed (with their new status, after which they are no longer watched) or as removed
+    if their status did not change or if they are not found.
+    """
+    def __init__(
+            self,
+            api: UniswapXAPI,
+            interval: float = 1.0,
+            order_status: str = "open",
+            limit: int = 500,
+            **kwargs: str) -> None:
+        """
+        :param api: the UniswapXAPI instance to poll
+        :param interval: the time (in seconds) between two polls
+        :param order_status: the status of the watched orders
+        :param limit: the API page size
+        :param kwargs: other possible parameters as describe here: https://api.uniswap.org/v2/uniswapx/docs
+        """
+        if interval < 0:
+            raise ValueError(f"Invalid interval: {interval}. Must be a positive number")
+        self.api = api
+        self.interval = interval
+        self.order_status = order_status
+        self.limit = limit
+        self.kwargs = kwargs
+        self._orders: Dict[str, _TrackedOrder] = {}
+        self._decoder = ExclusiveDutchOrderDecoder()
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    @property
+    def orders(self) -> Dict[str, Dict[str, Any]]:
+        """
+        The orders seen at the last poll, by order hash
+        """
+        return {order_hash: tracked.order for order_hash, tracked in self._orders.items()}
+
+    def _decode(self, order: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        try:
+            decoded_order: Tuple[Any, ...] = self._decoder.decode(order["encodedOrder"])[0]
+            return decoded_order
+        except Exception:
+            return None
+
+    def update(
+            self,
+            orders: List[Dict[str, Any]],
+            missing_orders: Iterable[Dict[str, Any]] = ()) -> List[OrderEvent]:
+        """
+        Compare the orders with the ones of the previous update.
+        :param orders: all the watched orders, as returned by the API
+        :param missing_orders: optional. The current state of previously seen orders missing from orders,
+        e.g. looked up by hash. Those whose status changed are reported as such instead of as removed.
+        :return: the added and the status changed orders, in input order, followed by the missing ones
+        """
+        latest_orders = {order["orderHash"].lower(): order for order in missing_orders}
+        events = []
+        current: Dict[str, _TrackedOrder] = {}
+        for order in orders:
+            order_hash = order["orderHash"].lower()
+            tracked = self._orders.get(order_hash)
+            if tracked is None:
+                tracked = _TrackedOrder(order, self._decode(order))
+                events.append(OrderEvent(ADDED, order_hash, order, tracked.decoded_order))
+            else:
+                if tracked.order.get("orderStatus") != order.get("orderStatus"):
+                    events.append(OrderEvent(STATUS_CHANGED, order_hash, order, tracked.decoded_order))
+                tracked = _TrackedOrder(order, tracked.decoded_order)
+            current[order_hash] = tracked
+        for order_hash, tracked in self._orders.items():
+            if order_hash not in current:
+                latest_order = latest_orders.get(order_hash)
+                if latest_order is not None and latest_order.get("orderStatus") != tracked.order.get("orderStatus"):
+                    events.append(OrderEvent(STATUS_CHANGED, order_hash, latest_order, tracked.decoded_order))
+                else:
+                    events.append(OrderEvent(REMOVED, order_hash, tracked.order, tracked.decoded_order))
+        self._orders = current
+        return events
+
+    async def poll(self) -> List[OrderEvent]:
+        """
+        Fetch all the watched orders once, and look up by hash the previously seen ones which are missing.
+        :return: the changes since the previous poll
+        """
+        orders = [
+            order async for order in self.api.iter_orders(self.order_status, self.limit, None, **self.kwargs)
+        ]
+        order_hashes = {order["orderHash"].lower() for order in orders}
+        missing_hashes = [order_hash for order_hash in self._orders if order_hash not in order_hashes]
+        missing_orders = await self.api.get_orders_by_hash(missing_hashes) if missing_hashes else []
+        return self.update(orders, missing_orders)
+
+    async def watch(self) -> AsyncIterator[OrderEvent]:
+        """
+        Poll the API every interval and yield the changes, endlessly.
+        On the first poll, all the watched orders are yielded as added.
+        :return: an async iterator over the order events
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            for event in await self.poll():
+                yield event
+            await asyncio.sleep(max(0.0, self.interval - (loop.time() - start)))